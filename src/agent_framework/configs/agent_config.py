@@ -1,6 +1,7 @@
+import copy
 from enum import Enum
 import os
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
@@ -13,6 +14,30 @@ from src.agent_framework.configs.memory_config import MemoryConfig, MemoryBacken
 from src.agent_framework.mcp.models import MCPServerConfig, MCPServerReference
 from src.agent_framework.mcp.registry import MCPServerRegistry
 
+# libyaml-backed loader when available; same output as SafeLoader, parsed in C.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML per path, tagged with the file's (mtime_ns, size) when parsed.
+_yaml_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _load_yaml(file_path: str) -> Dict[str, Any]:
+    """Parse an agent YAML file, reusing the parse while the file is unchanged.
+
+    A deep copy is returned because AgentConfig keeps references to the
+    lists in the parsed dict (tags, tools).
+    """
+    stat = os.stat(file_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _yaml_cache.get(file_path)
+    if cached is not None and cached[0] == version:
+        config = cached[1]
+    else:
+        with open(file_path, "r") as file:
+            config = yaml.load(file, Loader=_YAML_LOADER)
+        _yaml_cache[file_path] = (version, config)
+    return copy.deepcopy(config)
+
 
 class ExecutionEngine(Enum):
     """Execution engine for running agents.
@@ -181,8 +206,7 @@ class AgentConfig:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Agent config file not found: {file_path}")
         
-        with open(file_path, "r") as file:
-            config = yaml.safe_load(file)
+        config = _load_yaml(file_path)
 
         # Parse memory configuration from YAML
         memory_config = None
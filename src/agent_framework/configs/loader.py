@@ -4,13 +4,26 @@ This wraps the logic for loading `AgentConfig` from YAML, including the
 `_caller_file` and stack-based auto-detection.
 """
 
-import inspect
+import sys
 from typing import Optional
 
 from src.agent_framework.configs.agent_config import AgentConfig
 from src.agent_framework.utils.path_utils import resolve_config_path
 
 
+def _caller_file(depth: int = 2) -> Optional[str]:
+    """Return ``__file__`` of the module ``depth`` frames up, or None.
+
+    The default skips this helper and `load_agent_config` itself. Uses
+    `sys._getframe` directly (what `inspect.currentframe` wraps) and reads only
+    the frame's globals, so no frame reference is held.
+    """
+    try:
+        return sys._getframe(depth).f_globals.get("__file__")
+    except ValueError:  # pragma: no cover - stack shallower than depth
+        return None
+
+
 def load_agent_config(
     agent_config: Optional[AgentConfig] = None,
     config_path: Optional[str] = None,
@@ -37,19 +50,14 @@ def load_agent_config(
         else:
             # Fallback: attempt to infer from the call stack
             try:
-                frame = inspect.currentframe()
-                caller_frame = frame.f_back if frame else None
-                if caller_frame:
-                    caller_file_stack = caller_frame.f_globals.get("__file__")
-                    if caller_file_stack:
-                        config_path = resolve_config_path(relative_to=caller_file_stack)
-                    else:
-                        raise ValueError(
-                            "Cannot auto-detect config file. Please provide one of: "
-                            "agent_config, config_path, or _caller_file=__file__"
-                        )
-                if frame is not None:
-                    del frame
+                caller_file_stack = _caller_file()
+                if caller_file_stack:
+                    config_path = resolve_config_path(relative_to=caller_file_stack)
+                else:
+                    raise ValueError(
+                        "Cannot auto-detect config file. Please provide one of: "
+                        "agent_config, config_path, or _caller_file=__file__"
+                    )
             except Exception as e:  # pragma: no cover - defensive
                 raise ValueError(
                     f"Cannot auto-detect config file: {e}. "
@@ -1,5 +1,6 @@
 """Input/output helpers for BaseAgent."""
 
+import functools
 import json
 import logging
 from typing import Type
@@ -44,9 +45,13 @@ def create_input_from_request(input_schema: Type[BaseModel], request: AgentChatR
     return input_schema(query) if query else input_schema()
 
 
+@functools.lru_cache(maxsize=256)
 def build_schema_prompt(output_schema: Type[BaseModel]) -> str:
     """Build a system prompt addition that enforces the output schema.
 
+    Cached per model class: the prompt is rebuilt on every LangGraph turn,
+    but only depends on the (immutable) class definition.
+
     Args:
         output_schema: The Pydantic model to generate schema for.
 
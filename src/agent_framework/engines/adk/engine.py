@@ -82,7 +82,7 @@ class AdkEngine(AgentEngine):
             supports_tool_calling=True,
             supports_bidi_streaming=False,  # not implemented in this codebase yet
             supports_multimodal=False,  # not implemented in this codebase yet
-            notes="SSE streaming is supported via Runner.run() events; bidi/live is not wired yet.",
+            notes="SSE streaming is supported via Runner.run_async() events; bidi/live is not wired yet.",
         )
 
     def rebuild(self) -> None:
@@ -176,14 +176,16 @@ class AdkEngine(AgentEngine):
         input_text = input_data.model_dump_json()
         content = types.Content(role="user", parts=[types.Part(text=input_text)])
 
-        result_generator = self.runner.run(
+        # run_async keeps the event loop free; Runner.run() drives run_async on a
+        # background thread and blocks the caller while iterating.
+        result_generator = self.runner.run_async(
             user_id=user_id,
             session_id=session_id,
             new_message=content,
         )
 
         result = None
-        for response in result_generator:
+        async for response in result_generator:
             if (
                 hasattr(response, "content")
                 and response.content
@@ -214,7 +216,7 @@ class AdkEngine(AgentEngine):
         }
 
         try:
-            result_generator = self.runner.run(
+            result_generator = self.runner.run_async(
                 user_id=user_id,
                 session_id=session_id,
                 new_message=content,
@@ -228,7 +230,7 @@ class AdkEngine(AgentEngine):
             return
 
         try:
-            for event in result_generator:
+            async for event in result_generator:
                 for stream_event in self._format_stream_event(event):
                     yield stream_event
         except Exception as e:
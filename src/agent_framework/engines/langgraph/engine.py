@@ -151,6 +151,8 @@ class LangGraphEngine(AgentEngine):
         from src.agent_framework.tools.tool_manager import ToolManager
         self._tools: List[StructuredTool] = ToolManager.create_tools(agent_config, "langgraph")
         self._tools_by_name: Dict[str, StructuredTool] = {t.name: t for t in self._tools}
+        # OpenAI tool schemas, built on the first LLM call that needs them
+        self._tools_schema: Optional[List[Dict[str, Any]]] = None
 
         if self._tools:
             logger.info(
@@ -364,9 +366,15 @@ class LangGraphEngine(AgentEngine):
     # =========================================================================
 
     def _get_tools_schema(self) -> List[Dict[str, Any]]:
-        """Convert tools to OpenAI-compatible schema for LiteLLM."""
+        """Convert tools to OpenAI-compatible schema for LiteLLM.
+
+        Tools are fixed at construction, so the schema is built once and reused
+        for every turn; callers must treat it as read-only.
+        """
         if not self._tools:
             return []
+        if self._tools_schema is not None:
+            return self._tools_schema
 
         tools_schema = []
         for tool in self._tools:
@@ -393,6 +401,7 @@ class LangGraphEngine(AgentEngine):
                 }
             })
 
+        self._tools_schema = tools_schema
         return tools_schema
 
     async def _execute_tool(
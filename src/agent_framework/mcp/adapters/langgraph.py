@@ -2,16 +2,65 @@
 
 import json
 import logging
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Optional, Tuple, Type
 
-from pydantic import BaseModel, create_model, Field
+from pydantic import BaseModel, ConfigDict, create_model, Field
 
 from src.agent_framework.mcp.models import MCPServerConfig, MCPToolInfo
 
 logger = logging.getLogger(__name__)
 
+# JSON Schema "type" -> field annotation; anything else is treated as a string.
+# Values are already Optional (every generated field is) so no Union is built per field.
+_JSON_TYPE_MAP: Dict[str, Any] = {
+    "string": Optional[str],
+    "integer": Optional[int],
+    "number": Optional[float],
+    "boolean": Optional[bool],
+    "array": Optional[list],
+    "object": Optional[dict],
+}
+
+# Args-schema classes keyed by (tool name, canonical input schema JSON).
+# create_model is expensive and stateless servers convert the same tools per request.
+_schema_cache: Dict[Tuple[str, str], Type[BaseModel]] = {}
+
+
+def clear_schema_cache() -> None:
+    """Drop all cached args-schema classes."""
+    _schema_cache.clear()
+
+
+# Config for generated args schemas. It must be passed to create_model: assigning
+# model_config afterwards does not rebuild the validator. StructuredTool forwards
+# only declared fields, so undeclared ones are ignored rather than kept.
+_ARGS_CONFIG = ConfigDict(extra="ignore", defer_build=False)
+
+
+class _GenericMCPArgs(BaseModel):
+    """Archetype for tools without declared properties; undeclared fields are dropped."""
+
+    model_config = _ARGS_CONFIG
+
+
+def _generic_args_schema(tool_name: str) -> Type[BaseModel]:
+    """Named, field-less args schema (one class per tool so names stay distinct)."""
+    return type(f"{tool_name}_Args", (_GenericMCPArgs,), {"__module__": __name__})
+
 
 def _create_args_schema(tool_info: MCPToolInfo) -> Type[BaseModel]:
+    """Return the (cached) Pydantic args model for an MCP tool's input schema."""
+    key = (
+        tool_info.name,
+        json.dumps(tool_info.input_schema or {}, sort_keys=True, separators=(",", ":"), default=str),
+    )
+    model = _schema_cache.get(key)
+    if model is None:
+        model = _schema_cache.setdefault(key, _build_args_schema(tool_info))
+    return model
+
+
+def _build_args_schema(tool_info: MCPToolInfo) -> Type[BaseModel]:
     """Create a Pydantic model from MCP tool's input schema for LangChain.
 
     All fields are Optional — our wrapper's job is giving the LLM correct type
@@ -19,15 +68,11 @@ def _create_args_schema(tool_info: MCPToolInfo) -> Type[BaseModel]:
     omit fields that have server-side defaults (e.g. Notion's sort/filter), and
     a Pydantic required-field error would kill the call before it reaches the server.
     """
-    from pydantic import ConfigDict
-
     input_schema = tool_info.input_schema or {}
     properties = input_schema.get("properties", {})
 
     if not properties:
-        model = create_model(f"{tool_info.name}_Args")
-        model.model_config = ConfigDict(extra="allow")
-        return model
+        return _generic_args_schema(tool_info.name)
 
     field_definitions: Dict[str, Any] = {}
 
@@ -35,34 +80,21 @@ def _create_args_schema(tool_info: MCPToolInfo) -> Type[BaseModel]:
         prop_type = prop_schema.get("type", "string")
         prop_desc = prop_schema.get("description", "")
 
-        python_type: Any = str
-        if prop_type == "integer":
-            python_type = int
-        elif prop_type == "number":
-            python_type = float
-        elif prop_type == "boolean":
-            python_type = bool
-        elif prop_type == "array":
-            python_type = list
-        elif prop_type == "object":
-            python_type = dict
+        # Union types (e.g. ["string", "null"]) are lists, which can't be dict keys
+        annotation = _JSON_TYPE_MAP.get(prop_type, Optional[str]) if isinstance(prop_type, str) else Optional[str]
 
         # Always Optional — the MCP server handles its own required-field checks.
         # This prevents Pydantic from rejecting LLM calls that omit server-defaulted fields.
         field_definitions[prop_name] = (
-            Optional[python_type],
+            annotation,
             Field(None, description=prop_desc)
         )
 
     try:
-        model = create_model(f"{tool_info.name}_Args", **field_definitions)
-        model.model_config = ConfigDict(extra="allow")
-        return model
+        return create_model(f"{tool_info.name}_Args", __config__=_ARGS_CONFIG, **field_definitions)
     except Exception as e:
         logger.warning("Failed to create args schema for %s: %s", tool_info.name, e)
-        model = create_model(f"{tool_info.name}_Args")
-        model.model_config = ConfigDict(extra="allow")
-        return model
+        return _generic_args_schema(tool_info.name)
 
 
 def to_langgraph_tool(tool_info: MCPToolInfo, server_config: MCPServerConfig, agent_name: str = "") -> Any:
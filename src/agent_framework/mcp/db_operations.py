@@ -1,17 +1,161 @@
 """Database operations for MCP OAuth."""
 
+import hashlib
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 import secrets
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.pool import NullPool
+from sqlalchemy.engine import Engine
 
 from .token_encryption import encrypt_token, decrypt_token
 
 logger = logging.getLogger(__name__)
 
+# Connection pool settings for the auth DB (shared by all MCPDatabaseOperations)
+POOL_SIZE = 20
+MAX_OVERFLOW = 10
+POOL_TIMEOUT = 30
+POOL_RECYCLE = 1800
+
+# SQL statements are module-level constants so each is compiled once and then
+# served from SQLAlchemy's compiled cache on every call.
+
+# state_hash narrows the index walk; state_token guards against hash collisions
+_SELECT_SESSION_BY_STATE = text("""
+    SELECT session_id, user_id, server_id
+    FROM mcp_auth_sessions
+    WHERE state_hash = :state_hash AND state_token = :state_token
+""")
+
+_UPDATE_AUTH_SESSION_STATUS = text("""
+    UPDATE mcp_auth_sessions
+    SET status = :status,
+        error_message = :error_message,
+        completed_at = CASE WHEN :status = 'completed' THEN NOW() ELSE NULL END
+    WHERE session_id = :session_id
+""")
+
+# Completes the session only while it is still pending and unexpired (rowcount 0 otherwise)
+_COMPLETE_PENDING_AUTH_SESSION = text("""
+    UPDATE mcp_auth_sessions
+    SET status = 'completed', error_message = NULL, completed_at = NOW()
+    WHERE session_id = :session_id AND status = 'pending' AND expires_at >= :now
+""")
+
+_UPSERT_OAUTH_TOKEN = text("""
+    INSERT INTO mcp_oauth_tokens
+    (user_id, server_id, access_token, refresh_token, token_type, expires_at, scope)
+    VALUES (:user_id, :server_id, :access_token, :refresh_token, :token_type, :expires_at, :scope)
+    ON CONFLICT (user_id, server_id)
+    DO UPDATE SET
+        access_token = EXCLUDED.access_token,
+        refresh_token = EXCLUDED.refresh_token,
+        token_type = EXCLUDED.token_type,
+        expires_at = EXCLUDED.expires_at,
+        scope = EXCLUDED.scope,
+        updated_at = NOW()
+""")
+
+_UPSERT_USER_CONNECTION = text("""
+    INSERT INTO mcp_user_connections (user_id, server_id, config, connected_at)
+    VALUES (:user_id, :server_id, :config, NOW())
+    ON CONFLICT (user_id, server_id)
+    DO UPDATE SET
+        status = 'active',
+        config = EXCLUDED.config,
+        updated_at = NOW()
+""")
+
+_INSERT_AUTH_SESSION = text("""
+    INSERT INTO mcp_auth_sessions
+    (session_id, user_id, server_id, state_token, state_hash, expires_at)
+    VALUES (:session_id, :user_id, :server_id, :state_token, :state_hash, :expires_at)
+""")
+
+_SELECT_AUTH_SESSION = text("""
+    SELECT session_id, user_id, server_id, state_token, status,
+           error_message, created_at, expires_at, completed_at
+    FROM mcp_auth_sessions
+    WHERE session_id = :session_id
+""")
+
+# Flips an overdue pending session to expired and returns it in one round-trip
+_EXPIRE_AUTH_SESSION = text("""
+    UPDATE mcp_auth_sessions
+    SET status = 'expired'
+    WHERE session_id = :session_id AND status = 'pending' AND expires_at < :now
+    RETURNING session_id, user_id, server_id, state_token, status,
+              error_message, created_at, expires_at, completed_at
+""")
+
+_SELECT_OAUTH_TOKEN = text("""
+    SELECT access_token, refresh_token, token_type, expires_at, scope
+    FROM mcp_oauth_tokens
+    WHERE user_id = :user_id AND server_id = :server_id
+""")
+
+_SELECT_USER_CONNECTIONS = text("""
+    SELECT server_id, status, config, connected_at, last_used_at
+    FROM mcp_user_connections
+    WHERE user_id = :user_id
+    ORDER BY connected_at DESC
+""")
+
+_DELETE_OAUTH_TOKEN = text("DELETE FROM mcp_oauth_tokens WHERE user_id = :user_id AND server_id = :server_id")
+
+_DELETE_USER_CONNECTION = text("DELETE FROM mcp_user_connections WHERE user_id = :user_id AND server_id = :server_id")
+
+_UPDATE_LAST_USED = text("""
+    UPDATE mcp_user_connections
+    SET last_used_at = NOW()
+    WHERE user_id = :user_id AND server_id = :server_id
+""")
+
+# One engine (and pool) per database URL for the lifetime of the process
+_engines: Dict[str, Engine] = {}
+
+
+def get_engine(database_url: str) -> Engine:
+    """Return the pooled engine for a database URL, creating it on first use.
+
+    Args:
+        database_url: PostgreSQL connection URL
+
+    Returns:
+        Shared SQLAlchemy engine
+    """
+    engine = _engines.get(database_url)
+    if engine is None:
+        engine = create_engine(
+            database_url,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT,
+            pool_recycle=POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
+        _engines[database_url] = engine
+    return engine
+
+
+class AuthSessionNotPendingError(ValueError):
+    """The OAuth session is expired, already completed or failed, or unknown."""
+
+
+def state_token_hash(state_token: str) -> int:
+    """Return the signed 64-bit blake2b digest stored in mcp_auth_sessions.state_hash.
+
+    Args:
+        state_token: OAuth CSRF state token
+
+    Returns:
+        Integer that fits a PostgreSQL BIGINT
+    """
+    digest = hashlib.blake2b(state_token.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
 
 class MCPDatabaseOperations:
     """Database operations for MCP OAuth."""
@@ -22,7 +166,7 @@ class MCPDatabaseOperations:
         Args:
             database_url: PostgreSQL connection URL
         """
-        self.engine = create_engine(database_url, poolclass=NullPool)
+        self.engine = get_engine(database_url)
 
     def create_auth_session(
         self,
@@ -47,16 +191,13 @@ class MCPDatabaseOperations:
 
         with self.engine.connect() as conn:
             conn.execute(
-                text("""
-                    INSERT INTO mcp_auth_sessions
-                    (session_id, user_id, server_id, state_token, expires_at)
-                    VALUES (:session_id, :user_id, :server_id, :state_token, :expires_at)
-                """),
+                _INSERT_AUTH_SESSION,
                 {
                     "session_id": session_id,
                     "user_id": user_id,
                     "server_id": server_id,
                     "state_token": state_token,
+                    "state_hash": state_token_hash(state_token),
                     "expires_at": expires_at,
                 }
             )
@@ -76,26 +217,76 @@ class MCPDatabaseOperations:
         """
         with self.engine.connect() as conn:
             result = conn.execute(
-                text("""
-                    SELECT session_id, user_id, server_id, state_token, status,
-                           error_message, created_at, expires_at, completed_at
-                    FROM mcp_auth_sessions
-                    WHERE session_id = :session_id
-                """),
+                _SELECT_AUTH_SESSION,
                 {"session_id": session_id}
             ).fetchone()
 
+            return self._auth_session_row_to_dict(result) if result else None
+
+    def get_auth_session_status(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get OAuth session by ID, marking it expired first if it is overdue.
+
+        A single conditional UPDATE ... RETURNING covers the expiry check; a plain
+        SELECT is only issued when the session did not need expiring.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session dict or None if not found
+        """
+        with self.engine.connect() as conn:
+            result = conn.execute(
+                _EXPIRE_AUTH_SESSION,
+                {"session_id": session_id, "now": datetime.now()}
+            ).fetchone()
+
+            if result:
+                conn.commit()
+                logger.info(f"Updated auth session {session_id} to status: expired")
+            else:
+                result = conn.execute(
+                    _SELECT_AUTH_SESSION,
+                    {"session_id": session_id}
+                ).fetchone()
+
+            return self._auth_session_row_to_dict(result) if result else None
+
+    @staticmethod
+    def _auth_session_row_to_dict(row) -> Dict[str, Any]:
+        """Convert an mcp_auth_sessions row (full column list) to a dict."""
+        return {
+            "session_id": row[0],
+            "user_id": row[1],
+            "server_id": row[2],
+            "state_token": row[3],
+            "status": row[4],
+            "error_message": row[5],
+            "created_at": row[6],
+            "expires_at": row[7],
+            "completed_at": row[8],
+        }
+
+    def get_auth_session_by_state(self, state_token: str) -> Optional[Dict[str, Any]]:
+        """Get OAuth session by CSRF state token.
+
+        Args:
+            state_token: State token sent to the OAuth provider
+
+        Returns:
+            Dict with session_id, user_id and server_id, or None if not found
+        """
+        with self.engine.connect() as conn:
+            result = conn.execute(
+                _SELECT_SESSION_BY_STATE,
+                {"state_hash": state_token_hash(state_token), "state_token": state_token}
+            ).fetchone()
+
             if result:
                 return {
                     "session_id": result[0],
                     "user_id": result[1],
                     "server_id": result[2],
-                    "state_token": result[3],
-                    "status": result[4],
-                    "error_message": result[5],
-                    "created_at": result[6],
-                    "expires_at": result[7],
-                    "completed_at": result[8],
                 }
             return None
 
@@ -114,13 +305,7 @@ class MCPDatabaseOperations:
         """
         with self.engine.connect() as conn:
             conn.execute(
-                text("""
-                    UPDATE mcp_auth_sessions
-                    SET status = :status,
-                        error_message = :error_message,
-                        completed_at = CASE WHEN :status = 'completed' THEN NOW() ELSE NULL END
-                    WHERE session_id = :session_id
-                """),
+                _UPDATE_AUTH_SESSION_STATUS,
                 {
                     "session_id": session_id,
                     "status": status,
@@ -152,43 +337,89 @@ class MCPDatabaseOperations:
             expires_in: Token lifetime in seconds
             scope: OAuth scopes (space-separated)
         """
-        # Encrypt tokens
-        encrypted_access = encrypt_token(access_token)
-        encrypted_refresh = encrypt_token(refresh_token) if refresh_token else None
+        params = self._oauth_token_params(
+            user_id, server_id, access_token, refresh_token, token_type, expires_in, scope
+        )
 
+        with self.engine.connect() as conn:
+            conn.execute(_UPSERT_OAUTH_TOKEN, params)
+            conn.commit()
+
+        logger.info(f"Stored OAuth token for user {user_id}, server {server_id}")
+
+    @staticmethod
+    def _oauth_token_params(
+        user_id: str,
+        server_id: str,
+        access_token: str,
+        refresh_token: Optional[str],
+        token_type: str,
+        expires_in: Optional[int],
+        scope: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build bind parameters for _UPSERT_OAUTH_TOKEN (encrypts tokens)."""
         # Calculate expiration
         expires_at = None
         if expires_in:
             expires_at = datetime.now() + timedelta(seconds=expires_in)
 
-        with self.engine.connect() as conn:
+        return {
+            "user_id": user_id,
+            "server_id": server_id,
+            "access_token": encrypt_token(access_token),
+            "refresh_token": encrypt_token(refresh_token) if refresh_token else None,
+            "token_type": token_type,
+            "expires_at": expires_at,
+            "scope": scope,
+        }
+
+    def complete_oauth_flow(
+        self,
+        session_id: str,
+        user_id: str,
+        server_id: str,
+        access_token: str,
+        refresh_token: Optional[str] = None,
+        token_type: str = "Bearer",
+        expires_in: Optional[int] = None,
+        scope: Optional[str] = None
+    ):
+        """Store the token, activate the connection and complete the session in one transaction.
+
+        The session is claimed first; if it is no longer pending (or has expired),
+        nothing is written.
+
+        Args:
+            session_id: OAuth session identifier
+            user_id: User identifier
+            server_id: MCP server ID
+            access_token: Access token (will be encrypted)
+            refresh_token: Optional refresh token (will be encrypted)
+            token_type: Token type (usually "Bearer")
+            expires_in: Token lifetime in seconds
+            scope: OAuth scopes (space-separated)
+
+        Raises:
+            AuthSessionNotPendingError: If the session is not pending or has expired
+        """
+        token_params = self._oauth_token_params(
+            user_id, server_id, access_token, refresh_token, token_type, expires_in, scope
+        )
+
+        with self.engine.begin() as conn:
+            claimed = conn.execute(
+                _COMPLETE_PENDING_AUTH_SESSION,
+                {"session_id": session_id, "now": datetime.now()},
+            )
+            if claimed.rowcount == 0:
+                raise AuthSessionNotPendingError(f"Auth session {session_id} is not pending")
+            conn.execute(_UPSERT_OAUTH_TOKEN, token_params)
             conn.execute(
-                text("""
-                    INSERT INTO mcp_oauth_tokens
-                    (user_id, server_id, access_token, refresh_token, token_type, expires_at, scope)
-                    VALUES (:user_id, :server_id, :access_token, :refresh_token, :token_type, :expires_at, :scope)
-                    ON CONFLICT (user_id, server_id)
-                    DO UPDATE SET
-                        access_token = EXCLUDED.access_token,
-                        refresh_token = EXCLUDED.refresh_token,
-                        token_type = EXCLUDED.token_type,
-                        expires_at = EXCLUDED.expires_at,
-                        scope = EXCLUDED.scope,
-                        updated_at = NOW()
-                """),
-                {
-                    "user_id": user_id,
-                    "server_id": server_id,
-                    "access_token": encrypted_access,
-                    "refresh_token": encrypted_refresh,
-                    "token_type": token_type,
-                    "expires_at": expires_at,
-                    "scope": scope,
-                }
+                _UPSERT_USER_CONNECTION,
+                {"user_id": user_id, "server_id": server_id, "config": None},
             )
-            conn.commit()
 
-        logger.info(f"Stored OAuth token for user {user_id}, server {server_id}")
+        logger.info(f"Completed OAuth flow for user {user_id}, server {server_id}, session {session_id}")
 
     def get_oauth_token(self, user_id: str, server_id: str) -> Optional[Dict[str, Any]]:
         """Get OAuth token for user and server.
@@ -202,11 +433,7 @@ class MCPDatabaseOperations:
         """
         with self.engine.connect() as conn:
             result = conn.execute(
-                text("""
-                    SELECT access_token, refresh_token, token_type, expires_at, scope
-                    FROM mcp_oauth_tokens
-                    WHERE user_id = :user_id AND server_id = :server_id
-                """),
+                _SELECT_OAUTH_TOKEN,
                 {"user_id": user_id, "server_id": server_id}
             ).fetchone()
 
@@ -241,15 +468,7 @@ class MCPDatabaseOperations:
 
         with self.engine.connect() as conn:
             conn.execute(
-                text("""
-                    INSERT INTO mcp_user_connections (user_id, server_id, config, connected_at)
-                    VALUES (:user_id, :server_id, :config, NOW())
-                    ON CONFLICT (user_id, server_id)
-                    DO UPDATE SET
-                        status = 'active',
-                        config = EXCLUDED.config,
-                        updated_at = NOW()
-                """),
+                _UPSERT_USER_CONNECTION,
                 {
                     "user_id": user_id,
                     "server_id": server_id,
@@ -271,12 +490,7 @@ class MCPDatabaseOperations:
         """
         with self.engine.connect() as conn:
             results = conn.execute(
-                text("""
-                    SELECT server_id, status, config, connected_at, last_used_at
-                    FROM mcp_user_connections
-                    WHERE user_id = :user_id
-                    ORDER BY connected_at DESC
-                """),
+                _SELECT_USER_CONNECTIONS,
                 {"user_id": user_id}
             ).fetchall()
 
@@ -301,13 +515,13 @@ class MCPDatabaseOperations:
         with self.engine.connect() as conn:
             # Delete OAuth token
             conn.execute(
-                text("DELETE FROM mcp_oauth_tokens WHERE user_id = :user_id AND server_id = :server_id"),
+                _DELETE_OAUTH_TOKEN,
                 {"user_id": user_id, "server_id": server_id}
             )
 
             # Delete connection
             conn.execute(
-                text("DELETE FROM mcp_user_connections WHERE user_id = :user_id AND server_id = :server_id"),
+                _DELETE_USER_CONNECTION,
                 {"user_id": user_id, "server_id": server_id}
             )
 
@@ -324,11 +538,7 @@ class MCPDatabaseOperations:
         """
         with self.engine.connect() as conn:
             conn.execute(
-                text("""
-                    UPDATE mcp_user_connections
-                    SET last_used_at = NOW()
-                    WHERE user_id = :user_id AND server_id = :server_id
-                """),
+                _UPDATE_LAST_USED,
                 {"user_id": user_id, "server_id": server_id}
             )
             conn.commit()
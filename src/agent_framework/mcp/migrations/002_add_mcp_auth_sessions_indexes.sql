@@ -0,0 +1,19 @@
+-- Migration: 002_add_mcp_auth_sessions_indexes
+-- Description: Index OAuth session lookups used by the callback and status endpoints
+-- Created: 2026-10-16
+--
+-- Note: CONCURRENTLY cannot run inside a transaction block, and the migration
+-- runner executes each file in one transaction. On a large live table, run these
+-- statements manually with CREATE INDEX CONCURRENTLY instead.
+
+-- ============================================
+-- OAuth Sessions
+-- ============================================
+
+-- OAuth callback looks up the session by state token on every redirect
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mcp_auth_sessions_state_token
+    ON mcp_auth_sessions(state_token);
+
+-- Status polling checks pending sessions against their expiry
+CREATE INDEX IF NOT EXISTS idx_mcp_auth_sessions_expires_status
+    ON mcp_auth_sessions(status, expires_at);
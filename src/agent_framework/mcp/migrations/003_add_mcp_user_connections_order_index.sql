@@ -0,0 +1,15 @@
+-- Migration: 003_add_mcp_user_connections_order_index
+-- Description: Index per-user connection listing in connected_at order
+-- Created: 2026-10-16
+--
+-- Lookups by (user_id, server_id) on mcp_user_connections and mcp_oauth_tokens
+-- are already served by the unique_user_server / unique_user_server_token
+-- constraint indexes from migration 001.
+
+-- ============================================
+-- User MCP Connections
+-- ============================================
+
+-- GET /mcp/connections filters by user_id and orders by connected_at DESC
+CREATE INDEX IF NOT EXISTS idx_mcp_user_connections_user_connected
+    ON mcp_user_connections(user_id, connected_at DESC);
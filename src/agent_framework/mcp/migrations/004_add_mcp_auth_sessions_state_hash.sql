@@ -0,0 +1,18 @@
+-- Migration: 004_add_mcp_auth_sessions_state_hash
+-- Description: Narrow 8-byte lookup key for OAuth callback state tokens
+-- Created: 2026-10-16
+--
+-- state_hash is the signed 64-bit blake2b digest of state_token, computed by
+-- MCPDatabaseOperations.create_auth_session. Sessions created before this
+-- migration have no hash and will not match the callback lookup; they expire
+-- within 5 minutes, so no backfill is needed.
+
+-- ============================================
+-- OAuth Sessions
+-- ============================================
+ALTER TABLE mcp_auth_sessions ADD COLUMN IF NOT EXISTS state_hash BIGINT;
+
+CREATE INDEX IF NOT EXISTS idx_mcp_auth_sessions_state_hash
+    ON mcp_auth_sessions(state_hash);
+
+COMMENT ON COLUMN mcp_auth_sessions.state_hash IS 'blake2b-64 of state_token (index key for callback lookup)';
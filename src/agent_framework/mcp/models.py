@@ -7,7 +7,7 @@ Used by MCPServerRegistry and (later) AgentConfig resolution.
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class MCPToolInfo(BaseModel):
@@ -94,3 +94,8 @@ class MCPServerReference(BaseModel):
         description="Environment overrides for this agent",
     )
     timeout: Optional[int] = Field(default=None, ge=1, description="Timeout override in seconds")
+
+
+# Built once at import and shared by every registry load.
+MCP_SERVER_CONFIG_ADAPTER: TypeAdapter[MCPServerConfig] = TypeAdapter(MCPServerConfig)
+MCP_SERVER_CONFIGS_ADAPTER: TypeAdapter[Dict[str, MCPServerConfig]] = TypeAdapter(Dict[str, MCPServerConfig])
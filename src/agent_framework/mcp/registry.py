@@ -4,17 +4,42 @@ Loads server definitions from a config file and provides lookup by ID.
 Singleton: use MCPServerRegistry.get_instance().
 """
 
+import hashlib
 import json
 import logging
 import os
-from typing import Dict, List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-
-from src.agent_framework.mcp.models import MCPServerConfig
+from pydantic import ValidationError
+from pydantic_core import from_json
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    _json_loads = from_json
+
+from src.agent_framework.mcp.models import (
+    MCP_SERVER_CONFIG_ADAPTER,
+    MCP_SERVER_CONFIGS_ADAPTER,
+    MCPAuthType,
+    MCPServerConfig,
+    MCPTransport,
+)
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when available; same output as SafeLoader, parsed in C
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# String forms of the enums, resolved before validation
+_TRANSPORTS = {t.value: t for t in MCPTransport}
+_AUTH_TYPES = {t.value: t for t in MCPAuthType}
+
+# Transports that connect to remote servers and may require OAuth
+REMOTE_TRANSPORTS = frozenset({"sse", "http"})
+
 
 class MCPServerRegistry:
     """Manages global MCP server configurations.
@@ -27,6 +52,11 @@ class MCPServerRegistry:
     """
 
     _instance: Optional["MCPServerRegistry"] = None
+    # Parsed file data keyed by content hash (+ format); survives reset_instance()
+    _parsed_cache: Dict[str, Any] = {}
+    # Validated configs keyed by hash of the normalized entries; shared read-only
+    # (per-agent overrides go through model_copy)
+    _validated_cache: Dict[str, Dict[str, MCPServerConfig]] = {}
 
     def __init__(self, config_path: Optional[str] = None) -> None:
         """Initialize registry from config file.
@@ -35,6 +65,8 @@ class MCPServerRegistry:
             config_path: Optional path to config file. If None, discovery is used.
         """
         self._servers: Dict[str, MCPServerConfig] = {}
+        self._api_dicts: Dict[str, Dict[str, Any]] = {}
+        self._server_ids: Tuple[str, ...] = ()
         path = config_path or self._find_config_file()
         if path and os.path.exists(path):
             self._load_config(path)
@@ -80,15 +112,20 @@ class MCPServerRegistry:
 
         Supports flexible root keys: "servers" (preferred) or "mcpServers" (alternate).
         """
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                if config_path.endswith(".yaml") or config_path.endswith(".yml"):
-                    data = yaml.safe_load(f)
-                else:
-                    data = json.load(f)
-        except (json.JSONDecodeError, yaml.YAMLError) as e:
-            logger.error("Invalid MCP config file %s: %s", config_path, e)
-            raise
+        with open(config_path, "rb") as f:
+            content = f.read()
+        is_yaml = config_path.endswith(".yaml") or config_path.endswith(".yml")
+        cache_key = f"{'yaml' if is_yaml else 'json'}:{hashlib.blake2b(content).hexdigest()}"
+        data = self._parsed_cache.get(cache_key)
+        if data is None:
+            try:
+                # JSON is parsed straight from the raw bytes (orjson, else pydantic-core)
+                data = yaml.load(content, Loader=_YAML_LOADER) if is_yaml else _json_loads(content)
+            except (ValueError, yaml.YAMLError) as e:
+                logger.error("Invalid MCP config file %s: %s", config_path, e)
+                raise
+            # Env vars are resolved later, during normalization, so the raw parse is safe to share
+            self._parsed_cache[cache_key] = data
 
         if not isinstance(data, dict):
             logger.error("MCP config root must be a dict; got %s", type(data).__name__)
@@ -100,21 +137,48 @@ class MCPServerRegistry:
             logger.error("MCP config 'servers' or 'mcpServers' must be a dict; got %s", type(servers).__name__)
             raise ValueError("MCP config must contain 'servers' or 'mcpServers' dict")
 
-        self._servers = {}
+        normalized: Dict[str, Dict] = {}
         for server_id, raw in servers.items():
             if not isinstance(raw, dict):
                 logger.warning("Skipping invalid server entry '%s': not a dict", server_id)
                 continue
             try:
                 # Normalize server config to standard format
-                normalized = self._normalize_server_config(server_id, raw)
-                config = MCPServerConfig(**normalized)
-                self._servers[server_id] = config
+                normalized[server_id] = self._normalize_server_config(server_id, raw)
             except Exception as e:
                 logger.warning("Skipping server '%s': %s", server_id, e)
 
+        # Normalized entries already include resolved env vars, so an identical
+        # mapping validates to identical configs; reuse them instead of re-validating
+        validated_key = hashlib.blake2b(
+            json.dumps(normalized, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        validated = self._validated_cache.get(validated_key)
+        if validated is None:
+            # Validate all entries in one pass; only walk them one by one to skip bad ones
+            try:
+                validated = MCP_SERVER_CONFIGS_ADAPTER.validate_python(normalized)
+            except ValidationError:
+                validated = {}
+                for server_id, entry in normalized.items():
+                    try:
+                        validated[server_id] = MCP_SERVER_CONFIG_ADAPTER.validate_python(entry)
+                    except ValidationError as e:
+                        logger.warning("Skipping server '%s': %s", server_id, e)
+            self._validated_cache[validated_key] = validated
+        self._set_servers(validated)
+
         logger.info("Loaded %d MCP server(s) from %s", len(self._servers), config_path)
 
+    def _set_servers(self, validated: Dict[str, MCPServerConfig]) -> None:
+        """Install validated configs along with their derived IDs and API dicts."""
+        # Interned IDs let lookups with literal/interned keys hit dict's identity fast path
+        self._servers = {sys.intern(sid): cfg for sid, cfg in validated.items()}
+
+        # IDs and API projections are pure functions of static config; build them once
+        self._server_ids = tuple(self._servers)
+        self._api_dicts = {sid: self._build_api_dict(cfg) for sid, cfg in self._servers.items()}
+
     def get_server(self, server_id: str) -> Optional[MCPServerConfig]:
         """Return server config by ID, or None if not found."""
         return self._servers.get(server_id)
@@ -125,7 +189,34 @@ class MCPServerRegistry:
 
     def list_server_ids(self) -> List[str]:
         """Return all registered server IDs."""
-        return list(self._servers.keys())
+        return list(self._server_ids)
+
+    def get_server_api_dict(self, server_id: str) -> Optional[Dict[str, Any]]:
+        """Return the precomputed API representation of a server, or None if not found."""
+        return self._api_dicts.get(server_id)
+
+    def list_server_api_dicts(self) -> List[Dict[str, Any]]:
+        """Return precomputed API representations of all registered servers."""
+        return list(self._api_dicts.values())
+
+    @staticmethod
+    def _build_api_dict(config: MCPServerConfig) -> Dict[str, Any]:
+        """Project a server config to the dict format served by the catalog API."""
+        # OAuth servers require authentication (SSE/HTTP transport + OAuth auth)
+        requires_auth = (
+            config.transport in REMOTE_TRANSPORTS
+            and config.auth.type.value == "oauth"
+        )
+        return {
+            "id": config.id,
+            "name": config.id.replace("_", " ").title(),  # Generate name from ID
+            "description": config.description or f"{config.id} MCP server",
+            "transport": config.transport,
+            "requires_auth": requires_auth,
+            "url": config.url,
+            "command": config.command,
+            "enabled": True,  # All servers in registry are enabled
+        }
 
     @classmethod
     def get_instance(cls, config_path: Optional[str] = None) -> "MCPServerRegistry":
@@ -146,12 +237,12 @@ class MCPServerRegistry:
 
         # Copy or auto-detect transport
         if "transport" in raw:
-            normalized["transport"] = raw["transport"]
+            normalized["transport"] = _TRANSPORTS.get(raw["transport"], raw["transport"])
         elif "url" in raw:
-            normalized["transport"] = "sse"  # SSE for remote servers
+            normalized["transport"] = MCPTransport.SSE  # SSE for remote servers
             normalized["url"] = raw["url"]
         elif "command" in raw:
-            normalized["transport"] = "stdio"
+            normalized["transport"] = MCPTransport.STDIO
 
         # Handle command field (always normalize command + args if present)
         if "command" in raw:
@@ -186,7 +277,10 @@ class MCPServerRegistry:
         if "auth" in raw and isinstance(raw["auth"], dict):
             # Copy auth config as-is (env var names only, no credential resolution)
             # Credentials will be resolved at runtime in OAuth routes
-            normalized["auth"] = raw["auth"].copy()
+            auth = raw["auth"].copy()
+            if "type" in auth:
+                auth["type"] = _AUTH_TYPES.get(auth["type"], auth["type"])
+            normalized["auth"] = auth
 
         # Copy other optional fields
         for key in ["timeout", "max_retries", "tools"]:
@@ -214,3 +308,9 @@ class MCPServerRegistry:
     def reset_instance(cls) -> None:
         """Reset singleton (for tests)."""
         cls._instance = None
+
+    @classmethod
+    def clear_parse_cache(cls) -> None:
+        """Drop cached config file parses and validated configs."""
+        cls._parsed_cache.clear()
+        cls._validated_cache.clear()
@@ -1,13 +1,41 @@
 """MCP tool discovery: list tools from a server with optional name filter."""
 
+import hashlib
+import json
 import logging
-from typing import List
+from typing import Dict, List
 
-from src.agent_framework.mcp.client_manager import MCPClientManager
+from src.agent_framework.mcp.client_manager import MCPClientManager, get_mcp_user_id
 from src.agent_framework.mcp.models import MCPServerConfig, MCPToolInfo, MCPTransport
 
 logger = logging.getLogger(__name__)
 
+# Unfiltered tool lists per server identity, kept for the process lifetime so
+# repeated discovery (one per agent build) skips the list_tools round-trip.
+_tool_cache: Dict[str, List[MCPToolInfo]] = {}
+
+
+def _cache_key(server_config: MCPServerConfig) -> str:
+    """Hash of everything that decides which tools a server exposes."""
+    identity = {
+        "id": server_config.id,
+        "transport": server_config.transport.value,
+        "command": server_config.command,
+        "url": server_config.url,
+        "env": server_config.env,
+        "auth": server_config.auth.model_dump(mode="json"),
+    }
+    if server_config.transport != MCPTransport.STDIO:
+        # Remote servers may expose different tools per connected user
+        identity["user"] = get_mcp_user_id()
+    payload = json.dumps(identity, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def clear_tool_cache() -> None:
+    """Drop all cached tool lists (e.g. after an MCP server's tools change)."""
+    _tool_cache.clear()
+
 
 def _filter_tools(tools: List[MCPToolInfo], server_config: MCPServerConfig) -> List[MCPToolInfo]:
     """Apply server_config.tools name filter if set."""
@@ -29,8 +57,13 @@ class MCPToolDiscovery:
 
     async def discover_tools(self, server_config: MCPServerConfig) -> List[MCPToolInfo]:
         """Discover tools from the server (uses cached client); if server_config.tools is set, filter to those names."""
-        client = self._manager.get_client(server_config)
-        tools = await client.list_tools()
+        key = _cache_key(server_config)
+        tools = _tool_cache.get(key)
+        if tools is None:
+            client = self._manager.get_client(server_config)
+            tools = _tool_cache[key] = await client.list_tools()
+        else:
+            logger.debug("MCP server %s: using cached tool list", server_config.id)
         return _filter_tools(tools, server_config)
 
     async def discover_tools_temporary(self, server_config: MCPServerConfig) -> List[MCPToolInfo]:
@@ -38,21 +71,25 @@ class MCPToolDiscovery:
         Use this when discovery runs on a different event loop (e.g. a worker thread)
         so the main loop can create its own client when the tool is invoked.
         """
+        key = _cache_key(server_config)
+        if key in _tool_cache:
+            logger.debug("MCP server %s: using cached tool list", server_config.id)
+            return _filter_tools(_tool_cache[key], server_config)
+
         if server_config.transport == MCPTransport.STDIO:
             from src.agent_framework.mcp.clients.stdio import StdioMCPClient
             client = StdioMCPClient(server_config)
             try:
-                tools = await client.list_tools()
+                tools = _tool_cache[key] = await client.list_tools()
                 return _filter_tools(tools, server_config)
             finally:
                 await client.close()
 
         if server_config.transport in (MCPTransport.SSE, MCPTransport.HTTP):
             from src.agent_framework.mcp.clients.sse import SSEMCPClient
-            from src.agent_framework.mcp.client_manager import get_mcp_user_id
             client = SSEMCPClient(server_config, get_mcp_user_id())
             async with client:
-                tools = await client.list_tools()
+                tools = _tool_cache[key] = await client.list_tools()
                 return _filter_tools(tools, server_config)
 
         raise ValueError(
@@ -170,8 +170,14 @@ class AgentRegistry:
         return name in self._agent_instances
     
     def clear_cache(self) -> None:
-        """Clear the agent instance cache (removes all singleton instances)."""
+        """Clear the agent instance cache (removes all singleton instances).
+
+        Also drops the sub-agent instances ToolManager reuses across orchestrators.
+        """
+        from src.agent_framework.tools.tool_manager import clear_sub_agent_cache
+
         self._agent_instances.clear()
+        clear_sub_agent_cache()
         logger.info("Agent instance cache cleared (all singletons removed)")
     
     def clear_agent_instance(self, name: str) -> None:
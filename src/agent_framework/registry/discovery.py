@@ -3,7 +3,7 @@
 import os
 import importlib
 import logging
-from typing import Optional, List, Union
+from typing import Dict, Optional, List, Union
 from src.all_agents.base_agent import BaseAgent
 from src.agent_framework.configs.agent_config import AgentConfig
 
@@ -16,6 +16,8 @@ class AgentDiscovery:
     def __init__(self, registry):
         """Initialize the discovery with a registry instance."""
         self.registry = registry
+        # absolute agents_dir -> newest directory mtime under it at the last completed scan
+        self._scanned: Dict[str, float] = {}
     
     def discover_agents(self, agents_dir: Union[str, List[str]] = "src/all_agents") -> None:
         """
@@ -40,15 +42,31 @@ class AgentDiscovery:
                 continue
             
             # Walk through the agents directory
+            module_paths = []
+            mtime = 0.0
             for root, dirs, files in os.walk(agents_dir):
                 # Skip __pycache__ directories
                 dirs[:] = [d for d in dirs if d != '__pycache__']
+                mtime = max(mtime, os.stat(root).st_mtime)
                 
                 # Look for Python files that might contain agents
                 for file in files:
                     if file.endswith('.py') and not file.startswith('__'):
-                        module_path = os.path.join(root, file)
-                        self._try_register_agent_from_file(module_path)
+                        module_paths.append(os.path.join(root, file))
+            
+            # Re-importing an unchanged tree would only re-register the same
+            # classes, so skip it. A directory's mtime changes when an entry in
+            # it is added, removed or renamed, so the newest one catches modules
+            # added or removed at any depth; edits to existing files do not.
+            scan_key = os.path.abspath(agents_dir)
+            if self._scanned.get(scan_key) == mtime:
+                logger.debug(f"Agents in {agents_dir} already discovered, skipping")
+                continue
+            
+            for module_path in module_paths:
+                self._try_register_agent_from_file(module_path)
+            
+            self._scanned[scan_key] = mtime
     
     def _try_register_agent_from_file(self, file_path: str) -> None:
         """
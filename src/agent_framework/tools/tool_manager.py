@@ -14,6 +14,16 @@ from src.agent_framework.factories.tool_factory import ToolFactory
 
 logger = logging.getLogger(__name__)
 
+# Sub-agent instances per 'agent_class' path, shared by every orchestrator build
+# (and engine rebuild) instead of re-loading each sub-agent's YAML and engine.
+# Cleared together with the agent registry's instances (registry.clear_cache()).
+_sub_agent_cache: Dict[str, Any] = {}
+
+
+def clear_sub_agent_cache() -> None:
+    """Drop all cached sub-agent instances (e.g. after a sub-agent's config changes)."""
+    _sub_agent_cache.clear()
+
 
 class ToolManager:
     """Clean tool manager using only the new architecture.
@@ -130,17 +140,20 @@ class ToolManager:
             logger.warning("Agent tool missing 'agent_class'")
             return None
         
-        # Import and instantiate agent
-        module_path, class_name = agent_class_path.rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        agent_class = getattr(module, class_name)
-        
-        # Create agent instance directly (agents auto-load their config)
-        try:
-            agent_instance = agent_class()
-        except Exception as e:
-            logger.warning(f"Failed to create agent instance for {class_name}: {e}")
-            return None
+        agent_instance = _sub_agent_cache.get(agent_class_path)
+        if agent_instance is None:
+            # Import and instantiate agent
+            module_path, class_name = agent_class_path.rsplit(".", 1)
+            module = importlib.import_module(module_path)
+            agent_class = getattr(module, class_name)
+            
+            # Create agent instance directly (agents auto-load their config)
+            try:
+                agent_instance = agent_class()
+            except Exception as e:
+                logger.warning(f"Failed to create agent instance for {class_name}: {e}")
+                return None
+            _sub_agent_cache[agent_class_path] = agent_instance
         
         # Convert to engine-specific format
         if engine_type == "adk":
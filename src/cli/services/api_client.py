@@ -81,16 +81,17 @@ class AgentShipAPI:
         response.raise_for_status()
         return response.json()
 
-    def check_auth_status(self, session_id: str) -> Dict[str, Any]:
+    def check_auth_status(self, session_id: str, wait: int = 0) -> Dict[str, Any]:
         """Check OAuth authentication status.
 
         Args:
             session_id: OAuth session identifier
+            wait: Seconds the server may hold the request while the session is pending
 
         Returns:
             Dict with status and details
         """
-        response = self.client.get(f"/mcp/auth/status/{session_id}")
+        response = self.client.get(f"/mcp/auth/status/{session_id}", params={"wait": wait})
         response.raise_for_status()
         return response.json()
 
@@ -9,6 +9,9 @@ from .api_client import AgentShipAPI
 
 console = Console()
 
+# Seconds the server may hold each status request (kept below the API client timeout)
+LONG_POLL_SECONDS = 20
+
 
 class OAuthFlow:
     """Handle OAuth flow for CLI commands."""
@@ -72,7 +75,8 @@ class OAuthFlow:
 
             with console.status("[bold cyan]Waiting for authorization..."):
                 while time.time() - start_time < timeout:
-                    status_response = self.api.check_auth_status(session_id)
+                    poll_start = time.time()
+                    status_response = self.api.check_auth_status(session_id, wait=LONG_POLL_SECONDS)
                     status = status_response['status']
 
                     if status == 'completed':
@@ -102,8 +106,10 @@ class OAuthFlow:
                             'error': status_response.get('error_message', 'Unknown error')
                         }
 
-                    # Still pending, continue polling
-                    time.sleep(2)  # Poll every 2 seconds
+                    # Still pending. The server long-polls, so only back off if it
+                    # answered early (e.g. an older server that ignores `wait`).
+                    if time.time() - poll_start < 1:
+                        time.sleep(2)
 
             # Timeout
             return {
@@ -11,7 +11,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
 from dotenv import load_dotenv
 from src.agent_framework.registry import discover_agents
 from src.service.routers.rest_router import router as rest_router
-from src.service.routes.mcp_auth import router as mcp_auth_router
+from src.service.routes.mcp_auth import router as mcp_auth_router, close_http_client
 from studio.router import router as debug_router
 load_dotenv()
 
@@ -205,6 +205,12 @@ async def _install_exception_handler() -> None:
     asyncio.get_event_loop().set_exception_handler(_mcp_gc_exception_handler)
 
 
+@app.on_event("shutdown")
+async def _close_mcp_auth_http_client() -> None:
+    """Close the shared OAuth HTTP client."""
+    await close_http_client()
+
+
 # Ensure agents are discovered (idempotent)
 # Uses AGENT_DIRECTORIES env var or defaults to framework agents only
 discover_agents()
@@ -54,7 +54,7 @@ async def chat_stream(request: AgentChatRequest):
     - done: Stream complete
     - error: An error occurred
     
-    Uses traditional streaming (runner.run()) which works with all Gemini models.
+    Uses traditional streaming (runner.run_async()) which works with all Gemini models.
     For bidirectional streaming with interruptions (requires Gemini 2.0/2.5), 
     use WebSocket endpoint (future implementation).
     
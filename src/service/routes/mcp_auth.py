@@ -1,23 +1,66 @@
 """MCP OAuth authentication routes."""
 
+import asyncio
+import hashlib
+import html
+import json
 import os
 import logging
+import re
 import secrets
-from typing import Optional
-from urllib.parse import urlencode
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, urlencode
 
 import httpx
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, Response
 from pydantic import BaseModel
 
-from src.agent_framework.mcp.registry import MCPServerRegistry
-from src.agent_framework.mcp.db_operations import MCPDatabaseOperations
+from src.agent_framework.mcp.clients.sse import SSEMCPClientFactory
+from src.agent_framework.mcp.models import MCPToolInfo
+from src.agent_framework.mcp.registry import MCPServerRegistry, REMOTE_TRANSPORTS
+from src.agent_framework.mcp.db_operations import AuthSessionNotPendingError, MCPDatabaseOperations
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/mcp", tags=["MCP OAuth"])
 
+# Shared client for OAuth token exchange; reuses keep-alive TLS connections
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Resolved OAuth client credentials keyed by (client_id_env, client_secret_env);
+# dropped by clear_oauth_caches(), which get_registry() runs when the registry reloads
+_credentials_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[str, str]] = {}
+_oauth_cache_registry: Optional[MCPServerRegistry] = None
+
+# Authorization URL prefixes for servers' default scopes, keyed by everything they
+# encode: (server ID, client ID, authorize URL, scopes, callback URL)
+_auth_url_prefixes: Dict[Tuple[str, str, str, Tuple[str, ...], str], str] = {}
+
+# Upper bound for long-polling /auth/status requests
+MAX_STATUS_WAIT_SECONDS = 25
+# Waiter events only see callbacks handled by the same worker, so a long poll also
+# re-reads the session this often to pick up callbacks served by other workers
+STATUS_RECHECK_SECONDS = 2
+
+# Events signaled by oauth_callback when a pending session finishes (per worker)
+_session_events: Dict[str, asyncio.Event] = {}
+# Long-polling requests currently holding a session's event; it is dropped at zero
+_session_waiter_counts: Dict[str, int] = {}
+
+# Catalog data only changes when the registry is reloaded; let clients cache it briefly
+CATALOG_CACHE_CONTROL = "public, max-age=30"
+
+# Opaque tags in an If-None-Match list; the W/ prefix is dropped for weak comparison
+_ETAG_RE = re.compile(r'(?:W/)?("[^"]*")')
+
+# Serialized catalog bodies + ETags keyed by server ID (None = full catalog)
+_catalog_bodies: Dict[Optional[str], Tuple[bytes, str]] = {}
+_catalog_registry: Optional[MCPServerRegistry] = None
+
 
 # ============================================
 # Request/Response Models
@@ -65,15 +108,79 @@ def get_db() -> MCPDatabaseOperations:
     return MCPDatabaseOperations(database_url)
 
 
+@lru_cache(maxsize=1)
 def get_callback_url() -> str:
-    """Get OAuth callback URL."""
+    """Get OAuth callback URL (cached until clear_oauth_caches())."""
     base_url = os.getenv("OAUTH_CALLBACK_BASE_URL", "http://localhost:8000")
     return f"{base_url}/mcp/auth/callback"
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client used for OAuth provider requests."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None and not _HTTP_CLIENT.is_closed:
+        await _HTTP_CLIENT.aclose()
+    _HTTP_CLIENT = None
+
+
 def get_registry() -> MCPServerRegistry:
-    """Get MCP server registry instance."""
-    return MCPServerRegistry.get_instance()
+    """Get MCP server registry instance.
+
+    A reset or reloaded registry also clears the OAuth caches, so credentials
+    and the callback URL are read from the environment again.
+    """
+    global _oauth_cache_registry
+    registry = MCPServerRegistry.get_instance()
+    if _oauth_cache_registry is not registry:
+        clear_oauth_caches()
+        _oauth_cache_registry = registry
+    return registry
+
+
+def clear_oauth_caches() -> None:
+    """Drop cached OAuth credentials, callback URL and authorization URL prefixes.
+
+    Call after changing the client ID/secret variables or OAUTH_CALLBACK_BASE_URL
+    to pick them up without a restart (reloading the registry does this too).
+    """
+    _credentials_cache.clear()
+    _auth_url_prefixes.clear()
+    get_callback_url.cache_clear()
+
+
+def _build_auth_url_prefix(auth_config, client_id: str, scopes: List[str]) -> str:
+    """Build the authorization URL up to (but excluding) the per-request state token.
+
+    Args:
+        auth_config: MCPAuthConfig instance
+        client_id: OAuth client ID
+        scopes: OAuth scopes to request
+
+    Returns:
+        Authorization URL with encoded client_id, redirect_uri, scope and response_type
+    """
+    auth_params = {
+        "client_id": client_id,
+        "redirect_uri": get_callback_url(),
+        "scope": " ".join(scopes),
+    }
+
+    # Add response_type for OAuth 2.0 (GitHub doesn't require it)
+    if "github.com" not in auth_config.authorize_url:
+        auth_params["response_type"] = "code"
+
+    return f"{auth_config.authorize_url}?{urlencode(auth_params)}"
 
 
 def validate_oauth_credentials(server_id: str) -> bool:
@@ -95,11 +202,31 @@ def validate_oauth_credentials(server_id: str) -> bool:
     if auth_config.type.value != "oauth":
         return False
 
-    # Resolve credentials from environment variables
-    client_id = os.getenv(auth_config.client_id_env) if auth_config.client_id_env else None
-    client_secret = os.getenv(auth_config.client_secret_env) if auth_config.client_secret_env else None
+    return get_oauth_credentials(auth_config) is not None
 
-    return bool(client_id and client_secret)
+
+def get_oauth_credentials(auth_config) -> Optional[Tuple[str, str]]:
+    """Resolve OAuth client credentials from the environment, caching hits.
+
+    Only resolved credentials are cached, so setting missing variables later
+    still takes effect without a restart; changing set ones needs
+    clear_oauth_caches() or a registry reload.
+
+    Args:
+        auth_config: MCPAuthConfig instance
+
+    Returns:
+        (client_id, client_secret), or None if either is not set
+    """
+    key = (auth_config.client_id_env, auth_config.client_secret_env)
+    credentials = _credentials_cache.get(key)
+    if credentials is None:
+        client_id = os.getenv(auth_config.client_id_env) if auth_config.client_id_env else None
+        client_secret = os.getenv(auth_config.client_secret_env) if auth_config.client_secret_env else None
+        if not client_id or not client_secret:
+            return None
+        credentials = _credentials_cache[key] = (client_id, client_secret)
+    return credentials
 
 
 # ============================================
@@ -125,7 +252,7 @@ async def initiate_oauth(request: InitiateOAuthRequest):
         raise HTTPException(status_code=404, detail=f"Server {request.server_id} not found in registry")
 
     # Check if server requires OAuth (SSE/HTTP transport with auth)
-    if server.transport not in ["sse", "http"] or not server.auth:
+    if server.transport not in REMOTE_TRANSPORTS or not server.auth:
         raise HTTPException(
             status_code=400,
             detail=f"Server {request.server_id} does not require OAuth (STDIO server)"
@@ -136,21 +263,15 @@ async def initiate_oauth(request: InitiateOAuthRequest):
     if not auth_config or auth_config.type.value != "oauth":
         raise HTTPException(status_code=500, detail=f"OAuth not configured for {request.server_id}")
 
-    # Validate OAuth credentials are set
-    if not validate_oauth_credentials(request.server_id):
+    # Resolve OAuth credentials (cached after the first successful lookup)
+    credentials = get_oauth_credentials(auth_config)
+    if not credentials:
         raise HTTPException(
             status_code=500,
             detail=f"OAuth credentials not configured for {request.server_id}. "
                    f"Set {auth_config.client_id_env} and {auth_config.client_secret_env}"
         )
-
-    # Resolve OAuth credentials from environment
-    client_id = os.getenv(auth_config.client_id_env)
-    if not client_id:
-        raise HTTPException(
-            status_code=500,
-            detail=f"OAuth client_id not found in environment variable {auth_config.client_id_env}"
-        )
+    client_id = credentials[0]
 
     # Generate state token for CSRF protection
     state_token = secrets.token_urlsafe(32)
@@ -165,30 +286,30 @@ async def initiate_oauth(request: InitiateOAuthRequest):
     )
 
     # Build authorization URL
-    callback_url = get_callback_url()
-    scopes = request.scopes or auth_config.scopes
-
     if not auth_config.authorize_url:
         raise HTTPException(
             status_code=500,
             detail=f"OAuth authorize_url not configured for {request.server_id}"
         )
 
-    auth_params = {
-        "client_id": client_id,
-        "redirect_uri": callback_url,
-        "state": state_token,
-        "scope": " ".join(scopes),
-    }
-
-    # Add response_type for OAuth 2.0
-    if "github.com" in auth_config.authorize_url:
-        # GitHub doesn't require response_type
-        pass
+    if request.scopes:
+        prefix = _build_auth_url_prefix(auth_config, client_id, request.scopes)
     else:
-        auth_params["response_type"] = "code"
+        # Default scopes: everything but the state token is fixed until the server
+        # config, credentials or callback URL change (all part of the key)
+        prefix_key = (
+            request.server_id,
+            client_id,
+            auth_config.authorize_url,
+            tuple(auth_config.scopes),
+            get_callback_url(),
+        )
+        prefix = _auth_url_prefixes.get(prefix_key)
+        if prefix is None:
+            prefix = _build_auth_url_prefix(auth_config, client_id, auth_config.scopes)
+            _auth_url_prefixes[prefix_key] = prefix
 
-    auth_url = f"{auth_config.authorize_url}?{urlencode(auth_params)}"
+    auth_url = f"{prefix}&state={quote_plus(state_token)}"
 
     logger.info(f"Created OAuth session {session_id}, redirecting to: {auth_url}")
 
@@ -227,20 +348,16 @@ async def oauth_callback(
     # Find session by state token
     db = get_db()
 
-    # Get session - we need to query by state token
-    # Note: This is a simplified version; in production, add index on state_token
-    with db.engine.connect() as conn:
-        from sqlalchemy import text
-        result = conn.execute(
-            text("SELECT session_id, user_id, server_id FROM mcp_auth_sessions WHERE state_token = :state"),
-            {"state": state}
-        ).fetchone()
-
-        if not result:
-            logger.error(f"Invalid state token: {state}")
-            return _render_error_page("Invalid or expired session")
+    # Lookup uses the indexed state_hash column (migration 004).
+    # DB calls are synchronous; run them in a worker thread to keep the loop free.
+    session = await asyncio.to_thread(db.get_auth_session_by_state, state)
+    if not session:
+        logger.error(f"Invalid state token: {state}")
+        return _render_error_page("Invalid or expired session")
 
-        session_id, user_id, server_id = result
+    session_id = session["session_id"]
+    user_id = session["user_id"]
+    server_id = session["server_id"]
 
     logger.info(f"Found session {session_id} for user {user_id}, server {server_id}")
 
@@ -249,7 +366,10 @@ async def oauth_callback(
     server = registry.get_server(server_id)
     if not server or not server.auth or server.auth.type.value != "oauth":
         logger.error(f"OAuth config not found for {server_id}")
-        db.update_auth_session_status(session_id, "error", "OAuth configuration not found")
+        await asyncio.to_thread(
+            db.update_auth_session_status, session_id, "error", "OAuth configuration not found"
+        )
+        _notify_session_waiters(session_id)
         return _render_error_page("OAuth configuration error")
 
     auth_config = server.auth
@@ -264,22 +384,25 @@ async def oauth_callback(
 
         logger.info(f"Successfully exchanged code for token, server: {server_id}")
 
-        # Store token
-        db.store_oauth_token(
-            user_id=user_id,
-            server_id=server_id,
-            access_token=token_data["access_token"],
-            refresh_token=token_data.get("refresh_token"),
-            token_type=token_data.get("token_type", "Bearer"),
-            expires_in=token_data.get("expires_in"),
-            scope=token_data.get("scope"),
-        )
-
-        # Create user connection
-        db.create_user_connection(user_id=user_id, server_id=server_id)
-
-        # Update session status
-        db.update_auth_session_status(session_id, "completed")
+        # Store token, create user connection and mark the session completed
+        try:
+            await asyncio.to_thread(
+                db.complete_oauth_flow,
+                session_id=session_id,
+                user_id=user_id,
+                server_id=server_id,
+                access_token=token_data["access_token"],
+                refresh_token=token_data.get("refresh_token"),
+                token_type=token_data.get("token_type", "Bearer"),
+                expires_in=token_data.get("expires_in"),
+                scope=token_data.get("scope"),
+            )
+        except AuthSessionNotPendingError:
+            # Expired or replayed callback: keep the session's status, store nothing
+            logger.warning(f"Auth session {session_id} is no longer pending; ignoring callback")
+            _notify_session_waiters(session_id)
+            return _render_error_page("Invalid or expired session")
+        _notify_session_waiters(session_id)
 
         logger.info(f"OAuth flow completed for user {user_id}, server {server_id}")
 
@@ -287,31 +410,62 @@ async def oauth_callback(
 
     except Exception as e:
         logger.error(f"Error exchanging code for token: {e}", exc_info=True)
-        db.update_auth_session_status(session_id, "error", str(e))
+        await asyncio.to_thread(db.update_auth_session_status, session_id, "error", str(e))
+        _notify_session_waiters(session_id)
         return _render_error_page(f"Failed to complete authorization: {str(e)}")
 
 
 @router.get("/auth/status/{session_id}", response_model=AuthStatusResponse)
-async def get_auth_status(session_id: str):
+async def get_auth_status(
+    session_id: str,
+    wait: int = Query(
+        0, ge=0, le=MAX_STATUS_WAIT_SECONDS,
+        description="Seconds to hold the request while the session is pending (long polling)",
+    ),
+):
     """Get OAuth session status (for CLI polling).
 
+    With ``wait`` > 0, a pending session is held open until the OAuth callback
+    completes or the wait elapses, then the current status is returned. The
+    session is re-read every ``STATUS_RECHECK_SECONDS`` in case another worker
+    handled the callback.
+
     Args:
         session_id: OAuth session identifier
+        wait: Maximum seconds to wait for a pending session to change
 
     Returns:
         Session status
     """
     db = get_db()
-    session = db.get_auth_session(session_id)
-
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    # Check if expired
-    from datetime import datetime
-    if session["expires_at"] < datetime.now() and session["status"] == "pending":
-        db.update_auth_session_status(session_id, "expired")
-        session["status"] = "expired"
+    # Register before the first read so a callback finishing during it still wakes us
+    event = _add_session_waiter(session_id) if wait else None
+    try:
+        # Overdue pending sessions are flipped to expired by the same query
+        session = await asyncio.to_thread(db.get_auth_session_status, session_id)
+
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        if event is not None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + wait
+            while session["status"] == "pending":
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    async with asyncio.timeout(min(STATUS_RECHECK_SECONDS, remaining)):
+                        await event.wait()
+                except asyncio.TimeoutError:
+                    # The callback may have been handled by another worker; re-read the DB
+                    pass
+                session = await asyncio.to_thread(db.get_auth_session_status, session_id)
+                if event.is_set():
+                    break
+    finally:
+        if event is not None:
+            _remove_session_waiter(session_id)
 
     return AuthStatusResponse(
         status=session["status"],
@@ -321,6 +475,29 @@ async def get_auth_status(session_id: str):
     )
 
 
+def _add_session_waiter(session_id: str) -> asyncio.Event:
+    """Register a long-polling status request and return the event it waits on."""
+    _session_waiter_counts[session_id] = _session_waiter_counts.get(session_id, 0) + 1
+    return _session_events.setdefault(session_id, asyncio.Event())
+
+
+def _remove_session_waiter(session_id: str) -> None:
+    """Unregister a status request; the session's event goes with its last waiter."""
+    remaining = _session_waiter_counts[session_id] - 1
+    if remaining:
+        _session_waiter_counts[session_id] = remaining
+    else:
+        del _session_waiter_counts[session_id]
+        _session_events.pop(session_id, None)
+
+
+def _notify_session_waiters(session_id: str) -> None:
+    """Wake long-polling status requests waiting on a session."""
+    event = _session_events.pop(session_id, None)
+    if event is not None:
+        event.set()
+
+
 # ============================================
 # Connection Management Endpoints
 # ============================================
@@ -367,80 +544,97 @@ async def disconnect_server(
 # ============================================
 
 @router.get("/catalog")
-async def get_catalog():
+async def get_catalog(request: Request):
     """Get available MCP servers from registry.
 
+    Args:
+        request: Incoming request (checked for If-None-Match)
+
     Returns:
-        List of server definitions
+        List of server definitions (304 if the client's ETag is current)
     """
     registry = get_registry()
-    server_ids = registry.list_server_ids()
-
-    servers = []
-    for server_id in server_ids:
-        server_config = registry.get_server(server_id)
-        if server_config:
-            # Convert MCPServerConfig to dict format expected by API
-            # OAuth servers require authentication (SSE/HTTP transport + OAuth auth)
-            requires_auth = (
-                server_config.transport in ["sse", "http"] and
-                server_config.auth.type.value == "oauth"
-            )
-
-            server_dict = {
-                "id": server_config.id,
-                "name": server_config.id.replace("_", " ").title(),  # Generate name from ID
-                "description": server_config.description or f"{server_config.id} MCP server",
-                "transport": server_config.transport,
-                "requires_auth": requires_auth,
-                "url": server_config.url,
-                "command": server_config.command,
-                "enabled": True,  # All servers in registry are enabled
-            }
-            servers.append(server_dict)
-
-    return servers
+    body, etag = _get_catalog_body(registry, None, registry.list_server_api_dicts)
+    return _cached_json_response(request, body, etag)
 
 
 @router.get("/catalog/{server_id}")
-async def get_server_info(server_id: str):
+async def get_server_info(server_id: str, request: Request):
     """Get detailed information about an MCP server.
 
     Args:
         server_id: Server identifier
+        request: Incoming request (checked for If-None-Match)
 
     Returns:
-        Server definition
+        Server definition (304 if the client's ETag is current)
     """
     registry = get_registry()
-    server = registry.get_server(server_id)
-    if not server:
+    server_dict = registry.get_server_api_dict(server_id)
+    if not server_dict:
         raise HTTPException(status_code=404, detail=f"Server {server_id} not found")
 
-    # OAuth servers require authentication (SSE/HTTP transport + OAuth auth)
-    requires_auth = (
-        server.transport in ["sse", "http"] and
-        server.auth.type.value == "oauth"
-    )
+    body, etag = _get_catalog_body(registry, server_id, lambda: server_dict)
+    return _cached_json_response(request, body, etag)
 
-    # Convert MCPServerConfig to dict format expected by API
-    return {
-        "id": server.id,
-        "name": server.id.replace("_", " ").title(),
-        "description": server.description or f"{server.id} MCP server",
-        "transport": server.transport,
-        "requires_auth": requires_auth,
-        "url": server.url,
-        "command": server.command,
-        "enabled": True,
-    }
+
+def _get_catalog_body(
+    registry: MCPServerRegistry,
+    key: Optional[str],
+    build: Callable[[], Any],
+) -> Tuple[bytes, str]:
+    """Return the serialized catalog body and its ETag, serializing on first use.
+
+    Args:
+        registry: Registry the payload is derived from
+        key: Server ID, or None for the full catalog
+        build: Returns the payload to serialize on a cache miss
+
+    Returns:
+        (JSON body, quoted ETag)
+    """
+    global _catalog_registry
+    if _catalog_registry is not registry:
+        # Registry was reset or reloaded; drop bodies derived from the old one
+        _catalog_bodies.clear()
+        _catalog_registry = registry
+
+    cached = _catalog_bodies.get(key)
+    if cached is None:
+        body = json.dumps(
+            jsonable_encoder(build()), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        cached = _catalog_bodies[key] = (body, etag)
+    return cached
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag`` (RFC 9110 section 13.1.2).
+
+    ``*`` matches any current representation; otherwise the header is a list of
+    entity tags compared weakly, so ``W/"x"`` matches ``"x"``.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in _ETAG_RE.findall(if_none_match)
+
+
+def _cached_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Build a cacheable JSON response, or 304 if If-None-Match matches the ETag."""
+    headers = {"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 # ============================================
 # Testing Endpoints
 # ============================================
 
-@router.get("/test/{server_id}")
+@router.get("/test/{server_id}", response_class=ORJSONResponse)
 async def test_connection(
     server_id: str,
     user_id: str = Query(..., description="User identifier")
@@ -455,35 +649,26 @@ async def test_connection(
         Connection status and available tools
     """
     try:
-        from src.agent_framework.mcp.clients.sse import SSEMCPClientFactory
-
         # Create SSE client
         client = SSEMCPClientFactory.create_client(server_id, user_id)
 
         async with client:
-            # Try to list tools
-            tools = await client.list_tools()
-
-            # Get token info
+            # List tools and fetch token info concurrently (independent I/O)
             db = get_db()
-            token_data = db.get_oauth_token(user_id, server_id)
+            tools, token_data = await asyncio.gather(
+                client.list_tools(),
+                asyncio.to_thread(db.get_oauth_token, user_id, server_id),
+            )
 
             token_expires = None
             if token_data and token_data.get("expires_at"):
                 token_expires = token_data["expires_at"].isoformat()
 
-            return {
+            return ORJSONResponse({
                 "status": "success",
-                "tools": [
-                    {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "input_schema": tool.input_schema,
-                    }
-                    for tool in tools
-                ],
+                "tools": _tools_to_api(tools),
                 "token_expires_at": token_expires,
-            }
+            })
 
     except ValueError as e:
         # User-friendly errors (token expired, not connected, etc.)
@@ -503,7 +688,7 @@ async def test_connection(
         }
 
 
-@router.get("/tools/{server_id}")
+@router.get("/tools/{server_id}", response_class=ORJSONResponse)
 async def list_server_tools(
     server_id: str,
     user_id: str = Query(..., description="User identifier")
@@ -518,21 +703,13 @@ async def list_server_tools(
         List of tool definitions
     """
     try:
-        from src.agent_framework.mcp.clients.sse import SSEMCPClientFactory
-
         client = SSEMCPClientFactory.create_client(server_id, user_id)
 
         async with client:
             tools = await client.list_tools()
 
-            return [
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "input_schema": tool.input_schema,
-                }
-                for tool in tools
-            ]
+            # Tool schemas can be large and nested; orjson serializes them much faster
+            return ORJSONResponse(_tools_to_api(tools))
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -545,6 +722,11 @@ async def list_server_tools(
 # Helper Functions
 # ============================================
 
+def _tools_to_api(tools: List[MCPToolInfo]) -> List[Dict[str, Any]]:
+    """Convert tool descriptors to the name/description/input_schema dicts served by the API."""
+    return [tool.model_dump() for tool in tools]
+
+
 async def _exchange_code_for_token(
     auth_config,
     code: str,
@@ -566,12 +748,10 @@ async def _exchange_code_for_token(
     if not auth_config.token_url:
         raise Exception("OAuth token_url not configured")
 
-    # Resolve OAuth credentials from environment
-    client_id = os.getenv(auth_config.client_id_env) if auth_config.client_id_env else None
-    client_secret = os.getenv(auth_config.client_secret_env) if auth_config.client_secret_env else None
-
-    if not client_id or not client_secret:
+    credentials = get_oauth_credentials(auth_config)
+    if not credentials:
         raise Exception("OAuth credentials not found in environment")
+    client_id, client_secret = credentials
 
     data = {
         "client_id": client_id,
@@ -589,19 +769,19 @@ async def _exchange_code_for_token(
         "Content-Type": "application/x-www-form-urlencoded",
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(auth_config.token_url, data=data, headers=headers)
+    client = get_http_client()
+    response = await client.post(auth_config.token_url, data=data, headers=headers)
 
-        if response.status_code != 200:
-            logger.error(f"Token exchange failed: {response.status_code} - {response.text}")
-            raise Exception(f"Token exchange failed: {response.status_code}")
+    if response.status_code != 200:
+        logger.error(f"Token exchange failed: {response.status_code} - {response.text}")
+        raise Exception(f"Token exchange failed: {response.status_code}")
 
-        token_data = response.json()
+    token_data = response.json()
 
-        if "error" in token_data:
-            raise Exception(f"OAuth error: {token_data.get('error_description', token_data['error'])}")
+    if "error" in token_data:
+        raise Exception(f"OAuth error: {token_data.get('error_description', token_data['error'])}")
 
-        return token_data
+    return token_data
 
 
 def _render_success_page(server_name: str) -> HTMLResponse:
@@ -613,170 +793,47 @@ def _render_success_page(server_name: str) -> HTMLResponse:
     Returns:
         HTML response
     """
-    html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Connected - AgentShip</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%);
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: #e2e8f0;
-        }}
-        .container {{
-            width: 100%;
-            max-width: 500px;
-            padding: 20px;
-        }}
-        .card {{
-            background: #1e293b;
-            border-radius: 16px;
-            padding: 40px;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-            border: 1px solid #334155;
-            text-align: center;
-        }}
-        .success-icon {{
-            width: 80px;
-            height: 80px;
-            border-radius: 50%;
-            background: rgba(20, 184, 166, 0.2);
-            color: #14b8a6;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 48px;
-            margin: 0 auto 24px;
-        }}
-        h1 {{
-            font-size: 28px;
-            margin-bottom: 16px;
-            color: #f1f5f9;
-        }}
-        p {{
-            color: #94a3b8;
-            margin-bottom: 12px;
-            line-height: 1.6;
-        }}
-        .small {{
-            font-size: 14px;
-            color: #64748b;
-        }}
-    </style>
-    <script>
-        setTimeout(() => {{
-            window.close();
-        }}, 3000);
-    </script>
-</head>
-<body>
-    <div class="container">
-        <div class="card">
-            <div class="success-icon">✓</div>
-            <h1>Successfully Connected!</h1>
-            <p>Your {server_name} account has been connected to AgentShip.</p>
-            <p class="small">You can close this window and return to your terminal.</p>
-            <p class="small">This window will close automatically in 3 seconds...</p>
-        </div>
-    </div>
-</body>
-</html>
-    """
-    return HTMLResponse(content=html)
+    return HTMLResponse(
+        content=_SUCCESS_PAGE_PREFIX + html.escape(server_name).encode("utf-8") + _SUCCESS_PAGE_SUFFIX
+    )
 
 
 def _render_error_page(error_message: str) -> HTMLResponse:
     """Render OAuth error page.
 
     Args:
-        error_message: Error message to display
+        error_message: Error message to display (HTML-escaped)
 
     Returns:
         HTML response
     """
-    html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Error - AgentShip</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%);
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: #e2e8f0;
-        }}
-        .container {{
-            width: 100%;
-            max-width: 500px;
-            padding: 20px;
-        }}
-        .card {{
-            background: #1e293b;
-            border-radius: 16px;
-            padding: 40px;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-            border: 1px solid #334155;
-            text-align: center;
-        }}
-        .error-icon {{
-            width: 80px;
-            height: 80px;
-            border-radius: 50%;
-            background: rgba(239, 68, 68, 0.2);
-            color: #ef4444;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 48px;
-            margin: 0 auto 24px;
-        }}
-        h1 {{
-            font-size: 28px;
-            margin-bottom: 16px;
-            color: #f1f5f9;
-        }}
-        p {{
-            color: #94a3b8;
-            margin-bottom: 12px;
-            line-height: 1.6;
-        }}
-        .error-message {{
-            background: rgba(239, 68, 68, 0.1);
-            border: 1px solid #ef4444;
-            border-radius: 8px;
-            padding: 12px;
-            color: #fca5a5;
-            font-family: monospace;
-            font-size: 14px;
-            margin: 20px 0;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="card">
-            <div class="error-icon">✕</div>
-            <h1>Connection Failed</h1>
-            <div class="error-message">{error_message}</div>
-            <p>Please close this window and try again.</p>
-        </div>
-    </div>
-</body>
-</html>
+    return HTMLResponse(
+        content=_ERROR_PAGE_PREFIX + html.escape(error_message).encode("utf-8") + _ERROR_PAGE_SUFFIX
+    )
+
+
+# ============================================
+# HTML Pages
+# ============================================
+# Pages are bundled as static files, read once at import and split around their
+# single placeholder, so rendering is one escape + concatenation per request.
+
+_OAUTH_PAGES_DIR = Path(__file__).parent / "static" / "oauth"
+
+
+def _load_page(name: str, placeholder: str) -> Tuple[bytes, bytes]:
+    """Read a bundled page and split it around its placeholder.
+
+    Args:
+        name: File name under static/oauth
+        placeholder: Placeholder text that appears exactly once in the page
+
+    Returns:
+        (prefix, suffix) bytes
     """
-    return HTMLResponse(content=html)
+    prefix, suffix = (_OAUTH_PAGES_DIR / name).read_bytes().split(placeholder.encode("utf-8"))
+    return prefix, suffix
+
+
+_SUCCESS_PAGE_PREFIX, _SUCCESS_PAGE_SUFFIX = _load_page("success.html", "{server_name}")
+_ERROR_PAGE_PREFIX, _ERROR_PAGE_SUFFIX = _load_page("error.html", "{error_message}")
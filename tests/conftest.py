@@ -2,6 +2,7 @@
 
 import logging
 import pytest
+import pytest_asyncio
 import json
 from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock, patch
@@ -55,10 +56,97 @@ def mock_runner(mock_runner_response):
     """Create a mock Google ADK Runner that returns a fake response."""
     
     def create_mock_run(output_data: dict):
-        """Create a mock run() method that yields a response with the given output."""
-        def mock_run(user_id: str, session_id: str, new_message):
-            """Mock runner.run() that yields a fake response."""
+        """Create a mock run_async() method that yields a response with the given output."""
+        async def mock_run(user_id: str, session_id: str, new_message, **kwargs):
+            """Mock runner.run_async() that yields a fake response."""
             yield mock_runner_response(output_data)
         return mock_run
     
     return create_mock_run
+
+
+@pytest.fixture(scope="session")
+def mcp_cfg_dir(tmp_path_factory):
+    """Session directory holding the MCP settings files shared by the config tests."""
+    return tmp_path_factory.mktemp("mcp_cfg", numbered=False)
+
+
+@pytest.fixture(scope="session")
+def fs_mcp_file(mcp_cfg_dir):
+    """MCP settings (JSON) with a single stdio filesystem server ``fs``."""
+    path = mcp_cfg_dir / "fs.mcp.settings.json"
+    path.write_text(
+        json.dumps({
+            "servers": {
+                "fs": {
+                    "transport": "stdio",
+                    "command": ["npx", "-y", "@modelcontextprotocol/server-filesystem"],
+                    "env": {"MCP_FILESYSTEM_ROOT": "/global/path"},
+                    "timeout": 30,
+                },
+            }
+        }),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def github_mcp_file(mcp_cfg_dir):
+    """MCP settings (JSON) with a single SSE server ``github``."""
+    path = mcp_cfg_dir / "github.mcp.settings.json"
+    path.write_text(
+        json.dumps({
+            "servers": {
+                "github": {"transport": "sse", "url": "https://mcp.github.com/sse"},
+            }
+        }),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def db_mcp_file(mcp_cfg_dir):
+    """MCP settings (YAML) with a single HTTP server ``db``."""
+    path = mcp_cfg_dir / "mcp_servers.yaml"
+    path.write_text(
+        "servers:\n  db:\n    transport: http\n    url: https://mcp.db.example.com\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def build_agent(agent_cls):
+    """Construct an agent for a module- or session-scoped fixture.
+
+    The function-scoped autouse overrides above don't apply to wider-scoped
+    fixtures, so the same overrides are applied here while the agent is built.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.agent_framework.factories.observability_factory.ObservabilityFactory.create_observer", lambda agent_config: None)
+        mp.setenv("AGENT_SHORT_TERM_MEMORY", "InMemory")
+        return agent_cls()
+
+
+@pytest.fixture(scope="session")
+def postgres_agent():
+    """Shared PostgresAdkMcpAgent for the live Postgres MCP tests, built once per session."""
+    from src.all_agents.postgres_adk_mcp_agent.main_agent import PostgresAdkMcpAgent
+
+    return build_agent(PostgresAdkMcpAgent)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def mcp_manager():
+    """MCPClientManager for the live MCP scripts, one per module.
+
+    Clients (and their server subprocesses) are reused across a module's tests
+    and closed at the end of the module, on the loop they were opened on. Both
+    scripts run on a module-scoped loop so they can pick its policy (uvloop).
+    """
+    from src.agent_framework.mcp.client_manager import MCPClientManager
+
+    manager = MCPClientManager.get_instance()
+    yield manager
+    await manager.close_all()
@@ -1,17 +1,38 @@
 """Shared fixtures for integration tests."""
 
+import asyncio
+import functools
+import importlib
+import json
 import os
 import pathlib
+import re
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a project dependency
+    orjson = None
 
 from src.agent_framework.mcp.client_manager import MCPClientManager
 from src.agent_framework.mcp.registry import MCPServerRegistry
 from src.agent_framework.registry import clear_cache as clear_agent_cache
+from src.agent_framework.registry import discover_agents, get_agent_instance, list_agents
+
+# libyaml-backed loader when available; same output as SafeLoader, parsed in C.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Top-level ``agent_name: <name>`` line; the full YAML parse is only a fallback.
+_AGENT_NAME_RE = re.compile(rb'^agent_name\s*:\s*["\']?([\w\-]+)', re.M)
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> pathlib.Path:
     """Find project root by locating pyproject.toml."""
     current = pathlib.Path(__file__).resolve()
@@ -46,12 +67,124 @@ def reset_mcp_singletons():
 
 @pytest.fixture(autouse=True)
 def reset_agent_instance_cache():
-    """Clear agent singleton instances before each test."""
+    """Clear agent singleton and sub-agent instances before each test."""
+    clear_agent_cache()
+    yield
     clear_agent_cache()
+
+
+# ---------------------------------------------------------------------------
+# Agent discovery (session-scoped: discovery results never change mid-run)
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session", autouse=True)
+def _discover_once():
+    """Run agent auto-discovery over src/all_agents once for the whole session."""
+    with project_root_cwd():
+        discover_agents("src/all_agents")
     yield
     clear_agent_cache()
 
 
+@pytest.fixture(scope="session")
+def discovered_agent_names(_discover_once) -> frozenset:
+    """Names registered by the session's auto-discovery pass."""
+    return frozenset(list_agents())
+
+
+def _read_agent_name(yaml_path: pathlib.Path):
+    """Return the top-level agent_name declared in *yaml_path*, or None."""
+    try:
+        data = yaml_path.read_bytes()
+        match = _AGENT_NAME_RE.search(data)
+        if match:
+            return match.group(1).decode()
+        parsed = yaml.load(data, Loader=Loader)
+        if isinstance(parsed, dict) and "agent_name" in parsed:
+            return parsed["agent_name"]
+    except Exception:
+        pass
+    return None
+
+
+def _iter_main_agent_yamls(root: pathlib.Path):
+    """Yield every *main_agent.yaml* under *root* (os.walk: no Path per entry)."""
+    for dirpath, _dirnames, filenames in os.walk(root):
+        if "main_agent.yaml" in filenames:
+            yield pathlib.Path(dirpath, "main_agent.yaml")
+
+
+# Engine construction (ADK runners, LangGraph graphs) dominates these tests, so
+# the agents they exercise are built once and shared. Tests patch the engine
+# with ``patch``/``patch.object`` context managers, which restore on exit.
+
+@pytest.fixture(scope="session")
+def translation_agent(_discover_once):
+    """Shared translation_agent (ADK) instance."""
+    return get_agent_instance("translation_agent")
+
+
+@pytest.fixture(scope="session")
+def personal_assistant_agent(_discover_once):
+    """Shared personal_assistant_agent (LangGraph) instance."""
+    return get_agent_instance("personal_assistant_agent")
+
+
+@pytest.fixture(scope="session")
+def database_agent(_discover_once):
+    """Shared database_agent (ADK, tool pattern) instance."""
+    return get_agent_instance("database_agent")
+
+
+@functools.cache
+def load_yaml_agent_names() -> dict:
+    """Return {yaml_file_path: agent_name} for every *main_agent.yaml* found.
+
+    We only look at `main_agent.yaml` (the canonical per-agent config), not
+    sub-agent YAMLs inside orchestrator subdirectories, because the discovery
+    system maps each Python file to the first YAML it finds in that directory
+    and sub-agent files may share a directory with a different YAML.
+
+    Cached: the agents tree does not change during a run, so this is usable
+    outside fixtures (e.g. at collection time) at no extra cost. Callers must
+    treat the result as read-only; ``load_yaml_agent_names.cache_clear()``
+    invalidates it.
+    """
+    paths = tuple(_iter_main_agent_yamls(get_project_root() / "src" / "all_agents"))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        names = executor.map(_read_agent_name, paths)
+        return {
+            str(yaml_path): name
+            for yaml_path, name in zip(paths, names)
+            if name is not None
+        }
+
+
+@pytest.fixture(scope="session")
+def yaml_agent_names() -> dict:
+    """Session view of :func:`load_yaml_agent_names`."""
+    return load_yaml_agent_names()
+
+
+@pytest.fixture(scope="session")
+def mcp_registry() -> MCPServerRegistry:
+    """Project MCP server registry, loaded from the repo config once per session.
+
+    Built directly rather than via ``get_instance()`` so the per-test singleton
+    reset above does not discard it.
+    """
+    with project_root_cwd():
+        return MCPServerRegistry()
+
+
+def write_json(path: pathlib.Path, data) -> None:
+    """Write *data* as JSON to *path* (orjson when available)."""
+    if orjson is not None:
+        pathlib.Path(path).write_bytes(orjson.dumps(data))
+    else:
+        pathlib.Path(path).write_text(json.dumps(data), encoding="utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Skip helpers
 # ---------------------------------------------------------------------------
@@ -72,6 +205,19 @@ def require_postgres():
     )
 
 
+def uvloop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """uvloop's event loop policy, or the default one when uvloop is not installed.
+
+    For modules that override ``event_loop_policy`` to run their (module-scoped)
+    loop on uvloop, e.g. the stdio MCP scripts.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
+
+
 def require_auth_db():
     """pytest.mark.skipif — skips if AGENTSHIP_AUTH_DB_URI not set."""
     return pytest.mark.skipif(
@@ -80,6 +226,71 @@ def require_auth_db():
     )
 
 
+# ---------------------------------------------------------------------------
+# Response helpers
+# ---------------------------------------------------------------------------
+
+def coerce_response(agent_response) -> str:
+    """Agent response as text: the output model's ``response`` field, else ``str()``."""
+    return getattr(agent_response, "response", None) or str(agent_response)
+
+
+def assert_no_agent_error(result) -> None:
+    """Fail if the agent answered with its generic error message."""
+    response_text = coerce_response(result.agent_response)
+    response_lower = response_text.lower()
+    assert not ("error" in response_lower and "encountered an error" in response_lower), (
+        f"Response contains error message: {response_text[:500]}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Stream helpers
+# ---------------------------------------------------------------------------
+
+async def collect_events(stream) -> list:
+    """Drain an agent event stream into a list."""
+    return [event async for event in stream]
+
+
+async def collect_types(stream) -> list:
+    """Drain an agent event stream, keeping only each event's ``type``."""
+    return [event.get("type") async for event in stream]
+
+
+async def summarize_stream(stream) -> tuple:
+    """Fold an agent event stream into ``(last_type, seen_types)``.
+
+    For assertions that only need the final event type and which types
+    occurred, without holding every event in memory.
+    """
+    last = None
+    seen = set()
+    async for event in stream:
+        last = event.get("type")
+        seen.add(last)
+    return last, seen
+
+
+async def run_streams(pairs, collect=collect_types) -> list:
+    """Drain ``agent.chat_stream(request)`` for each ``(agent, request)`` pair concurrently.
+
+    Results are returned in the order of *pairs*.
+    """
+    return await asyncio.gather(*(collect(agent.chat_stream(request)) for agent, request in pairs))
+
+
+def async_mock_run(*events):
+    """Return a ``Runner.run_async`` stand-in that yields *events* asynchronously."""
+
+    # Runner.run() forwards state_delta/run_config too, so accept the full signature
+    async def _run_async(user_id, session_id, new_message, **kwargs):
+        for event in events:
+            yield event
+
+    return _run_async
+
+
 # ---------------------------------------------------------------------------
 # LangGraph LLM mock factory
 # ---------------------------------------------------------------------------
@@ -119,6 +330,23 @@ def mock_langgraph_llm():
     return _make_mock
 
 
+@pytest.fixture(scope="session")
+def langgraph_engine_module():
+    """The LangGraph engine module, resolved once for ``patch.object``."""
+    return importlib.import_module("src.agent_framework.engines.langgraph.engine")
+
+
+@pytest.fixture
+def langgraph_acompletion(langgraph_engine_module):
+    """Patch the LangGraph engine's ``acompletion`` for the whole test.
+
+    Tests configure the yielded mock directly (``side_effect`` /
+    ``return_value``) instead of entering their own ``patch(...)``.
+    """
+    with patch.object(langgraph_engine_module, "acompletion") as mock_acompletion:
+        yield mock_acompletion
+
+
 # ---------------------------------------------------------------------------
 # ADK runner mock factory
 # ---------------------------------------------------------------------------
@@ -133,21 +361,15 @@ def mock_adk_runner():
             import json
             from types import SimpleNamespace
             mock_run = mock_adk_runner({"translated_text": "Hola"})
-            with patch.object(agent.engine.runner, 'run', mock_run):
+            with patch.object(agent.engine.runner, 'run_async', mock_run):
                 result = await agent.chat(request)
     """
-    import json
-    from types import SimpleNamespace
-
     def _make_run(output_data: dict):
         text = json.dumps(output_data)
         part = SimpleNamespace(text=text)
         content = SimpleNamespace(parts=[part])
         event = SimpleNamespace(content=content)
 
-        def _run(user_id, session_id, new_message):
-            yield event
-
-        return _run
+        return async_mock_run(event)
 
     return _make_run
@@ -5,27 +5,19 @@ The GitHub MCP server requires OAuth — these tests verify the infrastructure
 """
 
 import os
-import json
 
 import pytest
 
 from src.agent_framework.mcp.client_manager import MCPClientManager
 from src.agent_framework.mcp.models import MCPServerConfig, MCPTransport, MCPAuthConfig, MCPAuthType
 from src.agent_framework.mcp.registry import MCPServerRegistry
-from src.agent_framework.registry import discover_agents, list_agents
-from tests.integration.conftest import project_root_cwd
+from tests.integration.conftest import write_json
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(scope="module", autouse=True)
-def discover_all_agents():
-    with project_root_cwd():
-        discover_agents("src/all_agents")
-
-
 @pytest.fixture
 def github_sse_config() -> MCPServerConfig:
     """Minimal GitHub HTTP/SSE config for testing (no DB or real credentials)."""
@@ -46,17 +38,17 @@ def github_sse_config() -> MCPServerConfig:
 # Registry: GitHub agents are registered
 # ---------------------------------------------------------------------------
 
-def test_github_adk_agent_is_registered():
+def test_github_adk_agent_is_registered(discovered_agent_names):
     """github_adk_mcp_agent is present in the global registry."""
-    agents = set(list_agents())
+    agents = discovered_agent_names
     assert "github_adk_mcp_agent" in agents, (
         f"Expected 'github_adk_mcp_agent' in registry, found: {sorted(agents)}"
     )
 
 
-def test_github_langgraph_agent_is_registered():
+def test_github_langgraph_agent_is_registered(discovered_agent_names):
     """github_langgraph_mcp_agent is present in the global registry."""
-    agents = set(list_agents())
+    agents = discovered_agent_names
     assert "github_langgraph_mcp_agent" in agents, (
         f"Expected 'github_langgraph_mcp_agent' in registry, found: {sorted(agents)}"
     )
@@ -66,12 +58,9 @@ def test_github_langgraph_agent_is_registered():
 # MCP server registry: github entry is loaded from config
 # ---------------------------------------------------------------------------
 
-def test_github_server_config_loaded():
+def test_github_server_config_loaded(mcp_registry):
     """The .mcp.settings.json 'github' entry is loaded with HTTP transport."""
-    with project_root_cwd():
-        registry = MCPServerRegistry.get_instance()
-
-    config = registry.get_server("github")
+    config = mcp_registry.get_server("github")
     if config is None:
         pytest.skip("'github' not found in .mcp.settings.json")
 
@@ -83,12 +72,9 @@ def test_github_server_config_loaded():
     )
 
 
-def test_github_server_has_oauth_auth():
+def test_github_server_has_oauth_auth(mcp_registry):
     """The github server config has OAuth auth configured."""
-    with project_root_cwd():
-        registry = MCPServerRegistry.get_instance()
-
-    config = registry.get_server("github")
+    config = mcp_registry.get_server("github")
     if config is None:
         pytest.skip("'github' not found in .mcp.settings.json")
 
@@ -158,7 +144,7 @@ def test_github_auth_env_var_names_not_resolved(tmp_path, monkeypatch):
             }
         }
     }
-    config_file.write_text(json.dumps(data))
+    write_json(config_file, data)
     monkeypatch.setenv("MCP_SERVERS_CONFIG", str(config_file))
 
     registry = MCPServerRegistry()
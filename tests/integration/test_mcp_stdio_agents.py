@@ -7,11 +7,11 @@ and `npx` installed. They are skipped in CI without those prerequisites.
 import os
 import pytest
 
-from src.agent_framework.registry import discover_agents, get_agent_instance
+from src.agent_framework.registry import get_agent_instance
 from src.agent_framework.mcp.client_manager import MCPClientManager
 from src.agent_framework.mcp.registry import MCPServerRegistry
 from src.service.models.base_models import AgentChatRequest
-from tests.integration.conftest import project_root_cwd, require_postgres
+from tests.integration.conftest import project_root_cwd, require_postgres, summarize_stream
 
 pytestmark = require_postgres()
 
@@ -20,12 +20,6 @@ pytestmark = require_postgres()
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(scope="module", autouse=True)
-def discover_all_agents():
-    with project_root_cwd():
-        discover_agents("src/all_agents")
-
-
 def _make_chat_request(agent_name: str, text: str) -> AgentChatRequest:
     return AgentChatRequest(
         agent_name=agent_name,
@@ -41,7 +35,6 @@ def _make_chat_request(agent_name: str, text: str) -> AgentChatRequest:
 # Tool discovery (no LLM call — just connects to MCP server and lists tools)
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
 async def test_postgres_mcp_tool_discovery_adk():
     """postgres_adk_mcp_agent can list tools from the postgres MCP server."""
     agent = get_agent_instance("postgres_adk_mcp_agent")
@@ -51,14 +44,12 @@ async def test_postgres_mcp_tool_discovery_adk():
     # This verifies tool discovery ran successfully without errors
 
 
-@pytest.mark.asyncio
 async def test_postgres_mcp_tool_discovery_langgraph():
     """postgres_langgraph_mcp_agent can list tools from the postgres MCP server."""
     agent = get_agent_instance("postgres_langgraph_mcp_agent")
     assert hasattr(agent, "engine"), "Agent should have an engine"
 
 
-@pytest.mark.asyncio
 async def test_mcp_client_no_cross_contamination():
     """ADK and LangGraph postgres agents each get their own MCP client (no sharing)."""
     manager = MCPClientManager.get_instance()
@@ -102,36 +93,28 @@ def test_env_var_connection_string():
     )
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OPENAI_API_KEY not set")
 async def test_postgres_mcp_query_adk():
     """postgres_adk_mcp_agent can execute a SELECT query via MCP (real LLM)."""
     agent = get_agent_instance("postgres_adk_mcp_agent")
     request = _make_chat_request("postgres_adk_mcp_agent", "List all tables in the database")
 
-    events = []
-    async for event in agent.chat_stream(request):
-        events.append(event)
+    last, seen = await summarize_stream(agent.chat_stream(request))
 
-    types = [e.get("type") for e in events]
-    assert "done" in types
-    assert types[-1] == "done"
+    assert "done" in seen
+    assert last == "done"
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="OPENAI_API_KEY not set")
 async def test_postgres_mcp_query_langgraph():
     """postgres_langgraph_mcp_agent executes a SELECT query via MCP (real LLM)."""
     agent = get_agent_instance("postgres_langgraph_mcp_agent")
     request = _make_chat_request("postgres_langgraph_mcp_agent", "List all tables")
 
-    events = []
-    async for event in agent.chat_stream(request):
-        events.append(event)
+    last, seen = await summarize_stream(agent.chat_stream(request))
 
-    types = [e.get("type") for e in events]
-    assert len(types) > 0, "Stream produced no events"
+    assert last is not None, "Stream produced no events"
     # Stream must end with 'done' or 'error' (the latter when MCP/LLM error occurs)
-    assert types[-1] in ("done", "error"), (
-        f"Expected last event to be 'done' or 'error', got: {types}"
+    assert last in ("done", "error"), (
+        f"Expected last event to be 'done' or 'error', got: {last!r}"
     )
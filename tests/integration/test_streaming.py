@@ -12,148 +12,142 @@ The content tests are the ones that catch bugs like:
 If a content assertion fails here, the Studio UI will show broken output.
 """
 
-import json
+import itertools
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.agent_framework.registry import discover_agents, get_agent_instance
 from src.service.models.base_models import AgentChatRequest
-from tests.integration.conftest import project_root_cwd
+from tests.integration.conftest import async_mock_run, collect_events, run_streams, summarize_stream
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(scope="module", autouse=True)
-def discover_all_agents():
-    with project_root_cwd():
-        discover_agents("src/all_agents")
+# Agents are shared across the session, so every request gets its own session.
+_session_ids = itertools.count()
 
 
 def _make_request(agent_name: str, query: dict | None = None) -> AgentChatRequest:
     return AgentChatRequest(
         agent_name=agent_name,
         user_id="stream-test-user",
-        session_id="stream-test-session",
+        session_id=f"stream-test-session-{next(_session_ids)}",
         sender="USER",
         query=query or {"text": "hello"},
         features=[],
     )
 
 
-def _adk_event(output_data: dict) -> SimpleNamespace:
-    text = json.dumps(output_data)
-    part = SimpleNamespace(text=text)
-    content = SimpleNamespace(parts=[part])
-    return SimpleNamespace(content=content)
-
-
 def _content_events(events: list) -> list:
     return [e for e in events if e.get("type") == "content"]
 
 
+# Requests are built once: chat()/chat_stream() never mutate them.
+TRANSLATE_FR_HELLO_REQUEST = _make_request(
+    "translation_agent",
+    {"text": "Hello", "from_language": "English", "to_language": "French"},
+)
+TRANSLATE_FR_HELLO_WORLD_REQUEST = _make_request(
+    "translation_agent",
+    {"text": "Hello world", "from_language": "English", "to_language": "French"},
+)
+TRANSLATE_ES_HELLO_REQUEST = _make_request(
+    "translation_agent",
+    {"text": "Hello", "from_language": "English", "to_language": "Spanish"},
+)
+ASSISTANT_SOMETHING_REQUEST = _make_request(
+    "personal_assistant_agent",
+    {"query": "Tell me something"},
+)
+ASSISTANT_HAIKU_REQUEST = _make_request("personal_assistant_agent", {"query": "Write me a haiku"})
+ASSISTANT_JOKE_REQUEST = _make_request("personal_assistant_agent", {"query": "Tell me a joke"})
+ASSISTANT_FAIL_REQUEST = _make_request("personal_assistant_agent", {"query": "This will fail"})
+ASSISTANT_MATH_REQUEST = _make_request("personal_assistant_agent", {"query": "What is 2+2?"})
+TRANSLATE_SHARED_REQUEST = _make_request(
+    "translation_agent",
+    {"text": "Shared response text", "from_language": "English", "to_language": "French"},
+)
+ASSISTANT_ANYTHING_REQUEST = _make_request("personal_assistant_agent", {"query": "anything"})
+
+
 # ---------------------------------------------------------------------------
 # ADK — event structure
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_adk_stream_event_sequence():
-    """ADK stream produces events ending with 'done'."""
-    agent = get_agent_instance("translation_agent")
-    event = _adk_event({"translated_text": "Bonjour"})
-
-    def mock_run(user_id, session_id, new_message):
-        yield event
-
-    with patch.object(agent.engine._inner.runner, "run", side_effect=mock_run):
-        request = _make_request(
-            "translation_agent",
-            {"text": "Hello", "from_language": "English", "to_language": "French"},
-        )
-        events = []
-        async for ev in agent.chat_stream(request):
-            events.append(ev)
-
-    types = [e.get("type") for e in events]
-    assert len(types) > 0, "Stream produced no events"
-    assert types[-1] == "done", f"Last event must be 'done', got: {types}"
-
-
-@pytest.mark.asyncio
-async def test_adk_stream_done_always_last():
-    """'done' is the final event even with multiple content events."""
-    agent = get_agent_instance("translation_agent")
-    event1 = _adk_event({"translated_text": "Part 1"})
-    event2 = _adk_event({"translated_text": "Part 2"})
-
-    def mock_run(user_id, session_id, new_message):
-        yield event1
-        yield event2
-
-    with patch.object(agent.engine._inner.runner, "run", side_effect=mock_run):
-        request = _make_request(
-            "translation_agent",
-            {"text": "Hello world", "from_language": "English", "to_language": "French"},
-        )
-        events = []
-        async for ev in agent.chat_stream(request):
-            events.append(ev)
-
-    types = [e.get("type") for e in events]
-    assert types[-1] == "done", f"'done' must be last, got: {types}"
-
-
-@pytest.mark.asyncio
-async def test_adk_stream_error_yields_error_event():
+@pytest.mark.parametrize("agent_name,runner_texts,query", [
+    (
+        "translation_agent",
+        ['{"translated_text": "Bonjour"}'],
+        {"text": "Hello", "from_language": "English", "to_language": "French"},
+    ),
+    (
+        "translation_agent",
+        ['{"translated_text": "Hola"}'],
+        {"text": "Hi", "from_language": "English", "to_language": "Spanish"},
+    ),
+    (
+        # 'done' stays last with multiple content events
+        "translation_agent",
+        ['{"translated_text": "Part 1"}', '{"translated_text": "Part 2"}'],
+        {"text": "Hello world", "from_language": "English", "to_language": "French"},
+    ),
+    (
+        "database_agent",
+        ['{"response": "No tables"}'],
+        {"text": "List tables"},
+    ),
+])
+async def test_adk_stream_done_last(agent_name, runner_texts, query, request):
+    """ADK stream produces events ending with 'done', regardless of content."""
+    agent = request.getfixturevalue(agent_name)
+    runner_events = [
+        SimpleNamespace(content=SimpleNamespace(parts=[SimpleNamespace(text=text)]))
+        for text in runner_texts
+    ]
+
+    with patch.object(agent.engine._inner.runner, "run_async", side_effect=async_mock_run(*runner_events)):
+        last, seen = await summarize_stream(agent.chat_stream(_make_request(agent_name, query)))
+
+    assert last is not None, "Stream produced no events"
+    assert last == "done", f"Last event must be 'done', got: {last!r}"
+
+
+async def test_adk_stream_error_yields_error_event(translation_agent):
     """When the runner raises, the stream yields an 'error' event then 'done'."""
-    agent = get_agent_instance("translation_agent")
+    agent = translation_agent
 
-    def mock_run_error(user_id, session_id, new_message):
+    async def mock_run_error(user_id, session_id, new_message):
         raise RuntimeError("Simulated runner failure")
         yield
 
-    with patch.object(agent.engine._inner.runner, "run", side_effect=mock_run_error):
-        request = _make_request(
-            "translation_agent",
-            {"text": "Hello", "from_language": "English", "to_language": "French"},
-        )
-        events = []
-        async for ev in agent.chat_stream(request):
-            events.append(ev)
+    with patch.object(agent.engine._inner.runner, "run_async", side_effect=mock_run_error):
+        last, seen = await summarize_stream(agent.chat_stream(TRANSLATE_FR_HELLO_REQUEST))
 
-    types = [e.get("type") for e in events]
-    assert "error" in types or "done" in types
-    assert types[-1] == "done", f"'done' must be last even on error, got: {types}"
+    assert "error" in seen or "done" in seen
+    assert last == "done", f"'done' must be last even on error, got: {last!r}"
 
 
 # ---------------------------------------------------------------------------
 # ADK — content text correctness
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_adk_content_text_is_plain_string_not_json():
+async def test_adk_content_text_is_plain_string_not_json(translation_agent):
     """REGRESSION: ADK output_schema caused LLM to emit {"response": "..."}
     which was previously forwarded raw to the UI. extract_display_text must
     unwrap it so the text field contains only the plain string value.
     """
-    agent = get_agent_instance("translation_agent")
+    agent = translation_agent
     # Simulate what ADK emits when output_schema is set:
     # the LLM returns a schema-formatted JSON blob
-    event = _adk_event({"translated_text": "Bonjour le monde"})
+    part = SimpleNamespace(text='{"translated_text": "Bonjour le monde"}')
+    event = SimpleNamespace(content=SimpleNamespace(parts=[part]))
 
-    def mock_run(user_id, session_id, new_message):
-        yield event
-
-    with patch.object(agent.engine._inner.runner, "run", side_effect=mock_run):
-        request = _make_request(
-            "translation_agent",
-            {"text": "Hello world", "from_language": "English", "to_language": "French"},
-        )
+    with patch.object(agent.engine._inner.runner, "run_async", side_effect=async_mock_run(event)):
         events = []
-        async for ev in agent.chat_stream(request):
+        async for ev in agent.chat_stream(TRANSLATE_FR_HELLO_WORLD_REQUEST):
             events.append(ev)
 
     content = _content_events(events)
@@ -166,24 +160,17 @@ async def test_adk_content_text_is_plain_string_not_json():
         )
 
 
-@pytest.mark.asyncio
-async def test_adk_content_text_field_name_not_in_output():
+async def test_adk_content_text_field_name_not_in_output(translation_agent):
     """The schema field name ('translated_text') must not appear in the
     display text when the output is a single-field schema.
     """
-    agent = get_agent_instance("translation_agent")
-    event = _adk_event({"translated_text": "Hola"})
-
-    def mock_run(user_id, session_id, new_message):
-        yield event
+    agent = translation_agent
+    part = SimpleNamespace(text='{"translated_text": "Hola"}')
+    event = SimpleNamespace(content=SimpleNamespace(parts=[part]))
 
-    with patch.object(agent.engine._inner.runner, "run", side_effect=mock_run):
-        request = _make_request(
-            "translation_agent",
-            {"text": "Hello", "from_language": "English", "to_language": "Spanish"},
-        )
+    with patch.object(agent.engine._inner.runner, "run_async", side_effect=async_mock_run(event)):
         events = []
-        async for ev in agent.chat_stream(request):
+        async for ev in agent.chat_stream(TRANSLATE_ES_HELLO_REQUEST):
             events.append(ev)
 
     content = _content_events(events)
@@ -198,75 +185,53 @@ async def test_adk_content_text_field_name_not_in_output():
 # LangGraph — event structure
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_langgraph_stream_event_sequence(mock_langgraph_llm):
-    """LangGraph stream produces events ending with 'done'."""
-    agent = get_agent_instance("personal_assistant_agent")
-
-    with mock_langgraph_llm("Here is my response!"):
-        request = _make_request("personal_assistant_agent", {"query": "Tell me something"})
-        events = []
-        async for ev in agent.chat_stream(request):
-            events.append(ev)
-
-    types = [e.get("type") for e in events]
-    assert len(types) > 0, "Stream produced no events"
-    assert types[-1] == "done", f"Last event must be 'done', got: {types}"
-
-
-@pytest.mark.asyncio
-async def test_langgraph_stream_done_always_last(mock_langgraph_llm):
-    """LangGraph: 'done' is the last event even with multi-token responses."""
-    agent = get_agent_instance("personal_assistant_agent")
-
-    with mock_langgraph_llm("A longer response that has multiple tokens"):
-        request = _make_request("personal_assistant_agent", {"query": "Write me a haiku"})
-        events = []
-        async for ev in agent.chat_stream(request):
-            events.append(ev)
-
-    types = [e.get("type") for e in events]
-    assert types[-1] == "done", f"'done' must be last, got: {types}"
+@pytest.mark.parametrize("response,request_", [
+    ("Here is my response!", ASSISTANT_SOMETHING_REQUEST),
+    # 'done' stays last with multi-token responses
+    ("A longer response that has multiple tokens", ASSISTANT_HAIKU_REQUEST),
+    ("Sure, I can help!", ASSISTANT_JOKE_REQUEST),
+])
+async def test_langgraph_stream_done_last(response, request_, mock_langgraph_llm, personal_assistant_agent):
+    """LangGraph stream produces content and ends with 'done'."""
+    with mock_langgraph_llm(response):
+        last, seen = await summarize_stream(personal_assistant_agent.chat_stream(request_))
+
+    assert last is not None, "Stream produced no events"
+    assert last == "done", f"Last event must be 'done', got: {last!r}"
+    # At least one content or thinking event
+    assert seen & {"content", "thinking"}, (
+        f"Expected content or thinking event, got: {seen}"
+    )
 
 
-@pytest.mark.asyncio
-async def test_langgraph_stream_error_yields_done(mock_langgraph_llm):
+async def test_langgraph_stream_error_yields_done(langgraph_acompletion, personal_assistant_agent):
     """LangGraph: if LLM raises, the stream still ends with 'done'."""
-    agent = get_agent_instance("personal_assistant_agent")
+    agent = personal_assistant_agent
 
     async def _error_acompletion(*args, **kwargs):
         raise RuntimeError("Simulated LLM failure")
 
-    with patch(
-        "src.agent_framework.engines.langgraph.engine.acompletion",
-        side_effect=_error_acompletion,
-    ):
-        request = _make_request("personal_assistant_agent", {"query": "This will fail"})
-        events = []
-        async for ev in agent.chat_stream(request):
-            events.append(ev)
+    langgraph_acompletion.side_effect = _error_acompletion
+    last, seen = await summarize_stream(agent.chat_stream(ASSISTANT_FAIL_REQUEST))
 
-    types = [e.get("type") for e in events]
-    assert "done" in types
-    assert types[-1] == "done", f"'done' must be last, got: {types}"
+    assert "done" in seen
+    assert last == "done", f"'done' must be last, got: {last!r}"
 
 
 # ---------------------------------------------------------------------------
 # LangGraph — content text correctness
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_langgraph_non_streaming_content_is_plain_text(mock_langgraph_llm):
+async def test_langgraph_non_streaming_content_is_plain_text(mock_langgraph_llm, personal_assistant_agent):
     """REGRESSION: LangGraph was calling model_dump_json() on the output which
     produced {"response": "..."} as the SSE content text instead of plain text.
     The non-streaming path must emit the field value, not the serialized model.
     """
-    agent = get_agent_instance("personal_assistant_agent")
+    agent = personal_assistant_agent
 
     with mock_langgraph_llm("This is the actual answer"):
-        request = _make_request("personal_assistant_agent", {"query": "What is 2+2?"})
         events = []
-        async for ev in agent.chat_stream(request):
+        async for ev in agent.chat_stream(ASSISTANT_MATH_REQUEST):
             events.append(ev)
 
     content = _content_events(events)
@@ -286,8 +251,9 @@ async def test_langgraph_non_streaming_content_is_plain_text(mock_langgraph_llm)
 # Cross-engine consistency
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_adk_and_langgraph_content_format_consistent():
+async def test_adk_and_langgraph_content_format_consistent(
+    translation_agent, personal_assistant_agent, langgraph_acompletion
+):
     """ADK and LangGraph must produce the same kind of output for the same
     response text. Both should emit plain text, not JSON-wrapped values.
 
@@ -295,41 +261,28 @@ async def test_adk_and_langgraph_content_format_consistent():
     that neither wraps the text in a JSON schema structure.
     """
     # ADK side
-    adk_agent = get_agent_instance("translation_agent")
-    adk_event = _adk_event({"translated_text": "Shared response text"})
-
-    def mock_run(user_id, session_id, new_message):
-        yield adk_event
+    part = SimpleNamespace(text='{"translated_text": "Shared response text"}')
+    adk_event = SimpleNamespace(content=SimpleNamespace(parts=[part]))
 
-    with patch.object(adk_agent.engine._inner.runner, "run", side_effect=mock_run):
-        adk_request = _make_request(
-            "translation_agent",
-            {"text": "Shared response text", "from_language": "English", "to_language": "French"},
+    # LangGraph side
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = "Shared response text"
+    mock_response.choices[0].message.tool_calls = None
+    mock_response.usage = None
+    langgraph_acompletion.return_value = mock_response
+
+    # The two engines are independent, so drain both streams concurrently
+    with patch.object(translation_agent.engine._inner.runner, "run_async", side_effect=async_mock_run(adk_event)):
+        adk_events, lg_events = await run_streams(
+            [
+                (translation_agent, TRANSLATE_SHARED_REQUEST),
+                (personal_assistant_agent, ASSISTANT_ANYTHING_REQUEST),
+            ],
+            collect=collect_events,
         )
-        adk_events = []
-        async for ev in adk_agent.chat_stream(adk_request):
-            adk_events.append(ev)
 
     adk_content = _content_events(adk_events)
-
-    # LangGraph side
-    lg_agent = get_agent_instance("personal_assistant_agent")
-    with patch(
-        "src.agent_framework.engines.langgraph.engine.acompletion"
-    ) as mock_llm:
-        from unittest.mock import MagicMock
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Shared response text"
-        mock_response.choices[0].message.tool_calls = None
-        mock_response.usage = None
-        mock_llm.return_value = mock_response
-
-        lg_request = _make_request("personal_assistant_agent", {"query": "anything"})
-        lg_events = []
-        async for ev in lg_agent.chat_stream(lg_request):
-            lg_events.append(ev)
-
     lg_content = _content_events(lg_events)
 
     # Both must emit non-JSON text
@@ -339,22 +292,3 @@ async def test_adk_and_langgraph_content_format_consistent():
             f"Engine {ev.get('agent')} emitted JSON-wrapped text: {text!r}. "
             "Both engines must emit plain display text."
         )
-
-
-@pytest.mark.asyncio
-async def test_stream_done_always_last_adk():
-    """Parametric: 'done' is last for ADK regardless of content."""
-    agent = get_agent_instance("database_agent")
-    event = _adk_event({"response": "No tables"})
-
-    def mock_run(user_id, session_id, new_message):
-        yield event
-
-    with patch.object(agent.engine._inner.runner, "run", side_effect=mock_run):
-        request = _make_request("database_agent", {"text": "List tables"})
-        events = []
-        async for ev in agent.chat_stream(request):
-            events.append(ev)
-
-    types = [e.get("type") for e in events]
-    assert types[-1] == "done"
@@ -4,38 +4,79 @@ Verifies that tools defined in YAML are loaded into the engine and that
 tool-call/result events appear in streaming output.
 """
 
+import itertools
 import json
+from dataclasses import dataclass
 from types import SimpleNamespace
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
-import pytest
-
-from src.agent_framework.registry import discover_agents, get_agent_instance
 from src.service.models.base_models import AgentChatRequest
-from tests.integration.conftest import project_root_cwd
+from tests.integration.conftest import async_mock_run, summarize_stream
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(scope="module", autouse=True)
-def discover_all_agents():
-    with project_root_cwd():
-        discover_agents("src/all_agents")
+# Agents are shared across the session, so every request gets its own session.
+_session_ids = itertools.count()
 
 
 def _make_chat_request(agent_name: str, query: dict | None = None) -> AgentChatRequest:
     return AgentChatRequest(
         agent_name=agent_name,
         user_id="test-user",
-        session_id="test-session",
+        session_id=f"test-session-{next(_session_ids)}",
         sender="USER",
         query=query or {"text": "hello"},
         features=[],
     )
 
 
+# Plain litellm streaming-chunk stand-ins: only the attributes the LangGraph
+# engine reads, without MagicMock's per-attribute child allocation.
+
+@dataclass
+class _FunctionDelta:
+    name: str | None
+    arguments: str | None
+
+
+@dataclass
+class _ToolCallDelta:
+    index: int
+    id: str | None
+    function: _FunctionDelta | None
+
+
+@dataclass
+class _Delta:
+    content: str | None
+    tool_calls: list | None
+
+
+@dataclass
+class _Choice:
+    delta: _Delta
+    finish_reason: str | None
+
+
+@dataclass
+class _Chunk:
+    choices: list
+    model: str = "gpt-4o-mini"
+    usage: None = None
+
+
+# Requests are built once: chat()/chat_stream() never mutate them.
+DB_LIST_ALL_TABLES_REQUEST = _make_chat_request("database_agent", {"text": "List all tables"})
+DB_LIST_TABLES_REQUEST = _make_chat_request("database_agent", {"text": "List tables"})
+ASSISTANT_PARIS_WEATHER_REQUEST = _make_chat_request(
+    "personal_assistant_agent",
+    {"query": "What's the weather in Paris?"},
+)
+
+
 # ---------------------------------------------------------------------------
 # database_agent (ADK, tool_pattern) — tools are currently commented out in YAML
 # The test verifies the agent is instantiatable and the engine is ADK.
@@ -50,17 +91,16 @@ def test_database_agent_is_registered():
     )
 
 
-def test_database_agent_uses_adk_engine():
+def test_database_agent_uses_adk_engine(database_agent):
     """database_agent uses the ADK execution engine."""
-    agent = get_agent_instance("database_agent")
+    agent = database_agent
     engine_name = agent.engine.engine_name()
     assert engine_name == "adk", f"Expected 'adk' engine, got '{engine_name}'"
 
 
-@pytest.mark.asyncio
-async def test_database_agent_adk_chat_with_mock():
+async def test_database_agent_adk_chat_with_mock(database_agent):
     """database_agent (ADK) returns a response with a mocked runner."""
-    agent = get_agent_instance("database_agent")
+    agent = database_agent
 
     output = {"response": "Tables: users, sessions"}
     text = json.dumps(output)
@@ -68,21 +108,16 @@ async def test_database_agent_adk_chat_with_mock():
     content = SimpleNamespace(parts=[part])
     event = SimpleNamespace(content=content)
 
-    def mock_run(user_id, session_id, new_message):
-        yield event
-
-    with patch.object(agent.engine._inner.runner, "run", side_effect=mock_run):
-        request = _make_chat_request("database_agent", {"text": "List all tables"})
-        result = await agent.chat(request)
+    with patch.object(agent.engine._inner.runner, "run_async", side_effect=async_mock_run(event)):
+        result = await agent.chat(DB_LIST_ALL_TABLES_REQUEST)
 
     assert result is not None
-    assert hasattr(result, "agent_response")
+    assert result.agent_response is not None
 
 
-@pytest.mark.asyncio
-async def test_database_agent_stream_ends_with_done():
+async def test_database_agent_stream_ends_with_done(database_agent):
     """Streaming from database_agent always ends with a 'done' event."""
-    agent = get_agent_instance("database_agent")
+    agent = database_agent
 
     output = {"response": "No tables found"}
     text = json.dumps(output)
@@ -90,27 +125,19 @@ async def test_database_agent_stream_ends_with_done():
     content = SimpleNamespace(parts=[part])
     event = SimpleNamespace(content=content)
 
-    def mock_run(user_id, session_id, new_message):
-        yield event
-
-    with patch.object(agent.engine._inner.runner, "run", side_effect=mock_run):
-        request = _make_chat_request("database_agent", {"text": "List tables"})
-        events = []
-        async for ev in agent.chat_stream(request):
-            events.append(ev)
+    with patch.object(agent.engine._inner.runner, "run_async", side_effect=async_mock_run(event)):
+        last, seen = await summarize_stream(agent.chat_stream(DB_LIST_TABLES_REQUEST))
 
-    types = [e.get("type") for e in events]
-    assert types[-1] == "done", f"Expected last event to be 'done', got: {types}"
+    assert last == "done", f"Expected last event to be 'done', got: {last!r}"
 
 
 # ---------------------------------------------------------------------------
 # LangGraph agent with a mocked tool call in the LLM response
 # ---------------------------------------------------------------------------
 
-@pytest.mark.asyncio
-async def test_langgraph_agent_stream_with_tool_call(mock_langgraph_llm):
+async def test_langgraph_agent_stream_with_tool_call(langgraph_acompletion, personal_assistant_agent):
     """When LLM returns a tool call, stream includes tool_call + tool_result events."""
-    agent = get_agent_instance("personal_assistant_agent")
+    agent = personal_assistant_agent
 
     # First call: return a tool call; second call: return final answer
     call_count = 0
@@ -119,45 +146,24 @@ async def test_langgraph_agent_stream_with_tool_call(mock_langgraph_llm):
         nonlocal call_count
         call_count += 1
 
-        chunk = MagicMock()
-        chunk.choices = [MagicMock()]
-        chunk.choices[0].delta = MagicMock()
-        chunk.choices[0].finish_reason = "stop"
-        chunk.model = "gpt-4o-mini"
-        chunk.usage = None
-
         if call_count == 1:
             # Simulate a tool call in the delta
-            tool_call = MagicMock()
-            tool_call.id = "call_123"
-            tool_call.function = MagicMock()
-            tool_call.function.name = "get_weather"
-            tool_call.function.arguments = '{"location": "Paris"}'
-            tool_call.index = 0
-            chunk.choices[0].delta.content = None
-            chunk.choices[0].delta.tool_calls = [tool_call]
-            chunk.choices[0].finish_reason = "tool_calls"
+            tool_call = _ToolCallDelta(
+                index=0,
+                id="call_123",
+                function=_FunctionDelta(name="get_weather", arguments='{"location": "Paris"}'),
+            )
+            chunk = _Chunk(choices=[_Choice(_Delta(None, [tool_call]), "tool_calls")])
         else:
-            chunk.choices[0].delta.content = "The weather in Paris is sunny."
-            chunk.choices[0].delta.tool_calls = None
+            chunk = _Chunk(choices=[_Choice(_Delta("The weather in Paris is sunny.", None), "stop")])
 
         async def _stream():
             yield chunk
 
         return _stream()
 
-    with patch(
-        "src.agent_framework.engines.langgraph.engine.acompletion",
-        side_effect=_fake_acompletion,
-    ):
-        request = _make_chat_request(
-            "personal_assistant_agent",
-            {"query": "What's the weather in Paris?"},
-        )
-        events = []
-        async for ev in agent.chat_stream(request):
-            events.append(ev)
-
-    types = [e.get("type") for e in events]
-    assert "done" in types, f"Expected 'done' in events, got: {types}"
-    assert types[-1] == "done"
+    langgraph_acompletion.side_effect = _fake_acompletion
+    last, seen = await summarize_stream(agent.chat_stream(ASSISTANT_PARIS_WEATHER_REQUEST))
+
+    assert "done" in seen, f"Expected 'done' in events, got: {seen}"
+    assert last == "done"
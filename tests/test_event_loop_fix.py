@@ -1,28 +1,25 @@
-"""Test that MCP client handles event loop changes correctly."""
+"""Test that MCP client handles event loop changes correctly.
 
-import asyncio
-import sys
+Requires a running PostgreSQL instance (AGENT_SESSION_STORE_URI) and an
+OpenAI key. The agent is built once per session (outside the test's event
+loop) and then used from each test's loop, which is exactly the
+init-loop/request-loop split the MCP client has to survive.
+"""
 
-sys.path.insert(0, "src")
+import asyncio
 
+import pytest
 
-async def test_event_loop_handling():
-    """Test MCP client works across different event loops."""
-    print("\n" + "=" * 80)
-    print("Testing Event Loop Handling for MCP Client")
-    print("=" * 80 + "\n")
+from src.service.models.base_models import AgentChatRequest
+from tests.integration.conftest import assert_no_agent_error, require_openai_key, require_postgres
 
-    from src.all_agents.postgres_adk_mcp_agent.main_agent import PostgresAdkMcpAgent
-    from src.service.models.base_models import AgentChatRequest
+# Each test gets its own loop (overriding the session default in pytest.ini), so
+# requests run on a different loop than the one the agent was first used on
+pytestmark = [require_postgres(), require_openai_key(), pytest.mark.asyncio(loop_scope="function")]
 
-    # Step 1: Create agent in one event loop (simulates initialization)
-    print("Step 1: Creating agent (initialization event loop)...")
-    agent = PostgresAdkMcpAgent()
-    print("✅ Agent created\n")
 
-    # Step 2: Make a request that will use the agent
-    # This simulates what happens in the web API - a different async context
-    print("Step 2: Making request (request handling event loop)...")
+async def test_event_loop_handling(postgres_agent):
+    """MCP client detects and handles the event loop change between init and request."""
     request = AgentChatRequest(
         agent_name="postgres_adk_mcp_agent",
         query="SELECT * FROM events LIMIT 5",
@@ -30,129 +27,35 @@ async def test_event_loop_handling():
         user_id="test_user_123"
     )
 
-    print("Sending request: 'SELECT * FROM events LIMIT 5'")
-    print("(This tests if MCP client detects and handles event loop change)\n")
-
-    try:
-        result = await agent.chat(request)
-
-        print("✅ Request succeeded!")
-        print("-" * 80)
-        print("Agent response:")
-
-        # Handle both string and TextOutput object
-        response_text = str(result.agent_response) if hasattr(result.agent_response, 'response') else result.agent_response
-        print(response_text[:500])  # Show first 500 chars
-        print("-" * 80)
-
-        # Check for errors in response
-        response_lower = response_text.lower() if isinstance(response_text, str) else str(response_text).lower()
-        if "error" in response_lower and "encountered an error" in response_lower:
-            print("\n⚠️  Response contains error message")
-            print("Full response:", response_text)
-            return False
-        else:
-            print("\n✅ No errors in response - event loop handling working!")
-            return True
+    result = await postgres_agent.chat(request)
 
-    except Exception as e:
-        print(f"\n❌ Request failed with error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    assert_no_agent_error(result)
 
 
-async def test_multiple_requests():
-    """Test multiple requests work correctly."""
-    print("\n" + "=" * 80)
-    print("Testing Multiple Requests")
-    print("=" * 80 + "\n")
-
-    from src.all_agents.postgres_adk_mcp_agent.main_agent import PostgresAdkMcpAgent
-    from src.service.models.base_models import AgentChatRequest
-
-    agent = PostgresAdkMcpAgent()
-
+async def test_multiple_requests(postgres_agent):
+    """Multiple concurrent requests on the same agent all succeed."""
     queries = [
         "SELECT COUNT(*) FROM events",
         "SELECT tablename FROM pg_tables WHERE schemaname = 'public' LIMIT 3",
         "SELECT * FROM sessions LIMIT 2"
     ]
 
-    print(f"Running {len(queries)} sequential requests...")
-    for i, query in enumerate(queries, 1):
-        print(f"\n{i}. Query: {query}")
+    async def _run(query: str, i: int):
         request = AgentChatRequest(
             agent_name="postgres_adk_mcp_agent",
             query=query,
             session_id=f"test_multi_{i}",
             user_id="test_user"
         )
+        return await postgres_agent.chat(request)
 
-        try:
-            result = await agent.chat(request)
-
-            # Handle both string and TextOutput object
-            response_text = str(result.agent_response) if hasattr(result.agent_response, 'response') else result.agent_response
-            response_lower = response_text.lower() if isinstance(response_text, str) else str(response_text).lower()
-
-            if "error" in response_lower and "encountered an error" in response_lower:
-                print(f"   ❌ Request {i} failed")
-                return False
-            else:
-                print(f"   ✅ Request {i} succeeded")
-        except Exception as e:
-            print(f"   ❌ Request {i} raised exception: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-
-    print("\n✅ All requests succeeded!")
-    return True
-
-
-async def main():
-    """Run all tests."""
-    print("\n" + "=" * 80)
-    print("MCP EVENT LOOP FIX VERIFICATION")
-    print("=" * 80)
-
-    results = []
-
-    # Test 1: Basic event loop handling
-    results.append(("Event Loop Handling", await test_event_loop_handling()))
-
-    # Test 2: Multiple requests
-    results.append(("Multiple Requests", await test_multiple_requests()))
-
-    # Summary
-    print("\n" + "=" * 80)
-    print("TEST SUMMARY")
-    print("=" * 80 + "\n")
-
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-
-    for name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status}: {name}")
-
-    print("\n" + "=" * 80)
-    if passed == total:
-        print(f"🎉 ALL TESTS PASSED ({passed}/{total})")
-        print("Event loop handling is working correctly!")
-        return 0
-    else:
-        print(f"⚠️  SOME TESTS FAILED ({passed}/{total} passed)")
-        return 1
-
+    # Independent sessions: overlap the MCP/LLM round-trips
+    results = await asyncio.gather(
+        *(_run(query, i) for i, query in enumerate(queries, 1)),
+        return_exceptions=True,
+    )
 
-if __name__ == "__main__":
-    try:
-        exit_code = asyncio.run(main())
-        sys.exit(exit_code)
-    except Exception as e:
-        print(f"\n❌ Fatal error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    for i, result in enumerate(results, 1):
+        if isinstance(result, BaseException):
+            raise AssertionError(f"Request {i} raised: {result!r}") from result
+        assert_no_agent_error(result)
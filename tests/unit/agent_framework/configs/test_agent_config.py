@@ -3,19 +3,12 @@ import pathlib
 from src.agent_framework.configs.agent_config import AgentConfig
 
 
-def _get_project_root():
-    """Find the project root by looking for a marker file (like pyproject.toml)."""
-    current = pathlib.Path(__file__).resolve()
-    while current != current.parent:
-        if (current / "pyproject.toml").exists():
-            return current
-        current = current.parent
-    raise RuntimeError("Could not find project root")
+# tests/unit/agent_framework/<pkg>/<this file> -> project root
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[4]
 
 
 def test_from_yaml_loads_basic_fields():
-    project_root = _get_project_root()
-    yaml_path = project_root / "src" / "all_agents" / "file_analysis_agent" / "main_agent.yaml"
+    yaml_path = PROJECT_ROOT / "src" / "all_agents" / "file_analysis_agent" / "main_agent.yaml"
 
     config = AgentConfig.from_yaml(str(yaml_path))
 
@@ -26,11 +19,47 @@ def test_from_yaml_loads_basic_fields():
 
 
 def test_from_yaml_loads_tools_list_if_present():
-    project_root = _get_project_root()
     # Use orchestrator (trip_planner) which has sub-agent tools
-    yaml_path = project_root / "src" / "all_agents" / "orchestrator_pattern" / "main_agent.yaml"
+    yaml_path = PROJECT_ROOT / "src" / "all_agents" / "orchestrator_pattern" / "main_agent.yaml"
 
     config = AgentConfig.from_yaml(str(yaml_path))
 
     assert isinstance(config.tools, list)
     assert any(tool.get("type") == "agent" for tool in config.tools)
+
+
+def test_from_yaml_reparses_only_when_file_changes(tmp_path, monkeypatch):
+    import yaml
+
+    yaml_path = tmp_path / "main_agent.yaml"
+    body = (
+        "agent_name: cached_agent\n"
+        "llm_provider_name: openai\n"
+        "llm_model: gpt-4o-mini\n"
+        "temperature: 0.4\n"
+        "description: first\n"
+        "instruction_template: hi\n"
+        "tags: [a]\n"
+    )
+    yaml_path.write_text(body)
+
+    parses = 0
+    real_load = yaml.load
+
+    def counting_load(stream, Loader):
+        nonlocal parses
+        parses += 1
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+
+    first = AgentConfig.from_yaml(str(yaml_path))
+    first.tags.append("mutated")
+    second = AgentConfig.from_yaml(str(yaml_path))
+    assert parses == 1
+    # Each config gets its own copy of the parsed lists
+    assert second.tags == ["a"]
+
+    yaml_path.write_text(body.replace("description: first", "description: second edit"))
+    assert AgentConfig.from_yaml(str(yaml_path)).description == "second edit"
+    assert parses == 2
@@ -2,23 +2,17 @@ import pathlib
 
 import pytest
 
+from src.agent_framework.configs import loader
 from src.agent_framework.configs.agent_config import AgentConfig
 from src.agent_framework.configs.loader import load_agent_config
 
 
-def _get_project_root():
-    """Find the project root by looking for a marker file (like pyproject.toml)."""
-    current = pathlib.Path(__file__).resolve()
-    while current != current.parent:
-        if (current / "pyproject.toml").exists():
-            return current
-        current = current.parent
-    raise RuntimeError("Could not find project root")
+# tests/unit/agent_framework/<pkg>/<this file> -> project root
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[4]
 
 
 def test_load_agent_config_with_explicit_path():
-    project_root = _get_project_root()
-    yaml_path = project_root / "src" / "all_agents" / "file_analysis_agent" / "main_agent.yaml"
+    yaml_path = PROJECT_ROOT / "src" / "all_agents" / "file_analysis_agent" / "main_agent.yaml"
 
     cfg = load_agent_config(agent_config=None, config_path=str(yaml_path), caller_file=None)
 
@@ -26,19 +20,17 @@ def test_load_agent_config_with_explicit_path():
     assert cfg.agent_name == "file_analysis_agent"
 
 
-def test_load_agent_config_requires_some_source(monkeypatch):
+@pytest.fixture
+def no_stack_inspection(monkeypatch):
+    """Make stack-based config auto-detection find no calling module."""
+    monkeypatch.setattr(loader, "_caller_file", lambda depth=2: None)
+
+
+def test_load_agent_config_requires_some_source(no_stack_inspection):
     """Test that load_agent_config raises ValueError when no source is provided.
     
-    We need to mock the stack inspection to prevent it from finding the test file.
+    Stack inspection is stubbed out so it can't find the test file.
     """
-    # Mock inspect.currentframe to return None, preventing stack-based detection
-    import inspect
-    
-    def mock_currentframe():
-        return None
-    
-    monkeypatch.setattr(inspect, "currentframe", mock_currentframe)
-    
     # The error message can be either format, so we check for ValueError with any message
     with pytest.raises(ValueError) as exc_info:
         load_agent_config(agent_config=None, config_path=None, caller_file=None)
@@ -46,3 +38,15 @@ def test_load_agent_config_requires_some_source(monkeypatch):
     # Verify the error message contains key phrases
     error_msg = str(exc_info.value)
     assert "Cannot auto-detect" in error_msg or "Config path could not be resolved" in error_msg
+
+
+def test_load_agent_config_detects_calling_module(monkeypatch):
+    """Without a path or caller_file, the config path is resolved from the calling module."""
+    def resolve(relative_to):
+        raise FileNotFoundError(relative_to)
+
+    monkeypatch.setattr(loader, "resolve_config_path", resolve)
+    with pytest.raises(ValueError) as exc_info:
+        load_agent_config(agent_config=None, config_path=None, caller_file=None)
+
+    assert __file__ in str(exc_info.value)
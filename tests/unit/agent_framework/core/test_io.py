@@ -152,26 +152,27 @@ class TestExtractDisplayText:
 # parse_agent_response
 # ---------------------------------------------------------------------------
 
-def make_adk_event(payload: dict) -> SimpleNamespace:
-    text = json.dumps(payload)
+def make_adk_event(text: str) -> SimpleNamespace:
     part = SimpleNamespace(text=text)
     content = SimpleNamespace(parts=[part])
     return SimpleNamespace(content=content)
 
 
+# Events are read-only to parse_agent_response, so each is built once per module
+HELLO_EVENT = make_adk_event(json.dumps({"response": "hello"}))
+PLAIN_TEXT_EVENT = make_adk_event("plain text")
+BERLIN_EVENT = make_adk_event(json.dumps({"city": "Berlin", "temperature": 18.0, "description": "Clear"}))
+
+
 class TestParseAgentResponse:
 
     def test_happy_path_returns_schema_instance(self):
-        event = make_adk_event({"response": "hello"})
-        out = parse_agent_response(SingleStringOutput, event)
+        out = parse_agent_response(SingleStringOutput, HELLO_EVENT)
         assert isinstance(out, SingleStringOutput)
         assert out.response == "hello"
 
     def test_plain_text_wraps_into_single_field_schema(self):
-        event = SimpleNamespace(
-            content=SimpleNamespace(parts=[SimpleNamespace(text="plain text")])
-        )
-        out = parse_agent_response(SingleStringOutput, event)
+        out = parse_agent_response(SingleStringOutput, PLAIN_TEXT_EVENT)
         assert isinstance(out, SingleStringOutput)
         assert out.response == "plain text"
 
@@ -181,8 +182,7 @@ class TestParseAgentResponse:
         assert out.response == "from dict"
 
     def test_multi_field_parses_correctly(self):
-        event = make_adk_event({"city": "Berlin", "temperature": 18.0, "description": "Clear"})
-        out = parse_agent_response(MultiFieldOutput, event)
+        out = parse_agent_response(MultiFieldOutput, BERLIN_EVENT)
         assert isinstance(out, MultiFieldOutput)
         assert out.city == "Berlin"
         assert out.temperature == 18.0
@@ -1,8 +1,14 @@
+import json
 from typing import Any
 
+import pytest
+
 from src.agent_framework.configs.agent_config import AgentConfig
 from src.agent_framework.configs.llm.llm_provider_config import LLMModel, LLMProviderName
 from src.agent_framework.factories.tool_factory import ToolFactory
+from src.agent_framework.tools.base_tool import BaseTool
+from src.agent_framework.registry import clear_cache as clear_agent_cache
+from src.agent_framework.tools.tool_manager import ToolManager
 
 
 class DummyTool:
@@ -25,6 +31,23 @@ class DummyAgent:
         self.agent = object()
 
 
+class CountingSubAgent:
+    """Sub-agent stand-in that counts constructions; has no engine, so no ADK tool is built."""
+
+    instances = 0
+
+    def __init__(self) -> None:
+        CountingSubAgent.instances += 1
+
+
+@pytest.fixture
+def reset_sub_agents():
+    clear_agent_cache()
+    CountingSubAgent.instances = 0
+    yield
+    clear_agent_cache()
+
+
 def test_build_tools_from_config_function_tool():
     """Test that function tools are built correctly from YAML config.
     
@@ -52,7 +75,6 @@ def test_build_tools_from_config_function_tool():
     tool = tools[0]
 
     # Verify it's a BaseTool instance (our framework-agnostic wrapper)
-    from src.agent_framework.tools.base_tool import BaseTool
     assert isinstance(tool, BaseTool)
     
     # Verify the tool has the expected properties
@@ -60,7 +82,6 @@ def test_build_tools_from_config_function_tool():
     assert hasattr(tool, 'function')
     
     # Test that the tool works - pass input as JSON to match our factory's parsing
-    import json
     result = tool.run(json.dumps({"value": "test input"}))
     assert result == "TEST INPUT"
 
@@ -74,3 +95,20 @@ def test_build_tools_from_config_ignores_unknown_type():
 
     tools = ToolFactory.create_batch(cfg.tools)
     assert tools == []
+
+
+def test_agent_tool_reuses_sub_agent_instance(reset_sub_agents):
+    tool_config = {
+        "type": "agent",
+        "id": "counting",
+        "agent_class": f"{__name__}.CountingSubAgent",
+    }
+
+    ToolManager._create_agent_tool(tool_config, "adk")
+    ToolManager._create_agent_tool(tool_config, "adk")
+    assert CountingSubAgent.instances == 1
+
+    # The registry's cache reset drops reused sub-agents too
+    clear_agent_cache()
+    ToolManager._create_agent_tool(tool_config, "adk")
+    assert CountingSubAgent.instances == 2
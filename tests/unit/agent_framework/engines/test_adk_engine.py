@@ -0,0 +1,71 @@
+"""AdkEngine against a real ADK Runner (no LLM: the root agent is scripted)."""
+
+import asyncio
+import json
+
+import pytest
+from google.adk.agents import BaseAgent
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.genai import types
+
+from src.all_agents.single_agent_pattern.main_agent import TranslationAgent, TranslationInput, TranslationOutput
+from tests.conftest import build_agent
+
+INPUT = TranslationInput(text="Hello", from_language="en", to_language="es")
+
+
+class LoopRecordingAgent(BaseAgent):
+    """Replies with a fixed translation and records the loop it ran on."""
+
+    loops: list = []
+
+    async def _run_async_impl(self, ctx):
+        self.loops.append(asyncio.get_running_loop())
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            content=types.Content(
+                role="model",
+                parts=[types.Part(text=json.dumps({"translated_text": "Hola"}))],
+            ),
+        )
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """The ADK engine of a TranslationAgent, unwrapped from any middleware."""
+    agent = build_agent(TranslationAgent)
+    return getattr(agent.engine, "_inner", agent.engine)
+
+
+@pytest.fixture
+def root_agent(engine, monkeypatch):
+    """Swap the engine's runner for a real Runner over LoopRecordingAgent."""
+    root = LoopRecordingAgent(name="translation_agent", loops=[])
+    runner = Runner(
+        agent=root,
+        app_name=engine.agent_config.agent_name,
+        session_service=engine.session_store.session_service,
+    )
+    monkeypatch.setattr(engine, "runner", runner)
+    return root
+
+
+async def test_run_drives_runner_on_the_callers_loop(engine, root_agent):
+    output = await engine.run("test_user", "test_session", INPUT)
+
+    assert output == TranslationOutput(translated_text="Hola")
+    assert root_agent.loops == [asyncio.get_running_loop()]
+
+
+async def test_run_stream_drives_runner_on_the_callers_loop(engine, root_agent):
+    types_seen = [
+        event["type"]
+        async for event in engine.run_stream("test_user", "test_stream_session", INPUT)
+    ]
+
+    assert types_seen[0] == "thinking"
+    assert types_seen[-1] == "done"
+    assert "error" not in types_seen
+    assert root_agent.loops == [asyncio.get_running_loop()]
@@ -164,6 +164,15 @@ class TestBuildSchemaPrompt:
         assert "answer" in prompt2
         assert "confidence" in prompt2
 
+    def test_prompt_is_cached_per_schema(self):
+        """Test that repeated calls for the same schema reuse the built prompt."""
+        class CachedOutput(BaseModel):
+            response: str
+
+        prompt = build_schema_prompt(CachedOutput)
+
+        assert build_schema_prompt(CachedOutput) is prompt
+
     def test_shows_clear_example_format(self):
         """Test that example format is clear and not confusing."""
         class UserOutput(BaseModel):
@@ -0,0 +1,27 @@
+"""Shared fixtures for the MCP tests."""
+
+import pytest
+
+from src.agent_framework.mcp.models import MCP_SERVER_CONFIGS_ADAPTER
+from src.agent_framework.mcp.registry import MCPServerRegistry
+
+
+@pytest.fixture
+def seed_registry(monkeypatch):
+    """Install an MCPServerRegistry singleton built from in-memory server entries.
+
+    Entries use the config file's "servers" format and are normalized and
+    validated the same way, but no config file is discovered or parsed.
+    """
+
+    def seed(servers):
+        # Skip __init__ (and its file discovery); _set_servers sets every instance attribute
+        registry = MCPServerRegistry.__new__(MCPServerRegistry)
+        registry._set_servers(MCP_SERVER_CONFIGS_ADAPTER.validate_python({
+            server_id: registry._normalize_server_config(server_id, raw)
+            for server_id, raw in servers.items()
+        }))
+        monkeypatch.setattr(MCPServerRegistry, "_instance", registry)
+        return registry
+
+    return seed
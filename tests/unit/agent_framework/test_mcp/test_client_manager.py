@@ -4,7 +4,6 @@ import pytest
 
 from src.agent_framework.mcp.client_manager import MCPClientManager
 from src.agent_framework.mcp.clients.stdio import StdioMCPClient
-from src.agent_framework.mcp.clients.sse import SSEMCPClient
 from src.agent_framework.mcp.models import MCPServerConfig, MCPTransport
 
 
@@ -46,31 +45,21 @@ def test_get_client_same_id_returns_same_instance():
     assert a is b
 
 
-def test_get_client_sse_raises_without_auth_db(monkeypatch):
-    """SSE transport is now supported via SSEMCPClient, but requires AGENTSHIP_AUTH_DB_URI.
+@pytest.mark.parametrize("transport,url", [
+    (MCPTransport.SSE, "https://example.com/sse"),
+    (MCPTransport.HTTP, "https://example.com/mcp"),
+])
+def test_get_client_remote_raises_without_auth_db(monkeypatch, transport, url):
+    """SSE and HTTP transports both use SSEMCPClient, which requires AGENTSHIP_AUTH_DB_URI.
 
-    SSEMCPClient was added in the mcp_integration_stdio branch. When the DB URI
-    is not configured the client raises ValueError at construction time.
+    When the DB URI is not configured the client raises ValueError at
+    construction time.
     """
     monkeypatch.delenv("AGENTSHIP_AUTH_DB_URI", raising=False)
     config = MCPServerConfig(
-        id="sse_server",
-        transport=MCPTransport.SSE,
-        url="https://example.com/sse",
-    )
-    manager = MCPClientManager.get_instance()
-    with pytest.raises(ValueError) as exc_info:
-        manager.get_client(config)
-    assert "AGENTSHIP_AUTH_DB_URI" in str(exc_info.value)
-
-
-def test_get_client_http_raises_without_auth_db(monkeypatch):
-    """HTTP transport also uses SSEMCPClient; same AGENTSHIP_AUTH_DB_URI requirement."""
-    monkeypatch.delenv("AGENTSHIP_AUTH_DB_URI", raising=False)
-    config = MCPServerConfig(
-        id="http_server",
-        transport=MCPTransport.HTTP,
-        url="https://example.com/mcp",
+        id=f"{transport.value}_server",
+        transport=transport,
+        url=url,
     )
     manager = MCPClientManager.get_instance()
     with pytest.raises(ValueError) as exc_info:
@@ -0,0 +1,153 @@
+"""Unit tests for MCP OAuth database helpers.
+
+The MCPDatabaseOperations tests run against a throwaway SQLite file standing in
+for PostgreSQL (NOW() is registered as a function); no database server required.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, text
+
+from src.agent_framework.mcp import db_operations
+from src.agent_framework.mcp.db_operations import (
+    AuthSessionNotPendingError,
+    MCPDatabaseOperations,
+    state_token_hash,
+)
+
+# The columns the operations touch, with the migrations' defaults and unique keys
+_SCHEMA = (
+    """CREATE TABLE mcp_auth_sessions (
+        session_id TEXT PRIMARY KEY, user_id TEXT NOT NULL, server_id TEXT NOT NULL,
+        state_token TEXT NOT NULL, state_hash BIGINT, status TEXT DEFAULT 'pending',
+        error_message TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        expires_at TIMESTAMP NOT NULL, completed_at TIMESTAMP)""",
+    """CREATE TABLE mcp_oauth_tokens (
+        user_id TEXT NOT NULL, server_id TEXT NOT NULL, access_token TEXT NOT NULL,
+        refresh_token TEXT, token_type TEXT, expires_at TIMESTAMP, scope TEXT,
+        updated_at TIMESTAMP, UNIQUE (user_id, server_id))""",
+    """CREATE TABLE mcp_user_connections (
+        user_id TEXT NOT NULL, server_id TEXT NOT NULL, status TEXT DEFAULT 'active',
+        config TEXT, connected_at TIMESTAMP, last_used_at TIMESTAMP, updated_at TIMESTAMP,
+        UNIQUE (user_id, server_id))""",
+)
+
+
+def test_state_token_hash_is_deterministic():
+    assert state_token_hash("abc") == state_token_hash("abc")
+    assert state_token_hash("abc") != state_token_hash("abd")
+
+
+def test_state_token_hash_fits_bigint():
+    for token in ("", "x", "a" * 43, "ünïcode"):
+        value = state_token_hash(token)
+        assert -(2 ** 63) <= value < 2 ** 63
+
+
+@pytest.fixture
+def db(tmp_path):
+    """MCPDatabaseOperations over a fresh SQLite file with the MCP OAuth tables."""
+    url = f"sqlite:///{tmp_path / 'auth.db'}"
+    ops = MCPDatabaseOperations(url)
+    event.listen(
+        ops.engine, "connect",
+        lambda conn, _: conn.create_function("NOW", 0, lambda: datetime.now().isoformat(" ")),
+    )
+    with ops.engine.begin() as conn:
+        for statement in _SCHEMA:
+            conn.execute(text(statement))
+    yield ops
+    db_operations._engines.pop(url).dispose()
+
+
+def rows(db, table: str, columns: str = "*") -> list:
+    with db.engine.connect() as conn:
+        return conn.execute(text(f"SELECT {columns} FROM {table}")).fetchall()
+
+
+def new_session(db, expires_in_seconds: int = 300) -> str:
+    return db.create_auth_session("user", "github", "state", expires_in_seconds=expires_in_seconds)
+
+
+def complete(db, session_id: str) -> None:
+    db.complete_oauth_flow(
+        session_id=session_id, user_id="user", server_id="github",
+        access_token="token", expires_in=3600, scope="repo",
+    )
+
+
+def test_complete_oauth_flow_commits_all_writes(db):
+    session_id = new_session(db)
+
+    complete(db, session_id)
+
+    assert db.get_auth_session(session_id)["status"] == "completed"
+    assert db.get_oauth_token("user", "github")["access_token"] == "token"
+    assert rows(db, "mcp_user_connections", "user_id, server_id, status") == [("user", "github", "active")]
+
+
+def test_complete_oauth_flow_rolls_back_when_connection_upsert_fails(db):
+    session_id = new_session(db)
+    with db.engine.begin() as conn:
+        conn.execute(text("DROP TABLE mcp_user_connections"))
+
+    with pytest.raises(Exception, match="mcp_user_connections"):
+        complete(db, session_id)
+
+    assert db.get_auth_session(session_id)["status"] == "pending"
+    assert rows(db, "mcp_oauth_tokens") == []
+
+
+@pytest.mark.parametrize("expires_in_seconds,completed", [
+    pytest.param(-60, False, id="expired"),
+    pytest.param(300, True, id="already_completed"),
+])
+def test_complete_oauth_flow_rejects_closed_session(db, expires_in_seconds, completed):
+    session_id = new_session(db, expires_in_seconds=expires_in_seconds)
+    if completed:
+        complete(db, session_id)
+    status_before = db.get_auth_session(session_id)["status"]
+    tokens_before = rows(db, "mcp_oauth_tokens")
+
+    with pytest.raises(AuthSessionNotPendingError):
+        db.complete_oauth_flow(
+            session_id=session_id, user_id="user", server_id="github", access_token="replayed",
+        )
+
+    assert db.get_auth_session(session_id)["status"] == status_before
+    assert rows(db, "mcp_oauth_tokens") == tokens_before
+
+
+def test_get_auth_session_status_expires_overdue_pending_session(db):
+    session_id = new_session(db, expires_in_seconds=-60)
+
+    assert db.get_auth_session_status(session_id)["status"] == "expired"
+    # The flip is committed, not just reported
+    assert db.get_auth_session(session_id)["status"] == "expired"
+
+
+def test_get_auth_session_status_keeps_pending_session_in_time(db):
+    session_id = new_session(db)
+
+    assert db.get_auth_session_status(session_id)["status"] == "pending"
+
+
+def test_get_auth_session_status_returns_terminal_session_unchanged(db):
+    session_id = new_session(db)
+    complete(db, session_id)
+    # Past its expiry now, but completed sessions are never flipped to expired
+    with db.engine.begin() as conn:
+        conn.execute(
+            text("UPDATE mcp_auth_sessions SET expires_at = :past WHERE session_id = :sid"),
+            {"past": datetime(2000, 1, 1), "sid": session_id},
+        )
+
+    session = db.get_auth_session_status(session_id)
+
+    assert session["status"] == "completed"
+    assert session["completed_at"] is not None
+
+
+def test_get_auth_session_status_unknown_session(db):
+    assert db.get_auth_session_status("missing") is None
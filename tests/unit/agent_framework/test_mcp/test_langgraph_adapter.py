@@ -3,11 +3,19 @@
 import pytest
 from pydantic import BaseModel, Field
 from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.agent_framework.mcp.adapters.langgraph import _create_args_schema, to_langgraph_tool
+from src.agent_framework.mcp.adapters.langgraph import _create_args_schema, clear_schema_cache, to_langgraph_tool
 from src.agent_framework.mcp.models import MCPServerConfig, MCPToolInfo, MCPTransport
 
 
+@pytest.fixture(autouse=True)
+def reset_schema_cache():
+    clear_schema_cache()
+    yield
+    clear_schema_cache()
+
+
 class TestCreateArgsSchema:
     """Test dynamic Pydantic model generation from MCP tool schemas."""
 
@@ -97,6 +105,21 @@ class TestCreateArgsSchema:
         assert schema_class.model_fields["tags"].annotation == Optional[list]
         assert schema_class.model_fields["metadata"].annotation == Optional[dict]
 
+    def test_union_type_list_falls_back_to_string(self):
+        """JSON Schema type lists (e.g. nullable unions) fall back to Optional[str]."""
+        tool_info = MCPToolInfo(
+            name="test_tool",
+            description="Test tool",
+            input_schema={
+                "type": "object",
+                "properties": {"cursor": {"type": ["string", "null"]}},
+            }
+        )
+
+        schema_class = _create_args_schema(tool_info)
+
+        assert schema_class.model_fields["cursor"].annotation == Optional[str]
+
     def test_treats_all_as_required_when_no_required_list(self):
         """Test that all properties are required when 'required' array is missing."""
         tool_info = MCPToolInfo(
@@ -128,8 +151,10 @@ class TestCreateArgsSchema:
 
         schema_class = _create_args_schema(tool_info)
 
-        # Should create model that accepts extra fields
+        # Should create a named model with no fields; extras are ignored
         assert schema_class.__name__ == "test_tool_Args"
+        assert schema_class.model_fields == {}
+        assert schema_class(limit=5).model_dump() == {}
 
     def test_creates_generic_schema_when_empty(self):
         """Test fallback when input_schema has no properties."""
@@ -200,6 +225,19 @@ class TestCreateArgsSchema:
         assert schema2.__name__ == "tool2_Args"
         assert schema1 is not schema2
 
+    def test_reuses_schema_for_identical_tool(self):
+        """Same name and input schema return the cached class; a changed schema rebuilds."""
+        schema = {"type": "object", "properties": {"sql": {"type": "string"}}}
+        first = _create_args_schema(MCPToolInfo(name="query", input_schema=schema))
+        again = _create_args_schema(MCPToolInfo(name="query", input_schema=dict(reversed(schema.items()))))
+        changed = _create_args_schema(
+            MCPToolInfo(name="query", input_schema={"type": "object", "properties": {"sql": {"type": "integer"}}})
+        )
+
+        assert again is first
+        assert changed is not first
+        assert changed.model_fields["sql"].annotation == Optional[int]
+
 
 class TestToLanggraphTool:
     """Test conversion of MCP tool to LangGraph StructuredTool."""
@@ -266,7 +304,6 @@ class TestToLanggraphTool:
         # Name should match exactly
         assert tool.name == "my_custom_tool"
 
-    @pytest.mark.asyncio
     async def test_tool_function_is_async(self, server_config):
         """Test that created tool has async coroutine."""
         tool_info = MCPToolInfo(
@@ -280,3 +317,26 @@ class TestToLanggraphTool:
         # Should have coroutine
         assert tool.coroutine is not None
         assert callable(tool.coroutine)
+
+    @pytest.mark.parametrize("input_schema,tool_input,forwarded", [
+        ({}, {"limit": 5}, {}),
+        (
+            {"type": "object", "properties": {"sql": {"type": "string"}}},
+            {"sql": "SELECT 1", "limit": 5},
+            {"sql": "SELECT 1"},
+        ),
+    ], ids=["no_properties", "declared_properties"])
+    async def test_only_declared_arguments_reach_mcp_server(
+        self, server_config, input_schema, tool_input, forwarded
+    ):
+        """Test that arguments outside the tool's input schema are not sent to the server."""
+        tool_info = MCPToolInfo(name="query", description="Query", input_schema=input_schema)
+        client = MagicMock()
+        client.call_tool = AsyncMock(return_value="ok")
+
+        with patch("src.agent_framework.mcp.client_manager.MCPClientManager.get_instance") as get_instance:
+            get_instance.return_value.get_client.return_value = client
+            result = await to_langgraph_tool(tool_info, server_config).ainvoke(tool_input)
+
+        assert result == "ok"
+        client.call_tool.assert_awaited_once_with("query", arguments=forwarded)
@@ -9,6 +9,7 @@ import pytest
 import yaml
 
 from src.agent_framework.mcp.models import MCPTransport
+from src.agent_framework.mcp import registry as registry_module
 from src.agent_framework.mcp.registry import MCPServerRegistry
 
 
@@ -140,3 +141,80 @@ def test_registry_nonexistent_path_empty():
     reg = MCPServerRegistry(config_path="/nonexistent/path/mcp.json")
     assert reg.list_server_ids() == []
     assert reg.get_server("any") is None
+
+
+def test_registry_precomputes_api_dicts(tmp_path):
+    config_file = tmp_path / ".mcp.settings.json"
+    config_file.write_text(
+        json.dumps({
+            "servers": {
+                "local_fs": {"transport": "stdio", "command": ["echo"]},
+                "github": {
+                    "transport": "sse",
+                    "url": "https://mcp.github.com/sse",
+                    "description": "GitHub tools",
+                    "auth": {"type": "oauth", "client_id_env": "GITHUB_CLIENT_ID", "client_secret_env": "GITHUB_CLIENT_SECRET"},
+                },
+            }
+        }),
+        encoding="utf-8",
+    )
+    reg = MCPServerRegistry(config_path=str(config_file))
+    fs = reg.get_server_api_dict("local_fs")
+    assert fs["name"] == "Local Fs"
+    assert fs["description"] == "local_fs MCP server"
+    assert fs["requires_auth"] is False
+    gh = reg.get_server_api_dict("github")
+    assert gh["description"] == "GitHub tools"
+    assert gh["requires_auth"] is True
+    assert [d["id"] for d in reg.list_server_api_dicts()] == ["local_fs", "github"]
+    assert reg.get_server_api_dict("missing") is None
+
+
+def test_registry_reuses_parse_for_identical_content(tmp_path, monkeypatch):
+    MCPServerRegistry.clear_parse_cache()
+    content = json.dumps({"servers": {"fs": {"command": "npx", "args": ["${MCP_TEST_ROOT}"]}}})
+    first = tmp_path / "a.json"
+    second = tmp_path / "b.json"
+    first.write_text(content, encoding="utf-8")
+    second.write_text(content, encoding="utf-8")
+
+    monkeypatch.setenv("MCP_TEST_ROOT", "/one")
+    MCPServerRegistry(config_path=str(first))
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("identical content should not be re-parsed")
+
+    monkeypatch.setattr(registry_module, "_json_loads", fail_parse)
+    monkeypatch.setenv("MCP_TEST_ROOT", "/two")
+    reg = MCPServerRegistry(config_path=str(second))
+
+    # Env vars are still resolved per load, not taken from the cached parse
+    assert reg.get_server("fs").command == ["npx", "/two"]
+    MCPServerRegistry.clear_parse_cache()
+
+
+def test_registry_skips_validation_for_identical_entries(tmp_path, monkeypatch):
+    MCPServerRegistry.clear_parse_cache()
+    config_file = tmp_path / "servers.json"
+    config_file.write_text(
+        json.dumps({"servers": {"fs": {"command": "npx", "args": ["${MCP_TEST_ROOT}"]}}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("MCP_TEST_ROOT", "/one")
+    first = MCPServerRegistry(config_path=str(config_file))
+
+    class FailingAdapter:
+        def validate_python(self, *args, **kwargs):
+            raise AssertionError("identical entries should not be re-validated")
+
+    with monkeypatch.context() as m:
+        m.setattr(registry_module, "MCP_SERVER_CONFIGS_ADAPTER", FailingAdapter())
+        again = MCPServerRegistry(config_path=str(config_file))
+    assert again.get_server("fs") is first.get_server("fs")
+
+    # A different env value changes the normalized entries, so they are validated again
+    monkeypatch.setenv("MCP_TEST_ROOT", "/two")
+    changed = MCPServerRegistry(config_path=str(config_file))
+    assert changed.get_server("fs").command == ["npx", "/two"]
+    MCPServerRegistry.clear_parse_cache()
@@ -1,6 +1,8 @@
 """Unit tests for STDIO MCP client."""
 
 import asyncio
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
@@ -12,19 +14,19 @@ from src.agent_framework.mcp.models import MCPServerConfig, MCPTransport
 pytestmark = pytest.mark.skip(reason="STDIO client tests need implementation updates to match actual client behavior")
 
 
+@pytest.fixture(scope="module")
+def stdio_config():
+    """Basic STDIO config shared by the module (tests only read it)."""
+    return MCPServerConfig(
+        id="test_server",
+        transport=MCPTransport.STDIO,
+        command=["echo", "test"],
+    )
+
+
 class TestStdioClientEventLoopHandling:
     """Test event loop detection and reconnection."""
 
-    @pytest.fixture
-    def stdio_config(self):
-        """Create a basic STDIO config."""
-        return MCPServerConfig(
-            id="test_server",
-            transport=MCPTransport.STDIO,
-            command=["echo", "test"],
-        )
-
-    @pytest.mark.asyncio
     async def test_client_tracks_event_loop(self, stdio_config):
         """Test that client tracks which event loop created the connection."""
         client = StdioMCPClient(stdio_config)
@@ -47,7 +49,6 @@ class TestStdioClientEventLoopHandling:
             assert session2 is session1
             assert client._event_loop == loop1
 
-    @pytest.mark.asyncio
     async def test_client_reconnects_on_event_loop_change(self, stdio_config):
         """Test that client reconnects when event loop changes."""
         client = StdioMCPClient(stdio_config)
@@ -84,7 +85,6 @@ class TestStdioClientEventLoopHandling:
             loop1.close()
             loop2.close()
 
-    @pytest.mark.asyncio
     async def test_client_handles_already_connected_same_loop(self, stdio_config):
         """Test that client reuses session in same event loop."""
         client = StdioMCPClient(stdio_config)
@@ -114,7 +114,6 @@ class TestStdioClientConnection:
             command=["npx", "-y", "@modelcontextprotocol/server-memory"],
         )
 
-    @pytest.mark.asyncio
     async def test_connect_initializes_session(self, stdio_config):
         """Test that _connect creates and initializes session."""
         client = StdioMCPClient(stdio_config)
@@ -136,7 +135,6 @@ class TestStdioClientConnection:
                 mock_session.initialize.assert_called_once()
                 assert session == mock_session
 
-    @pytest.mark.asyncio
     async def test_close_cleans_up_session(self, stdio_config):
         """Test that close properly cleans up the session."""
         client = StdioMCPClient(stdio_config)
@@ -153,70 +151,65 @@ class TestStdioClientConnection:
         assert client._is_connected is False
 
 
+class FakeSession:
+    """ClientSession stand-in: records call_tool calls and returns (or raises) a fixed result."""
+
+    def __init__(self, result=None, error=None):
+        self.calls = []
+        self._result = result
+        self._error = error
+
+    async def initialize(self):
+        pass
+
+    async def call_tool(self, name, arguments=None):
+        self.calls.append((name, arguments))
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
 class TestStdioClientToolExecution:
     """Test tool execution via STDIO client."""
 
-    @pytest.fixture
-    def stdio_config(self):
-        """Create a basic STDIO config."""
-        return MCPServerConfig(
-            id="test_server",
-            transport=MCPTransport.STDIO,
-            command=["echo", "test"],
-        )
-
-    @pytest.mark.asyncio
     async def test_call_tool_success(self, stdio_config):
         """Test successful tool execution."""
         client = StdioMCPClient(stdio_config)
 
-        # Mock session with call_tool
-        mock_result = Mock()
-        mock_result.content = [Mock(text="Success")]
-        mock_session = AsyncMock()
-        mock_session.call_tool = AsyncMock(return_value=mock_result)
+        session = FakeSession(result=SimpleNamespace(content=[SimpleNamespace(text="Success")]))
 
-        with patch.object(client, '_ensure_connected', return_value=mock_session):
+        with patch.object(client, '_ensure_connected', return_value=session):
             result = await client.call_tool("test_tool", {"param": "value"})
 
             # Should call the tool and return result
-            mock_session.call_tool.assert_called_once_with(
-                "test_tool",
-                arguments={"param": "value"}
-            )
+            assert session.calls == [("test_tool", {"param": "value"})]
             assert result == "Success"
 
-    @pytest.mark.asyncio
     async def test_call_tool_with_list_content(self, stdio_config):
         """Test tool execution that returns list content."""
         client = StdioMCPClient(stdio_config)
 
-        # Mock session with multiple content parts
-        mock_result = Mock()
-        mock_result.content = [
-            Mock(text="Part 1"),
-            Mock(text="Part 2"),
-        ]
-        mock_session = AsyncMock()
-        mock_session.call_tool = AsyncMock(return_value=mock_result)
+        # Session result with multiple content parts
+        session = FakeSession(result=SimpleNamespace(content=[
+            SimpleNamespace(text="Part 1"),
+            SimpleNamespace(text="Part 2"),
+        ]))
 
-        with patch.object(client, '_ensure_connected', return_value=mock_session):
+        with patch.object(client, '_ensure_connected', return_value=session):
             result = await client.call_tool("test_tool", {})
 
             # Should concatenate content parts
             assert "Part 1" in result
             assert "Part 2" in result
 
-    @pytest.mark.asyncio
     async def test_call_tool_handles_errors(self, stdio_config):
         """Test that tool execution errors are propagated."""
         client = StdioMCPClient(stdio_config)
 
-        # Mock session that raises error
-        mock_session = AsyncMock()
-        mock_session.call_tool = AsyncMock(side_effect=Exception("Tool execution failed"))
+        # Session that raises error
+        session = FakeSession(error=Exception("Tool execution failed"))
 
-        with patch.object(client, '_ensure_connected', return_value=mock_session):
+        with patch.object(client, '_ensure_connected', return_value=session):
             with pytest.raises(Exception, match="Tool execution failed"):
                 await client.call_tool("test_tool", {})
 
@@ -224,16 +217,6 @@ class TestStdioClientToolExecution:
 class TestStdioClientListTools:
     """Test tool listing via STDIO client."""
 
-    @pytest.fixture
-    def stdio_config(self):
-        """Create a basic STDIO config."""
-        return MCPServerConfig(
-            id="test_server",
-            transport=MCPTransport.STDIO,
-            command=["echo", "test"],
-        )
-
-    @pytest.mark.asyncio
     async def test_list_tools_returns_tools(self, stdio_config):
         """Test that list_tools returns tool list."""
         client = StdioMCPClient(stdio_config)
@@ -265,7 +248,6 @@ class TestStdioClientListTools:
             assert tools[1].name == "tool2"
             assert tools[1].input_schema == {"type": "object", "properties": {"param": {"type": "string"}}}
 
-    @pytest.mark.asyncio
     async def test_list_tools_empty_result(self, stdio_config):
         """Test that list_tools handles empty tool list."""
         client = StdioMCPClient(stdio_config)
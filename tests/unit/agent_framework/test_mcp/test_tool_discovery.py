@@ -2,24 +2,33 @@
 
 import pytest
 
+from src.agent_framework.mcp.client_manager import MCPClientManager
 from src.agent_framework.mcp.models import MCPServerConfig, MCPToolInfo, MCPTransport
-from src.agent_framework.mcp.tool_discovery import MCPToolDiscovery
+from src.agent_framework.mcp.tool_discovery import MCPToolDiscovery, clear_tool_cache
 
 
-@pytest.fixture
-def mock_client():
+@pytest.fixture(autouse=True)
+def reset_tool_cache():
+    clear_tool_cache()
+    yield
+    clear_tool_cache()
+
+
+class MockClient:
     """Fake client that returns fixed tools without connecting."""
 
-    class MockClient:
-        def __init__(self, tools: list):
-            self._tools = tools
+    def __init__(self, tools: list):
+        self._tools = tools
+
+    async def list_tools(self):
+        return self._tools
 
-        async def list_tools(self):
-            return self._tools
+    async def call_tool(self, name: str, arguments: dict | None = None):
+        return {"result": "ok"}
 
-        async def call_tool(self, name: str, arguments: dict | None = None):
-            return {"result": "ok"}
 
+@pytest.fixture(scope="module")
+def mock_client():
     return MockClient(
         [
             MCPToolInfo(name="read_file", description="Read a file", input_schema={"type": "object"}),
@@ -29,50 +38,62 @@ def mock_client():
     )
 
 
-@pytest.mark.asyncio
-async def test_discover_tools_returns_all_when_no_filter(mock_client, monkeypatch):
-    """When server_config.tools is None, all tools are returned."""
-    from src.agent_framework.mcp.client_manager import MCPClientManager
-
-    monkeypatch.setattr(
-        MCPClientManager,
-        "get_client",
-        lambda self, server_config: mock_client,
-    )
-    discovery = MCPToolDiscovery()
-    config = MCPServerConfig(
+@pytest.fixture(scope="module")
+def base_config():
+    """Filesystem server config shared by the module; variants use model_copy."""
+    return MCPServerConfig(
         id="fs",
         transport=MCPTransport.STDIO,
         command=["npx", "-y", "@modelcontextprotocol/server-filesystem"],
     )
-    tools = await discovery.discover_tools(config)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patch_mcp_client(mock_client):
+    """Route every MCPClientManager.get_client call in this module to mock_client."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(MCPClientManager, "get_client", lambda self, server_config: mock_client)
+        yield
+
+
+async def test_discover_tools_returns_all_when_no_filter(base_config):
+    """When server_config.tools is None, all tools are returned."""
+    discovery = MCPToolDiscovery()
+    tools = await discovery.discover_tools(base_config)
     assert len(tools) == 3
-    names = [t.name for t in tools]
-    assert "read_file" in names
-    assert "write_file" in names
-    assert "list_dir" in names
+    assert {t.name for t in tools} == {"read_file", "write_file", "list_dir"}
 
 
-@pytest.mark.asyncio
-async def test_discover_tools_filters_by_name(mock_client, monkeypatch):
+async def test_discover_tools_filters_by_name(base_config):
     """When server_config.tools is set, only those tools are returned."""
-    from src.agent_framework.mcp.client_manager import MCPClientManager
-
-    monkeypatch.setattr(
-        MCPClientManager,
-        "get_client",
-        lambda self, server_config: mock_client,
-    )
     discovery = MCPToolDiscovery()
-    config = MCPServerConfig(
-        id="fs",
-        transport=MCPTransport.STDIO,
-        command=["npx", "-y", "@modelcontextprotocol/server-filesystem"],
-        tools=["read_file", "list_dir"],
-    )
+    config = base_config.model_copy(update={"tools": ["read_file", "list_dir"]})
     tools = await discovery.discover_tools(config)
     assert len(tools) == 2
-    names = [t.name for t in tools]
-    assert "read_file" in names
-    assert "list_dir" in names
-    assert "write_file" not in names
+    assert {t.name for t in tools} == {"read_file", "list_dir"}
+
+
+async def test_discover_tools_caches_tool_list(mock_client, base_config, monkeypatch):
+    """A second discovery for the same server config skips list_tools()."""
+    calls = 0
+    original_list_tools = mock_client.list_tools
+
+    async def counting_list_tools():
+        nonlocal calls
+        calls += 1
+        return await original_list_tools()
+
+    # The client is shared by the module, so patch it per test
+    monkeypatch.setattr(mock_client, "list_tools", counting_list_tools)
+    discovery = MCPToolDiscovery()
+    filtered = base_config.model_copy(update={"tools": ["read_file"]})
+
+    assert len(await discovery.discover_tools(base_config)) == 3
+    # Same server, different name filter: served from the cache
+    assert [t.name for t in await discovery.discover_tools(filtered)] == ["read_file"]
+    assert calls == 1
+
+    # A different command is a different server identity
+    other = base_config.model_copy(update={"command": ["node", "server.js"]})
+    await discovery.discover_tools(other)
+    assert calls == 2
@@ -1,12 +1,22 @@
 """Unit tests for automatic tool documentation generation."""
 
+from dataclasses import dataclass
+
 import pytest
-from unittest.mock import Mock
 
 from src.agent_framework.prompts.tool_documentation import PromptBuilder
 from src.agent_framework.mcp.models import MCPToolInfo
 
 
+@dataclass(slots=True)
+class _FakeTool:
+    """Plain tool stand-in: only the attributes PromptBuilder reads."""
+
+    name: str
+    description: str | None = None
+    mcp_tool_info: MCPToolInfo | None = None
+
+
 class TestPromptBuilderBasic:
     """Test basic PromptBuilder functionality."""
 
@@ -28,10 +38,7 @@ class TestPromptBuilderBasic:
         """Test that tools are documented in the prompt."""
         base_instruction = "You are a helpful assistant."
 
-        # Mock tool
-        mock_tool = Mock()
-        mock_tool.name = "test_tool"
-        mock_tool.description = "A test tool"
+        mock_tool = _FakeTool("test_tool", "A test tool")
 
         tools = [mock_tool]
 
@@ -75,10 +82,7 @@ class TestMCPToolDocumentation:
             }
         )
 
-        mock_tool = Mock()
-        mock_tool.name = "search"
-        mock_tool.description = "Search for items"
-        mock_tool.mcp_tool_info = mcp_tool
+        mock_tool = _FakeTool("search", "Search for items", mcp_tool_info=mcp_tool)
 
         tools = [mock_tool]
 
@@ -108,10 +112,7 @@ class TestMCPToolDocumentation:
             }
         )
 
-        mock_tool = Mock()
-        mock_tool.name = "create_item"
-        mock_tool.description = "Create an item"
-        mock_tool.mcp_tool_info = mcp_tool
+        mock_tool = _FakeTool("create_item", "Create an item", mcp_tool_info=mcp_tool)
 
         tools = [mock_tool]
 
@@ -132,13 +133,8 @@ class TestMultipleTools:
         """Test that multiple tools are all documented."""
         base_instruction = "Assistant"
 
-        tool1 = Mock()
-        tool1.name = "tool1"
-        tool1.description = "First tool"
-
-        tool2 = Mock()
-        tool2.name = "tool2"
-        tool2.description = "Second tool"
+        tool1 = _FakeTool("tool1", "First tool")
+        tool2 = _FakeTool("tool2", "Second tool")
 
         tools = [tool1, tool2]
 
@@ -156,110 +152,55 @@ class TestMultipleTools:
 
     def test_preserves_tool_order(self):
         """Test that tools are documented in the order provided."""
-        base_instruction = "Assistant"
-
-        tools = []
-        for i in range(5):
-            tool = Mock()
-            tool.name = f"tool{i}"
-            tool.description = f"Tool number {i}"
-            tools.append(tool)
+        tools = [_FakeTool(f"tool{i}", f"Tool number {i}") for i in range(5)]
 
         result = PromptBuilder.build_system_prompt(
-            base_instruction=base_instruction,
+            base_instruction="Assistant",
             tools=tools,
             engine_type="adk"
         )
 
-        # All tools should be present
-        for i in range(5):
-            assert f"tool{i}" in result
+        positions = [result.index(f"### {tool.name}") for tool in tools]
+        assert positions == sorted(positions)
 
 
 class TestEngineTypeHandling:
     """Test handling of different engine types."""
 
-    def test_supports_adk_engine(self):
-        """Test that ADK engine type works."""
-        base_instruction = "Assistant"
-        tool = Mock()
-        tool.name = "test"
-        tool.description = "Test"
-
+    @pytest.fixture(scope="class")
+    def tool(self):
+        return _FakeTool("test", "Test")
+
+    @pytest.mark.parametrize("engine_type,base_instruction", [
+        ("adk", "Assistant"),
+        ("langgraph", "Assistant"),
+        ("adk", ""),  # empty base instruction
+    ])
+    def test_generates_documentation_for_engine(self, tool, engine_type, base_instruction):
+        """Both engine types, and an empty base instruction, still get tool documentation."""
         result = PromptBuilder.build_system_prompt(
             base_instruction=base_instruction,
             tools=[tool],
-            engine_type="adk"
+            engine_type=engine_type
         )
 
-        # Should generate documentation
         assert len(result) > len(base_instruction)
-
-    def test_supports_langgraph_engine(self):
-        """Test that LangGraph engine type works."""
-        base_instruction = "Assistant"
-        tool = Mock()
-        tool.name = "test"
-        tool.description = "Test"
-
-        result = PromptBuilder.build_system_prompt(
-            base_instruction=base_instruction,
-            tools=[tool],
-            engine_type="langgraph"
-        )
-
-        # Should generate documentation
-        assert len(result) > len(base_instruction)
-
-    def test_handles_empty_base_instruction(self):
-        """Test handling of empty base instruction."""
-        tool = Mock()
-        tool.name = "test"
-        tool.description = "Test"
-
-        result = PromptBuilder.build_system_prompt(
-            base_instruction="",
-            tools=[tool],
-            engine_type="adk"
-        )
-
-        # Should still generate tool documentation
-        assert "test" in result
+        assert "### test" in result
 
 
 class TestToolDescriptionFormats:
     """Test different tool description formats."""
 
-    def test_handles_tool_without_description(self):
-        """Test that tools without description are still documented."""
-        base_instruction = "Assistant"
-
-        tool = Mock()
-        tool.name = "unnamed_tool"
-        tool.description = None
-
+    @pytest.mark.parametrize("name,description", [
+        ("unnamed_tool", None),  # tools without description are still documented
+        ("complex_tool", "This is a very long description. " * 50),
+    ])
+    def test_documents_tool_name(self, name, description):
+        """Test that the tool name is documented whatever its description."""
         result = PromptBuilder.build_system_prompt(
-            base_instruction=base_instruction,
-            tools=[tool],
-            engine_type="adk"
-        )
-
-        # Should still include the tool
-        assert "unnamed_tool" in result
-
-    def test_handles_long_descriptions(self):
-        """Test that long tool descriptions are handled."""
-        base_instruction = "Assistant"
-
-        tool = Mock()
-        tool.name = "complex_tool"
-        tool.description = "This is a very long description. " * 50
-
-        result = PromptBuilder.build_system_prompt(
-            base_instruction=base_instruction,
-            tools=[tool],
+            base_instruction="Assistant",
+            tools=[_FakeTool(name, description)],
             engine_type="adk"
         )
 
-        # Should include the tool name
-        assert "complex_tool" in result
+        assert name in result
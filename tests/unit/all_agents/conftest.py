@@ -0,0 +1,67 @@
+"""Shared fixtures for the all_agents tests."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.service.models.base_models import AgentChatRequest
+from tests.conftest import build_agent
+
+
+@pytest.fixture(scope="session")
+def agents():
+    """Return agents by class, each built once per session.
+
+    Lets the per-agent modules and the cross-agent tests share instances;
+    tests that swap an agent's engine do so through monkeypatch.
+    """
+    built = {}
+
+    def get(agent_cls):
+        if agent_cls not in built:
+            built[agent_cls] = build_agent(agent_cls)
+        return built[agent_cls]
+
+    return get
+
+
+@pytest.fixture(scope="module")
+def base_request():
+    """Validated AgentChatRequest the per-test requests are copied from."""
+    return AgentChatRequest(
+        agent_name="test_agent",
+        user_id="test_user",
+        session_id="test_session",
+        query="",
+        features=[],
+    )
+
+
+@pytest.fixture
+def make_request(base_request):
+    """Build a request from ``base_request``, overriding only what the test varies.
+
+    ``model_copy`` skips validation, so pass already-built models (e.g.
+    ``Artifact``) rather than raw dicts for nested fields.
+    """
+
+    def make(query="", **overrides):
+        return base_request.model_copy(update={"query": query, **overrides})
+
+    return make
+
+
+@pytest.fixture
+def stub_engine(agent, mock_output, monkeypatch):
+    """Replace the module's shared ``agent`` engine with a stub for one test.
+
+    ``run()`` returns the module's ``mock_output`` fixture.
+    """
+    # chat() only logs engine_name() and awaits run(); anything else fails loudly
+    engine = SimpleNamespace(
+        run=AsyncMock(return_value=mock_output),
+        engine_name=agent.engine.engine_name,
+    )
+    monkeypatch.setattr(agent, "engine", engine)
+    return engine
@@ -1,15 +1,20 @@
 """Tests for DatabaseAgent."""
 
 import pytest
-from unittest.mock import Mock
 from src.all_agents.tool_pattern.main_agent import DatabaseAgent
-from src.service.models.base_models import AgentChatRequest, TextInput, TextOutput
+from src.service.models.base_models import TextInput, TextOutput
 
 
-@pytest.fixture
-def agent():
-    """Create a DatabaseAgent instance."""
-    return DatabaseAgent()
+@pytest.fixture(scope="module")
+def agent(agents):
+    """DatabaseAgent shared by the module; chat tests patch its engine per test."""
+    return agents(DatabaseAgent)
+
+
+@pytest.fixture(scope="module")
+def mock_output():
+    """Output the stubbed engine returns to DatabaseAgent.chat()."""
+    return TextOutput(response="Tables: users, products, orders")
 
 
 def test_database_agent_initialization(agent):
@@ -26,37 +31,9 @@ def test_database_agent_has_tools(agent):
     assert isinstance(agent.agent_config.tools, list)
 
 
-def test_database_agent_input_schema(agent):
-    """Test that DatabaseAgent handles input schema correctly."""
-    request = AgentChatRequest(
-        agent_name="database",
-        user_id="test_user",
-        session_id="test_session",
-        query="What tables are available?",
-        features=[]
-    )
-    
-    input_data = agent._create_input_from_request(request)
-    assert isinstance(input_data, TextInput)
-    assert input_data.text == "What tables are available?"
-
-
-@pytest.mark.asyncio
-async def test_database_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_database_agent_chat(agent, stub_engine, make_request):
     """Test that DatabaseAgent chat() works with mocked LLM."""
-    # Mock the engine.run() method instead of runner
-    from unittest.mock import AsyncMock
-    mock_output = TextOutput(response="Tables: users, products, orders")
-    agent.engine = Mock()
-    agent.engine.run = AsyncMock(return_value=mock_output)
-    
-    request = AgentChatRequest(
-        agent_name="database_agent",
-        user_id="test_user",
-        session_id="test_session",
-        query="What tables are available?",
-        features=[]
-    )
+    request = make_request("What tables are available?", agent_name="database_agent")
     
     response = await agent.chat(request)
     
@@ -1,19 +1,28 @@
 """Tests for FileAnalysisAgent."""
 
 import pytest
-from unittest.mock import Mock
 from src.all_agents.file_analysis_agent.main_agent import (
     FileAnalysisAgent,
     FileAnalysisInput,
     FileAnalysisOutput
 )
-from src.service.models.base_models import AgentChatRequest, Artifact
+from src.service.models.base_models import Artifact
 
 
-@pytest.fixture
-def agent():
-    """Create a FileAnalysisAgent instance."""
-    return FileAnalysisAgent()
+@pytest.fixture(scope="module")
+def agent(agents):
+    """FileAnalysisAgent shared by the module; chat tests patch its engine per test."""
+    return agents(FileAnalysisAgent)
+
+
+@pytest.fixture(scope="module")
+def mock_output():
+    """Output the stubbed engine returns to FileAnalysisAgent.chat()."""
+    return FileAnalysisOutput(
+        summary="Patient shows signs of improvement",
+        key_findings=["Blood pressure normalized", "Cholesterol levels improved"],
+        recommendations=["Continue current medication", "Follow up in 3 months"]
+    )
 
 
 def test_file_analysis_agent_initialization(agent):
@@ -31,51 +40,25 @@ def test_file_analysis_agent_has_tools(agent):
     assert len(agent.agent_config.tools) > 0  # FileAnalysisAgent should have Azure artifact tool
 
 
-def test_file_analysis_agent_chat_without_artifacts(agent):
+async def test_file_analysis_agent_chat_without_artifacts(agent, make_request):
     """Test that FileAnalysisAgent returns error when no artifacts provided."""
-    request = AgentChatRequest(
-        agent_name="file_analysis_agent",
-        user_id="test_user",
-        session_id="test_session",
-        query="",
-        features=[],
-        artifacts=[]  # No artifacts
-    )
+    request = make_request(agent_name="file_analysis_agent", artifacts=[])
     
-    # This should return an error response synchronously
-    import asyncio
-    response = asyncio.run(agent.chat(request))
+    # This should return an error response without reaching the engine
+    response = await agent.chat(request)
     
     assert response.success is False
     assert "No artifacts" in response.agent_response or "artifacts" in str(response.agent_response).lower()
 
 
-@pytest.mark.asyncio
-async def test_file_analysis_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_file_analysis_agent_chat(agent, stub_engine, make_request):
     """Test that FileAnalysisAgent chat() works with mocked LLM."""
-    # Mock the engine.run() method instead of runner
-    from unittest.mock import AsyncMock
-    mock_output = FileAnalysisOutput(
-        summary="Patient shows signs of improvement",
-        key_findings=["Blood pressure normalized", "Cholesterol levels improved"],
-        recommendations=["Continue current medication", "Follow up in 3 months"]
-    )
-    agent.engine = Mock()
-    agent.engine.run = AsyncMock(return_value=mock_output)
-    
-    request = AgentChatRequest(
-        agent_name="file_analysis_agent",
-        user_id="test_user",
-        session_id="test_session",
-        query="",
-        features=[],
-        artifacts=[
-            Artifact(
-                artifact_name="report.pdf",
-                artifact_path="medical-reports/test-report.pdf"
-            )
-        ]
-    )
+    request = make_request(agent_name="file_analysis_agent", artifacts=[
+        Artifact(
+            artifact_name="report.pdf",
+            artifact_path="medical-reports/test-report.pdf"
+        )
+    ])
     
     response = await agent.chat(request)
     
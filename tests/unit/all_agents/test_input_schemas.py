@@ -0,0 +1,32 @@
+"""Input-schema mapping tests shared across agents."""
+
+import pytest
+from src.all_agents.orchestrator_pattern.main_agent import TripPlannerAgent, TripPlannerInput
+from src.all_agents.single_agent_pattern.main_agent import TranslationAgent, TranslationInput
+from src.all_agents.tool_pattern.main_agent import DatabaseAgent
+from src.service.models.base_models import TextInput
+
+
+@pytest.mark.parametrize("agent_cls,query,expected", [
+    (
+        TranslationAgent,
+        {"text": "Hello, how are you?", "from_language": "en", "to_language": "es"},
+        TranslationInput(text="Hello, how are you?", from_language="en", to_language="es"),
+    ),
+    (
+        TripPlannerAgent,
+        {"source": "New York", "destination": "Paris"},
+        TripPlannerInput(source="New York", destination="Paris"),
+    ),
+    (
+        DatabaseAgent,
+        "What tables are available?",
+        TextInput(text="What tables are available?"),
+    ),
+], ids=["translation", "trip_planner", "database"])
+def test_agent_input_schema(agents, make_request, agent_cls, query, expected):
+    """Test that each agent maps the request query onto its input schema."""
+    input_data = agents(agent_cls)._create_input_from_request(make_request(query))
+
+    assert type(input_data) is type(expected)
+    assert input_data.model_dump() == expected.model_dump()
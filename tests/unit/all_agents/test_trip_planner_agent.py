@@ -1,15 +1,23 @@
 """Tests for TripPlannerAgent."""
 
 import pytest
-from unittest.mock import Mock
 from src.all_agents.orchestrator_pattern.main_agent import TripPlannerAgent, TripPlannerInput, TripPlannerOutput
-from src.service.models.base_models import AgentChatRequest
 
 
-@pytest.fixture
-def agent():
-    """Create a TripPlannerAgent instance."""
-    return TripPlannerAgent()
+@pytest.fixture(scope="module")
+def agent(agents):
+    """TripPlannerAgent shared by the module; chat tests patch its engine per test."""
+    return agents(TripPlannerAgent)
+
+
+@pytest.fixture(scope="module")
+def mock_output():
+    """Output the stubbed engine returns to TripPlannerAgent.chat()."""
+    return TripPlannerOutput(
+        flight_plan="Flight from NYC to Paris",
+        hotel_plan="Hotel in Paris city center",
+        summary="Complete trip plan for NYC to Paris"
+    )
 
 
 def test_trip_planner_agent_initialization(agent):
@@ -27,48 +35,12 @@ def test_trip_planner_agent_has_tools(agent):
     assert len(agent.agent_config.tools) > 0  # TripPlannerAgent should have flight, hotel, and summary agents as tools
 
 
-def test_trip_planner_agent_input_schema(agent):
-    """Test that TripPlannerAgent handles input schema correctly."""
-    request = AgentChatRequest(
-        agent_name="trip_planner",
-        user_id="test_user",
-        session_id="test_session",
-        query={
-            "source": "New York",
-            "destination": "Paris"
-        },
-        features=[]
-    )
-    
-    input_data = agent._create_input_from_request(request)
-    assert isinstance(input_data, TripPlannerInput)
-    assert input_data.source == "New York"
-    assert input_data.destination == "Paris"
-
-
-@pytest.mark.asyncio
-async def test_trip_planner_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_trip_planner_agent_chat(agent, stub_engine, make_request):
     """Test that TripPlannerAgent chat() works with mocked LLM."""
-    # Mock the engine.run() method instead of runner
-    from unittest.mock import AsyncMock
-    mock_output = TripPlannerOutput(
-        flight_plan="Flight from NYC to Paris",
-        hotel_plan="Hotel in Paris city center",
-        summary="Complete trip plan for NYC to Paris"
-    )
-    agent.engine = Mock()
-    agent.engine.run = AsyncMock(return_value=mock_output)
-    
-    request = AgentChatRequest(
-        agent_name="trip_planner_agent",
-        user_id="test_user",
-        session_id="test_session",
-        query={
-            "source": "New York",
-            "destination": "Paris"
-        },
-        features=[]
-    )
+    request = make_request({
+        "source": "New York",
+        "destination": "Paris"
+    }, agent_name="trip_planner_agent")
     
     response = await agent.chat(request)
     
@@ -0,0 +1,86 @@
+"""Tests for ETag / Cache-Control handling on the /mcp/catalog endpoints."""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from src.service.routes import mcp_auth
+
+
+def fake_registry(*servers):
+    """Stand-in registry serving ``servers`` (API dicts keyed by ``id``)."""
+    by_id = {server["id"]: server for server in servers}
+    return SimpleNamespace(
+        list_server_api_dicts=lambda: list(by_id.values()),
+        get_server_api_dict=by_id.get,
+    )
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Swap the catalog's registry; set ``.current`` to simulate a reload."""
+    holder = SimpleNamespace(current=fake_registry({"id": "github", "name": "GitHub"}))
+    monkeypatch.setattr(mcp_auth, "get_registry", lambda: holder.current)
+    return holder
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client():
+    """In-process ASGI client for the service app."""
+    from src.service.main import app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.parametrize("path", ["/mcp/catalog", "/mcp/catalog/github"])
+async def test_catalog_served_with_etag_and_cache_control(client, registry, path):
+    response = await client.get(path)
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == mcp_auth.CATALOG_CACHE_CONTROL
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "W/{etag}",
+    '"stale", {etag}',
+    "*",
+])
+async def test_catalog_not_modified_when_etag_matches(client, registry, if_none_match):
+    etag = (await client.get("/mcp/catalog")).headers["etag"]
+
+    response = await client.get(
+        "/mcp/catalog", headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+async def test_catalog_resent_after_registry_reload(client, registry):
+    etag = (await client.get("/mcp/catalog")).headers["etag"]
+
+    registry.current = fake_registry({"id": "github", "name": "GitHub Enterprise"})
+    response = await client.get("/mcp/catalog", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json() == [{"id": "github", "name": "GitHub Enterprise"}]
+
+
+@pytest.mark.parametrize("if_none_match,matches", [
+    (None, False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"x", W/"abc"', True),
+    (" * ", True),
+    ('"abcd"', False),
+    ('"x", "y"', False),
+])
+def test_etag_matches(if_none_match, matches):
+    assert mcp_auth._etag_matches(if_none_match, '"abc"') is matches
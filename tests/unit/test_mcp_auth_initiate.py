@@ -0,0 +1,108 @@
+"""Tests for building the authorization URL in /mcp/auth/initiate."""
+
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from src.agent_framework.mcp.models import MCPAuthConfig, MCPAuthType, MCPServerConfig, MCPTransport
+from src.agent_framework.mcp.registry import MCPServerRegistry
+from src.service.routes import mcp_auth
+
+
+def github_server(**auth_overrides) -> MCPServerConfig:
+    auth = {
+        "type": MCPAuthType.OAUTH,
+        "client_id_env": "GITHUB_CLIENT_ID",
+        "client_secret_env": "GITHUB_CLIENT_SECRET",
+        "authorize_url": "https://github.com/login/oauth/authorize",
+        "scopes": ["repo"],
+        **auth_overrides,
+    }
+    return MCPServerConfig(
+        id="github", transport=MCPTransport.SSE, url="https://mcp.github.com/sse",
+        auth=MCPAuthConfig(**auth),
+    )
+
+
+@pytest.fixture
+def reload_registry(monkeypatch):
+    """Install a stand-in registry instance serving the given server, as a reload would."""
+
+    def reload(server: MCPServerConfig) -> None:
+        monkeypatch.setattr(
+            MCPServerRegistry, "_instance", SimpleNamespace(get_server=lambda _id: server)
+        )
+
+    reload(github_server())
+    return reload
+
+
+@pytest.fixture(autouse=True)
+def oauth_env(monkeypatch):
+    monkeypatch.setenv("GITHUB_CLIENT_ID", "client-a")
+    monkeypatch.setenv("GITHUB_CLIENT_SECRET", "secret")
+    monkeypatch.setattr(mcp_auth, "_auth_url_prefixes", {})
+    monkeypatch.setattr(mcp_auth, "_credentials_cache", {})
+    monkeypatch.setattr(mcp_auth, "_oauth_cache_registry", None)
+    monkeypatch.setattr(
+        mcp_auth, "get_db", lambda: SimpleNamespace(create_auth_session=lambda **_: "session-1")
+    )
+    yield
+    # get_callback_url may have cached a URL built from this test's environment
+    mcp_auth.get_callback_url.cache_clear()
+
+
+async def initiate() -> tuple[str, dict]:
+    """Start a flow with the server's default scopes; return (URL up to '?', query)."""
+    response = await mcp_auth.initiate_oauth(
+        mcp_auth.InitiateOAuthRequest(user_id="user", server_id="github")
+    )
+    url = urlsplit(response.auth_url)
+    return f"{url.scheme}://{url.netloc}{url.path}", parse_qs(url.query)
+
+
+async def test_default_scope_url_reused_across_requests(reload_registry):
+    first_base, first = await initiate()
+    second_base, second = await initiate()
+
+    assert (first_base, first["client_id"], first["scope"]) == (second_base, second["client_id"], second["scope"])
+    assert first["state"] != second["state"]
+    assert len(mcp_auth._auth_url_prefixes) == 1
+
+
+async def test_reloaded_server_config_rebuilds_url(reload_registry):
+    await initiate()
+
+    reload_registry(github_server(
+        authorize_url="https://github.example.com/login/oauth/authorize",
+        scopes=["repo", "read:org"],
+    ))
+    base, query = await initiate()
+
+    assert base == "https://github.example.com/login/oauth/authorize"
+    assert query["scope"] == ["repo read:org"]
+
+
+async def test_rotated_client_id_picked_up_after_clear(reload_registry, monkeypatch):
+    _, before = await initiate()
+    monkeypatch.setenv("GITHUB_CLIENT_ID", "client-b")
+
+    _, cached = await initiate()
+    mcp_auth.clear_oauth_caches()
+    _, after = await initiate()
+
+    assert before["client_id"] == cached["client_id"] == ["client-a"]
+    assert after["client_id"] == ["client-b"]
+
+
+async def test_registry_reload_rereads_oauth_environment(reload_registry, monkeypatch):
+    await initiate()
+    monkeypatch.setenv("GITHUB_CLIENT_ID", "client-b")
+    monkeypatch.setenv("OAUTH_CALLBACK_BASE_URL", "https://agents.example.com")
+
+    reload_registry(github_server())
+    _, query = await initiate()
+
+    assert query["client_id"] == ["client-b"]
+    assert query["redirect_uri"] == ["https://agents.example.com/mcp/auth/callback"]
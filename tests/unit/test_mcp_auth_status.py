@@ -0,0 +1,93 @@
+"""Tests for long polling on /mcp/auth/status."""
+
+import asyncio
+
+import pytest
+
+from src.service.routes import mcp_auth
+
+SESSION_ID = "oauth-session"
+
+
+class FakeAuthDb:
+    """A single auth session row; ``on_read`` runs after each read takes its snapshot."""
+
+    def __init__(self):
+        self.status = "pending"
+        self.on_read = None
+
+    def get_auth_session_status(self, session_id):
+        row = {"status": self.status, "server_id": "github", "completed_at": None}
+        if self.on_read is not None:
+            self.on_read()
+        return row
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = FakeAuthDb()
+    monkeypatch.setattr(mcp_auth, "get_db", lambda: fake)
+    yield fake
+    assert mcp_auth._session_events == {}
+    assert mcp_auth._session_waiter_counts == {}
+
+
+def complete(db):
+    """What oauth_callback does once the token is stored."""
+    db.status = "completed"
+    mcp_auth._notify_session_waiters(SESSION_ID)
+
+
+async def test_callback_during_first_read_wakes_waiter(db):
+    loop = asyncio.get_running_loop()
+
+    def callback_lands_mid_read():
+        # The read runs on a worker thread; the callback runs on the loop before it returns
+        db.on_read = None
+        loop.call_soon_threadsafe(complete, db)
+
+    db.on_read = callback_lands_mid_read
+
+    async with asyncio.timeout(5):
+        status = await mcp_auth.get_auth_status(SESSION_ID, wait=mcp_auth.MAX_STATUS_WAIT_SECONDS)
+
+    assert status.status == "completed"
+
+
+async def test_timed_out_waiter_leaves_other_waiters_wakeable(db):
+    long_wait = asyncio.create_task(
+        mcp_auth.get_auth_status(SESSION_ID, wait=mcp_auth.MAX_STATUS_WAIT_SECONDS)
+    )
+    # The handler validates ``wait`` as an int; a fraction keeps this test fast
+    timed_out = await mcp_auth.get_auth_status(SESSION_ID, wait=0.05)
+    assert timed_out.status == "pending"
+
+    complete(db)
+    async with asyncio.timeout(5):
+        status = await long_wait
+
+    assert status.status == "completed"
+
+
+async def test_callback_on_another_worker_seen_by_recheck(db, monkeypatch):
+    monkeypatch.setattr(mcp_auth, "STATUS_RECHECK_SECONDS", 0.05)
+    asyncio.get_running_loop().call_later(0.1, setattr, db, "status", "completed")
+
+    # The DB row changes but this worker's waiters are never notified
+    async with asyncio.timeout(5):
+        status = await mcp_auth.get_auth_status(SESSION_ID, wait=mcp_auth.MAX_STATUS_WAIT_SECONDS)
+
+    assert status.status == "completed"
+
+
+async def test_cancelled_waiter_is_unregistered(db):
+    task = asyncio.create_task(
+        mcp_auth.get_auth_status(SESSION_ID, wait=mcp_auth.MAX_STATUS_WAIT_SECONDS)
+    )
+    # Let the first read finish so the task is parked on the session's event
+    await asyncio.sleep(0.05)
+    assert not task.done()
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
@@ -1,6 +1,9 @@
 """Unit tests for memory optimizations."""
 
+import importlib.util
+import httpx
 import pytest
+import pytest_asyncio
 import sys
 from unittest.mock import patch, MagicMock
 
@@ -52,51 +55,39 @@ class TestLazyImports:
 class TestRemovedDependencies:
     """Test that removed dependencies are not imported."""
     
-    def test_google_cloud_aiplatform_not_imported(self):
-        """Test that google-cloud-aiplatform is not imported."""
-        # Try to import - should fail if not installed
+    @pytest.mark.parametrize("module_name", [
+        "google.cloud.aiplatform",
+        "google.cloud.bigtable",
+        "google.cloud.spanner",
+        "sqlalchemy_spanner",
+    ])
+    def test_removed_dependency_not_installed(self, module_name):
+        """Test that a removed dependency is not installed (skips if it still is)."""
         try:
-            import google.cloud.aiplatform
-            pytest.skip("google-cloud-aiplatform is still installed")
-        except ImportError:
-            pass  # Expected - should not be installed
-    
-    def test_google_cloud_bigtable_not_imported(self):
-        """Test that google-cloud-bigtable is not imported."""
-        try:
-            import google.cloud.bigtable
-            pytest.skip("google-cloud-bigtable is still installed")
-        except ImportError:
-            pass  # Expected - should not be installed
-    
-    def test_google_cloud_spanner_not_imported(self):
-        """Test that google-cloud-spanner is not imported."""
-        try:
-            import google.cloud.spanner
-            pytest.skip("google-cloud-spanner is still installed")
-        except ImportError:
-            pass  # Expected - should not be installed
-    
-    def test_sqlalchemy_spanner_not_imported(self):
-        """Test that sqlalchemy-spanner is not imported."""
-        try:
-            import sqlalchemy_spanner
-            pytest.skip("sqlalchemy-spanner is still installed")
-        except ImportError:
-            pass  # Expected - should not be installed
+            # Locates the module without executing it, though its parent packages get imported
+            spec = importlib.util.find_spec(module_name)
+        except ModuleNotFoundError:  # parent package (e.g. google.cloud) is absent
+            spec = None
+        if spec is not None:
+            pytest.skip(f"{module_name} is still installed")
+
+
+@pytest_asyncio.fixture(scope="module")
+async def client():
+    """In-process ASGI client for the service app, shared by the endpoint tests in this module."""
+    from src.service.main import app
+
+    # ASGITransport calls the app directly (no server thread) and skips lifespan startup
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
 
 
 class TestHealthEndpoint:
     """Test that health endpoint includes memory info."""
     
-    @pytest.mark.asyncio
-    async def test_health_endpoint_includes_memory(self):
+    async def test_health_endpoint_includes_memory(self, client):
         """Test that /health endpoint returns memory information."""
-        from fastapi.testclient import TestClient
-        from src.service.main import app
-        
-        client = TestClient(app)
-        response = client.get("/health")
+        response = await client.get("/health")
         
         assert response.status_code == 200
         data = response.json()